@@ -0,0 +1,87 @@
+"""
+Benchmark: LoggerMixin logger resolution.
+
+Startup: first logger access for N new classes. The legacy path configures
+a console and rotating file handler per class name; the current path
+returns a handler-less child of the configured CryptoFuturesBot logger.
+
+Steady state: self.logger accesses per second, legacy per-access
+get_logger lookup vs the per-class cached property.
+
+Usage:
+    python benchmarks/bench_logger_resolution.py [classes] [accesses]
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.append(BASE_DIR)
+
+from utils.logging_setup import LoggerMixin, get_logger, setup_logger  # noqa: E402
+
+
+class LegacyLoggerMixin:
+    """Previous LoggerMixin: f-string + get_logger on every access"""
+
+    @property
+    def logger(self) -> logging.Logger:
+        class_name = self.__class__.__name__
+        return get_logger(f"CryptoFuturesBot.{class_name}")
+
+
+def legacy_startup(count: int) -> float:
+    started = time.perf_counter()
+    for i in range(count):
+        setup_logger(f"BenchLegacy.Service{i}")
+    return time.perf_counter() - started
+
+
+def current_startup(count: int) -> float:
+    classes = [type(f"BenchService{i}", (LoggerMixin,), {}) for i in range(count)]
+    started = time.perf_counter()
+    for cls in classes:
+        cls().logger
+    return time.perf_counter() - started
+
+
+def access_rate(instance, accesses: int) -> float:
+    started = time.perf_counter()
+    for _ in range(accesses):
+        instance.logger
+    return accesses / (time.perf_counter() - started)
+
+
+def file_handlers() -> int:
+    loggers = [logging.getLogger(name) for name in logging.root.manager.loggerDict]
+    return sum(isinstance(h, logging.FileHandler) for logger in loggers for h in logger.handlers)
+
+
+def main(count: int = 200, accesses: int = 1000000) -> None:
+    os.chdir(tempfile.mkdtemp())
+    logging.disable(logging.INFO)  # keep "Logger initialized" lines out of the output
+
+    before = file_handlers()
+    legacy = legacy_startup(count)
+    legacy_files = file_handlers() - before
+    current = current_startup(count)
+    current_files = file_handlers() - before - legacy_files
+
+    print(f"startup, {count} classes")
+    print(f"  legacy  {legacy * 1e3:8.2f} ms  {legacy_files} file handlers")
+    print(f"  current {current * 1e3:8.2f} ms  {current_files} file handlers")
+
+    legacy_rate = access_rate(type("BenchLegacy", (LegacyLoggerMixin,), {})(), accesses)
+    current_rate = access_rate(type("BenchCurrent", (LoggerMixin,), {})(), accesses)
+    print(f"steady state, {accesses:,} accesses")
+    print(f"  legacy  {legacy_rate:12,.0f} accesses/s")
+    print(f"  current {current_rate:12,.0f} accesses/s  ({current_rate / legacy_rate:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 1000000)
@@ -0,0 +1,84 @@
+"""
+Benchmark: websocket frames decoded into market-data records per second.
+
+Compares the legacy path (json.loads + per-field float conversions) with
+each installed MessageDecoder backend. The speedup comes from the parser:
+the stdlib "json" backend runs at roughly the legacy rate, so gains need
+orjson or msgspec installed (pip install .[fast-json]).
+
+Usage:
+    python benchmarks/bench_message_decoding.py [messages]
+"""
+
+import json
+import os
+import random
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.append(BASE_DIR)
+
+from services.data_feed import MarketData, TradeData  # noqa: E402
+from services.message_decoder import MessageDecoder, available_backends  # noqa: E402
+
+
+def make_frames(count: int):
+    frames = []
+    for i in range(count):
+        price = 100 + random.random()
+        if i % 2:
+            frames.append(json.dumps({"type": "ticker", "symbol": f"SYM{i % 200}USDT", "price": str(price),
+                                      "volume": "1234.5", "change": "1.5", "changePercent": "0.8"}))
+        else:
+            frames.append(json.dumps({"type": "trade", "symbol": f"SYM{i % 200}USDT", "price": price,
+                                      "quantity": "0.25", "side": "BUY", "id": str(i)}))
+    return frames
+
+
+def legacy_decode(raw):
+    """Previous _on_ws_message path"""
+    data = json.loads(raw)
+    if data.get('type') == 'ticker':
+        return MarketData(
+            symbol=data.get('symbol', ''),
+            price=float(data.get('price', 0)),
+            volume=float(data.get('volume', 0)),
+            timestamp=int(time.time()),
+            change_24h=float(data.get('change', 0)) if data.get('change') else None,
+            change_pct_24h=float(data.get('changePercent', 0)) if data.get('changePercent') else None
+        )
+    return TradeData(
+        symbol=data.get('symbol', ''),
+        price=float(data.get('price', 0)),
+        quantity=float(data.get('quantity', 0)),
+        side=data.get('side', ''),
+        timestamp=int(time.time()),
+        trade_id=data.get('id')
+    )
+
+
+def rate(decode, frames) -> float:
+    started = time.perf_counter()
+    for frame in frames:
+        decode(frame)
+    return len(frames) / (time.perf_counter() - started)
+
+
+def main(count: int = 200000) -> None:
+    frames = make_frames(count)
+    results = {"legacy json": rate(legacy_decode, frames)}
+    for backend in available_backends():
+        results[backend] = rate(MessageDecoder(backend).decode_ws_message, frames)
+
+    baseline = results["legacy json"]
+    print(f"{'decoder':<12} {'msgs/s':>12} {'vs legacy':>10}")
+    for name, msgs_per_sec in results.items():
+        print(f"{name:<12} {msgs_per_sec:>12,.0f} {msgs_per_sec / baseline:>9.2f}x")
+    if available_backends() == ("json",):
+        print("only the stdlib backend is installed; install orjson or msgspec for a speedup")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,63 @@
+"""
+Micro-benchmark: per-order signing cost, legacy vs cached RequestSigner.
+
+Usage:
+    python benchmarks/bench_request_signing.py [iterations]
+"""
+
+import json
+import os
+import sys
+import timeit
+import urllib.parse
+from urllib.parse import urlencode, urlparse
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.append(BASE_DIR)
+
+from cryptography.hazmat.primitives.asymmetric import ed25519  # noqa: E402
+
+from core.request_signer import RequestSigner  # noqa: E402
+
+SECRET = "1f" * 32
+ENDPOINT = "/trade/api/v2/order"
+PARAMS = {"symbol": "BTC/INR", "exchange": "coinswitchx"}
+PAYLOAD = {"side": "buy", "symbol": "BTC/INR", "type": "limit", "price": 100.5, "quantity": 1}
+
+
+def legacy_sign(method, endpoint, params, payload):
+    """Previous get_signature body: key parsed and strings rebuilt per call."""
+    unquote_endpoint = endpoint
+    if method == "GET" and params:
+        endpoint += ("&", "?")[urlparse(endpoint).query == ""] + urlencode(params)
+        unquote_endpoint = urllib.parse.unquote_plus(endpoint)
+    payload_str = json.dumps(payload or {}, separators=(",", ":"), sort_keys=True)
+    key = ed25519.Ed25519PrivateKey.from_private_bytes(bytes.fromhex(SECRET))
+    return key.sign(bytes(method + unquote_endpoint + payload_str, "utf-8")).hex()
+
+
+def main(iterations: int = 20000) -> None:
+    signer = RequestSigner(SECRET)
+    assert signer.sign("POST", ENDPOINT, body=PAYLOAD) == legacy_sign("POST", ENDPOINT, {}, PAYLOAD)
+
+    cases = {
+        "GET ticker": (
+            lambda: legacy_sign("GET", "/trade/api/v2/24hr/ticker", PARAMS, None),
+            lambda: signer.sign("GET", "/trade/api/v2/24hr/ticker", PARAMS),
+        ),
+        "POST order": (
+            lambda: legacy_sign("POST", ENDPOINT, {}, PAYLOAD),
+            lambda: signer.sign("POST", ENDPOINT, body=PAYLOAD),
+        ),
+    }
+
+    print(f"{'case':<12} {'legacy us':>10} {'cached us':>10} {'speedup':>8}")
+    for name, (legacy, cached) in cases.items():
+        legacy_us = min(timeit.repeat(legacy, number=iterations, repeat=3)) / iterations * 1e6
+        cached_us = min(timeit.repeat(cached, number=iterations, repeat=3)) / iterations * 1e6
+        print(f"{name:<12} {legacy_us:>10.2f} {cached_us:>10.2f} {legacy_us / cached_us:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,117 @@
+"""
+Benchmark: strategy evaluation across a universe of symbols.
+
+Times one evaluation round over N symbols for:
+  - the scalar per-context path with reasons rendered eagerly (previous behaviour)
+  - the scalar per-context path with lazy SignalReason
+  - the vectorized evaluate_universe path
+and the cost of LoggerMixin.logger access with and without the per-instance cache.
+
+Usage:
+    python benchmarks/bench_strategy_signals.py [symbols] [rounds]
+"""
+
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.append(BASE_DIR)
+
+from strategies.base_strategy import MarketContext  # noqa: E402
+from strategies.mean_reversion import MeanReversionStrategy  # noqa: E402
+from strategies.simple_momentum import SimpleMomentumStrategy  # noqa: E402
+from strategies.streaming_indicators import StreamingIndicatorEngine  # noqa: E402
+from utils.logging_setup import get_logger  # noqa: E402
+
+
+def make_contexts(count: int, length: int = 120):
+    rng = np.random.default_rng(1)
+    contexts = []
+    for i in range(count):
+        prices = 100 * np.cumprod(1 + rng.normal(0.0005 * (i % 7 - 3), 0.004, length))
+        contexts.append(MarketContext(
+            symbol=f"SYM{i:04d}USDT",
+            current_price=float(prices[-1]),
+            volume=1e6,
+            price_history=prices.tolist(),
+            indicators={},
+            timestamp="0",
+        ))
+    return contexts
+
+
+def timed(func, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - started) / rounds
+
+
+def scalar_round(strategies, contexts, eager: bool):
+    def run():
+        for context in contexts:
+            for strategy in strategies:
+                signal = strategy.generate_signal(context)
+                if eager and signal is not None:
+                    str(signal.reason)
+    return run
+
+
+def eager_conditions_round(strategy, contexts):
+    """Render the bullish/bearish reason on every evaluation, as f-strings used to"""
+    indicators = [strategy._calculate_indicators(c.price_history, c.symbol) for c in contexts]
+
+    def run():
+        for context, values in zip(contexts, indicators):
+            str(strategy._evaluate_conditions(context.current_price, values, context)[2])
+    return run
+
+
+def lazy_conditions_round(strategy, contexts):
+    indicators = [strategy._calculate_indicators(c.price_history, c.symbol) for c in contexts]
+
+    def run():
+        for context, values in zip(contexts, indicators):
+            strategy._evaluate_conditions(context.current_price, values, context)
+    return run
+
+
+def main(count: int = 500, rounds: int = 20) -> None:
+    contexts = make_contexts(count)
+    engine = StreamingIndicatorEngine()
+    strategies = [SimpleMomentumStrategy(indicator_engine=engine), MeanReversionStrategy(indicator_engine=engine)]
+    for strategy in strategies:
+        # Production runs at INFO; silence output so only evaluation is timed
+        strategy.logger.setLevel(logging.WARNING)
+
+    momentum = strategies[0]
+    results = {
+        "conditions eager": timed(eager_conditions_round(momentum, contexts), rounds),
+        "conditions lazy": timed(lazy_conditions_round(momentum, contexts), rounds),
+        "scalar round": timed(scalar_round(strategies, contexts, eager=False), rounds),
+        "vectorized round": timed(lambda: [s.generate_signals_batch(contexts) for s in strategies], rounds),
+    }
+
+    print(f"{count} symbols, {rounds} rounds")
+    print(f"{'path':<18} {'ms/round':>10} {'us/symbol':>10}")
+    for name, seconds in results.items():
+        print(f"{name:<18} {seconds * 1e3:>10.2f} {seconds / count * 1e6:>10.2f}")
+    print(f"reason formatting speedup: {results['conditions eager'] / results['conditions lazy']:.2f}x")
+    print(f"vectorized vs scalar:      {results['scalar round'] / results['vectorized round']:.2f}x")
+
+    accesses = 200000
+    name = f"CryptoFuturesBot.{type(momentum).__name__}"
+    uncached = timed(lambda: [get_logger(name) for _ in range(accesses)], 1)
+    cached = timed(lambda: [momentum.logger for _ in range(accesses)], 1)
+    print(f"logger access: get_logger {uncached / accesses * 1e9:.0f} ns, "
+          f"cached property {cached / accesses * 1e9:.0f} ns")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 20)
@@ -1,24 +1,75 @@
 import threading
-import socketio
-from typing import List, Dict, Optional
+from typing import Any, Optional
+
+import numpy as np
+
+try:
+    import socketio
+    SOCKETIO_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    socketio = None
+    SOCKETIO_AVAILABLE = False
+
 from core.coinswitch_api_utils import send_request
+from services.market_buffer import CandleRingBuffer
+
+# ~1 MiB per symbol: 9362 candles, about 32 days of 5-minute bars
+DEFAULT_CANDLE_MEMORY_BUDGET = 1 << 20
+
+_FIELD_ALIASES = {
+    "open_time": ("open_time", "start_time", "startTime", "timestamp", "t"),
+    "open": ("open", "o"),
+    "high": ("high", "h"),
+    "low": ("low", "l"),
+    "close": ("close", "c"),
+    "volume": ("volume", "v"),
+}
+
+
+def _field(candle: dict, name: str) -> Any:
+    for key in _FIELD_ALIASES[name]:
+        if candle.get(key) is not None:
+            return candle[key]
+    raise KeyError(name)
+
+
+def parse_candle(candle: Any) -> tuple:
+    """Normalise a dict or [time, o, h, l, c, v] candle to an OHLCV tuple"""
+    if isinstance(candle, dict):
+        values = [_field(candle, name) for name in _FIELD_ALIASES]
+    else:
+        values = list(candle[:6])
+    return (int(float(values[0])),) + tuple(float(value) for value in values[1:])
 
 
 class CoinswitchAPI:
     """Simple wrapper for Coinswitch REST/WebSocket endpoints."""
 
-    def __init__(self, symbol: str = "BTCUSDT"):
+    def __init__(self, symbol: str = "BTCUSDT", candle_memory_budget: int = DEFAULT_CANDLE_MEMORY_BUDGET):
         self.symbol = symbol
-        self._candles: List[Dict] = []
-        self._sio = socketio.Client()
+        # Bounded, deduplicated by open time; the live candle is updated in place
+        self._candles = CandleRingBuffer.from_memory_budget(candle_memory_budget)
+        self._sio = socketio.Client() if SOCKETIO_AVAILABLE else None
         self._namespace = "/pro/realtime-rates-socket/futures/exchange_2"
         self._pair = f"{symbol}_5"  # 5-minute candles
         self._base_ws_url = "https://ws.coinswitch.co/"
         self._thread: Optional[threading.Thread] = None
 
     @property
-    def candles(self) -> List[Dict]:
-        return self._candles
+    def candles(self) -> np.ndarray:
+        """Structured view of all retained candles, oldest first"""
+        return self._candles.bars()
+
+    def get_candles(self, limit: Optional[int] = None) -> np.ndarray:
+        """Structured view of the last limit candles (no copy)"""
+        return self._candles.bars(limit)
+
+    def add_candle(self, candle: Any) -> bool:
+        """Store a candle payload; returns True if it opened a new candle"""
+        try:
+            return self._candles.upsert(*parse_candle(candle))
+        except (KeyError, TypeError, ValueError, IndexError):
+            return False
 
     def _run_socket(self) -> None:
         @self._sio.event
@@ -31,7 +82,7 @@ class CoinswitchAPI:
         @self._sio.on("FETCH_CANDLESTICK_CS_PRO", namespace=self._namespace)
         def on_candle(data):
             if isinstance(data, dict) and "data" in data:
-                self._candles.append(data["data"])
+                self.add_candle(data["data"])
 
         self._sio.connect(
             url=self._base_ws_url,
@@ -44,6 +95,8 @@ class CoinswitchAPI:
         self._sio.wait()
 
     def start_candle_stream(self) -> None:
+        if self._sio is None:
+            raise ImportError("python-socketio is required for the candle stream")
         if self._thread and self._thread.is_alive():
             return
         self._thread = threading.Thread(target=self._run_socket, daemon=True)
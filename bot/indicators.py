@@ -1,3 +1,9 @@
+import warnings
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
 import pandas as pd
 
 
@@ -25,10 +31,48 @@ def calculate_macd(
     return pd.DataFrame({"macd": macd, "signal": macd_signal, "hist": histogram})
 
 
-def calculate_supertrend(
-    df: pd.DataFrame, period: int = 10, multiplier: int = 3
-) -> pd.Series:
-    """Calculate Supertrend indicator."""
+def _supertrend_kernel(
+    close: np.ndarray, upper_band: np.ndarray, lower_band: np.ndarray
+) -> Tuple[np.ndarray, int]:
+    """Run the Supertrend recurrence over contiguous arrays.
+
+    Returns the Supertrend values and the direction at the last row. NaN
+    handling mirrors the builtin ``max``/``min`` calls of the original loop,
+    so warm-up rows stay NaN exactly as before.
+    """
+    n = len(close)
+    if n == 0:
+        return np.empty(0, dtype="float64"), 1
+
+    c = close.tolist()
+    upper = upper_band.tolist()
+    lower = lower_band.tolist()
+    out = [0.0] * n
+
+    prev = upper[0]
+    direction = 1
+    out[0] = prev
+    for i in range(1, n):
+        price = c[i]
+        if price > prev:
+            direction = 1
+        elif price < prev:
+            direction = -1
+
+        if direction == 1:
+            band = lower[i]
+            prev = prev if prev > band else band
+        else:
+            band = upper[i]
+            prev = prev if prev < band else band
+        out[i] = prev
+
+    return np.asarray(out, dtype="float64"), direction
+
+
+def _supertrend_bands(
+    df: pd.DataFrame, period: int, multiplier: float
+) -> Tuple[pd.Series, pd.Series, pd.Series]:
     high = df["high"]
     low = df["low"]
     close = df["close"]
@@ -40,27 +84,92 @@ def calculate_supertrend(
     hl2 = (high + low) / 2
     upper_band = hl2 + multiplier * atr
     lower_band = hl2 - multiplier * atr
-    supertrend = pd.Series(index=df.index, dtype="float64")
-    direction = pd.Series(index=df.index, dtype="int")
-
-    for i in range(len(df)):
-        if i == 0:
-            supertrend.iloc[i] = upper_band.iloc[i]
-            direction.iloc[i] = 1
-            continue
-        if close.iloc[i] > supertrend.iloc[i - 1]:
-            direction.iloc[i] = 1
-        elif close.iloc[i] < supertrend.iloc[i - 1]:
-            direction.iloc[i] = -1
-        else:
-            direction.iloc[i] = direction.iloc[i - 1]
+    return tr, upper_band, lower_band
+
+
+def calculate_supertrend(
+    df: pd.DataFrame, period: int = 10, multiplier: int = 3
+) -> pd.Series:
+    """Calculate Supertrend indicator."""
+    _, upper_band, lower_band = _supertrend_bands(df, period, multiplier)
+    values, _ = _supertrend_kernel(
+        df["close"].to_numpy(dtype="float64"),
+        upper_band.to_numpy(dtype="float64"),
+        lower_band.to_numpy(dtype="float64"),
+    )
+    return pd.Series(values, index=df.index, dtype="float64")
+
 
-        if direction.iloc[i] == 1:
-            supertrend.iloc[i] = max(lower_band.iloc[i], supertrend.iloc[i - 1])
+@dataclass
+class SupertrendState:
+    """Rolling state needed to extend a Supertrend series one candle at a time."""
+
+    period: int = 10
+    multiplier: float = 3
+    supertrend: float = float("nan")
+    direction: int = 1
+    prev_close: Optional[float] = None
+    true_ranges: Deque[float] = field(default_factory=deque)
+
+
+def init_supertrend_state(
+    df: pd.DataFrame, period: int = 10, multiplier: int = 3
+) -> SupertrendState:
+    """Build a SupertrendState from historical candles."""
+    tr, upper_band, lower_band = _supertrend_bands(df, period, multiplier)
+    values, direction = _supertrend_kernel(
+        df["close"].to_numpy(dtype="float64"),
+        upper_band.to_numpy(dtype="float64"),
+        lower_band.to_numpy(dtype="float64"),
+    )
+    state = SupertrendState(period=period, multiplier=multiplier)
+    if len(values):
+        state.supertrend = float(values[-1])
+        state.direction = direction
+        state.prev_close = float(df["close"].iloc[-1])
+        state.true_ranges.extend(tr.iloc[-period:].tolist())
+    return state
+
+
+def update_supertrend(
+    state: SupertrendState, high: float, low: float, close: float
+) -> float:
+    """Advance a SupertrendState by one candle and return the new value."""
+    if state.prev_close is None:
+        tr = abs(high - low)
+    else:
+        tr = max(
+            abs(high - low), abs(high - state.prev_close), abs(state.prev_close - low)
+        )
+    state.true_ranges.append(tr)
+    if len(state.true_ranges) > state.period:
+        state.true_ranges.popleft()
+
+    if len(state.true_ranges) < state.period:
+        atr = float("nan")
+    else:
+        atr = sum(state.true_ranges) / state.period
+    hl2 = (high + low) / 2
+    upper_band = hl2 + state.multiplier * atr
+    lower_band = hl2 - state.multiplier * atr
+
+    prev = state.supertrend
+    if state.prev_close is None:
+        state.supertrend = upper_band
+        state.direction = 1
+    else:
+        if close > prev:
+            state.direction = 1
+        elif close < prev:
+            state.direction = -1
+
+        if state.direction == 1:
+            state.supertrend = prev if prev > lower_band else lower_band
         else:
-            supertrend.iloc[i] = min(upper_band.iloc[i], supertrend.iloc[i - 1])
+            state.supertrend = prev if prev < upper_band else upper_band
 
-    return supertrend
+    state.prev_close = close
+    return state.supertrend
 
 
 def detect_breakout(
@@ -97,3 +206,194 @@ def detect_breakdown(
     price_threshold = recent[price_col].min()
     volume_threshold = recent[volume_col].mean() * volume_multiplier
     return last_price < price_threshold and last_volume > volume_threshold
+
+
+@dataclass
+class IndicatorPanel:
+    """Indicators for a universe of symbols, one column per symbol."""
+
+    symbols: List[str]
+    rsi: pd.DataFrame
+    macd: pd.DataFrame
+    macd_signal: pd.DataFrame
+    macd_hist: pd.DataFrame
+    supertrend: Optional[pd.DataFrame] = None
+    breakout: Optional[pd.Series] = None
+    breakdown: Optional[pd.Series] = None
+
+    def latest(self) -> pd.DataFrame:
+        """Last row of every indicator, indexed by symbol."""
+        columns = {
+            "rsi": self.rsi.iloc[-1],
+            "macd": self.macd.iloc[-1],
+            "signal": self.macd_signal.iloc[-1],
+            "hist": self.macd_hist.iloc[-1],
+        }
+        if self.supertrend is not None:
+            columns["supertrend"] = self.supertrend.iloc[-1]
+        if self.breakout is not None:
+            columns["breakout"] = self.breakout
+            columns["breakdown"] = self.breakdown
+        return pd.DataFrame(columns, index=self.symbols)
+
+    def get(self, symbol: str) -> Dict[str, float]:
+        """Latest indicator values for one symbol."""
+        return self.latest().loc[symbol].to_dict()
+
+    def breakout_symbols(self) -> List[str]:
+        """Symbols whose last candle broke out on a volume spike."""
+        if self.breakout is None:
+            return []
+        return self.breakout.index[self.breakout].tolist()
+
+    def breakdown_symbols(self) -> List[str]:
+        """Symbols whose last candle broke down on a volume spike."""
+        if self.breakdown is None:
+            return []
+        return self.breakdown.index[self.breakdown].tolist()
+
+
+def _as_wide_frame(
+    data: Union[pd.DataFrame, np.ndarray], symbols: Optional[Sequence[str]]
+) -> pd.DataFrame:
+    """Normalise panel input to a float (time x symbols) DataFrame.
+
+    DataFrames are taken as wide frames (one column per symbol); 2-D arrays
+    are taken as (symbols x time) and transposed.
+    """
+    if isinstance(data, pd.DataFrame):
+        frame = data.astype("float64")
+        if symbols is not None:
+            frame.columns = list(symbols)
+        return frame
+    array = np.asarray(data, dtype="float64")
+    if array.ndim != 2:
+        raise ValueError("panel data must be 2-D (symbols x time)")
+    columns = list(symbols) if symbols is not None else list(range(array.shape[0]))
+    return pd.DataFrame(array.T, columns=columns)
+
+
+def _supertrend_panel(
+    high: pd.DataFrame,
+    low: pd.DataFrame,
+    close: pd.DataFrame,
+    period: int,
+    multiplier: float,
+) -> pd.DataFrame:
+    """Supertrend for every column at once, stepping through time with vector ops."""
+    h = high.to_numpy()
+    lo = low.to_numpy()
+    c = close.to_numpy()
+    prev_close = np.vstack([np.full((1, c.shape[1]), np.nan), c[:-1]])
+    tr = np.fmax(
+        np.fmax(np.abs(h - lo), np.abs(h - prev_close)), np.abs(prev_close - lo)
+    )
+    atr = pd.DataFrame(tr).rolling(window=period).mean().to_numpy()
+    hl2 = (h + lo) / 2
+    upper = hl2 + multiplier * atr
+    lower = hl2 - multiplier * atr
+
+    out = np.empty_like(c)
+    if len(c) == 0:
+        return pd.DataFrame(out, index=close.index, columns=close.columns)
+
+    prev = upper[0]
+    direction = np.ones(c.shape[1], dtype=np.int8)
+    out[0] = prev
+    for i in range(1, len(c)):
+        price = c[i]
+        direction = np.where(
+            price > prev, 1, np.where(price < prev, -1, direction)
+        ).astype(np.int8)
+        rising = np.where(prev > lower[i], prev, lower[i])
+        falling = np.where(prev < upper[i], prev, upper[i])
+        prev = np.where(direction == 1, rising, falling)
+        out[i] = prev
+    return pd.DataFrame(out, index=close.index, columns=close.columns)
+
+
+def _breakout_panel(
+    close: pd.DataFrame, volume: pd.DataFrame, lookback: int, volume_multiplier: float
+) -> Tuple[pd.Series, pd.Series]:
+    """Vectorized detect_breakout / detect_breakdown over every column."""
+    symbols = close.columns
+    if len(close) < lookback + 1:
+        none = pd.Series(False, index=symbols)
+        return none, none.copy()
+
+    prices = close.to_numpy()
+    volumes = volume.to_numpy()
+    recent_prices = prices[-lookback - 1 : -1]
+    recent_volumes = volumes[-lookback - 1 : -1]
+    with np.errstate(invalid="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        high_threshold = np.nanmax(recent_prices, axis=0)
+        low_threshold = np.nanmin(recent_prices, axis=0)
+        volume_threshold = np.nanmean(recent_volumes, axis=0) * volume_multiplier
+    volume_spike = volumes[-1] > volume_threshold
+    breakout = (prices[-1] > high_threshold) & volume_spike
+    breakdown = (prices[-1] < low_threshold) & volume_spike
+    return pd.Series(breakout, index=symbols), pd.Series(breakdown, index=symbols)
+
+
+def compute_indicator_panel(
+    close: Union[pd.DataFrame, np.ndarray],
+    high: Optional[Union[pd.DataFrame, np.ndarray]] = None,
+    low: Optional[Union[pd.DataFrame, np.ndarray]] = None,
+    volume: Optional[Union[pd.DataFrame, np.ndarray]] = None,
+    symbols: Optional[Sequence[str]] = None,
+    rsi_period: int = 14,
+    macd_fast: int = 12,
+    macd_slow: int = 26,
+    macd_signal: int = 9,
+    supertrend_period: int = 10,
+    supertrend_multiplier: int = 3,
+    lookback: int = 20,
+    volume_multiplier: float = 2.0,
+) -> IndicatorPanel:
+    """Compute RSI, MACD, Supertrend and breakout flags for many symbols at once.
+
+    Inputs are wide DataFrames (time x symbols) or 2-D arrays (symbols x
+    time). Supertrend needs ``high`` and ``low``; breakout flags need
+    ``volume``. Values match the single-symbol functions column by column.
+    """
+    close_df = _as_wide_frame(close, symbols)
+    columns = list(close_df.columns)
+
+    def _align(data):
+        if isinstance(data, pd.DataFrame):
+            frame = data.reindex(columns=columns).astype("float64")
+        else:
+            frame = _as_wide_frame(data, columns)
+        frame.index = close_df.index
+        return frame
+
+    delta = close_df.diff()
+    avg_gain = delta.clip(lower=0).rolling(window=rsi_period).mean()
+    avg_loss = (-delta.clip(upper=0)).rolling(window=rsi_period).mean()
+    rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+
+    ema_fast = close_df.ewm(span=macd_fast, adjust=False).mean()
+    ema_slow = close_df.ewm(span=macd_slow, adjust=False).mean()
+    macd = ema_fast - ema_slow
+    signal = macd.ewm(span=macd_signal, adjust=False).mean()
+
+    panel = IndicatorPanel(
+        symbols=columns,
+        rsi=rsi,
+        macd=macd,
+        macd_signal=signal,
+        macd_hist=macd - signal,
+    )
+
+    if high is not None and low is not None:
+        panel.supertrend = _supertrend_panel(
+            _align(high), _align(low), close_df, supertrend_period, supertrend_multiplier
+        )
+
+    if volume is not None:
+        panel.breakout, panel.breakdown = _breakout_panel(
+            close_df, _align(volume), lookback, volume_multiplier
+        )
+
+    return panel
@@ -0,0 +1,205 @@
+"""
+Server clock synchronisation for signed Coinswitch requests.
+
+Instead of calling /trade/api/v2/time before every signed request,
+ServerClock measures the offset between the local clock and the exchange
+once, corrects each sample by half its round trip, and refreshes it in the
+background. X-AUTH-EPOCH values are then produced locally.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+from core.http_transport import HttpTransport, get_transport
+
+logger = logging.getLogger(__name__)
+
+TIME_URL = "https://coinswitch.co/trade/api/v2/time"
+DEFAULT_REFRESH_INTERVAL = 300.0
+TIMESTAMP_REJECTION_HINTS = ("epoch", "timestamp", "time window", "expired")
+
+
+class ServerClock:
+    """Cached exchange-time offset with RTT/2 correction and drift metrics."""
+
+    def __init__(
+        self,
+        transport: Optional[HttpTransport] = None,
+        time_url: str = TIME_URL,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        samples: int = 3,
+        history_size: int = 256,
+    ):
+        """
+        Args:
+            transport: HTTP transport used for /time calls
+            time_url: Exchange time endpoint
+            refresh_interval: Seconds between background resyncs
+            samples: /time calls per sync; the lowest-RTT sample wins
+            history_size: Number of past syncs kept for drift metrics
+        """
+        self.transport = transport or get_transport()
+        self.time_url = time_url
+        self.refresh_interval = refresh_interval
+        self.samples = max(1, samples)
+
+        self._lock = threading.Lock()
+        self._offset_ms: Optional[float] = None
+        self._rtt_ms: Optional[float] = None
+        self._synced_at: Optional[float] = None
+        self._history = deque(maxlen=history_size)
+        self._syncs = 0
+        self._failures = 0
+        self._rejections = 0
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _server_time(payload: Dict) -> Optional[float]:
+        value = payload.get("serverTime", payload.get("server_time"))
+        return float(value) if value is not None else None
+
+    def _sample(self):
+        started = time.time()
+        response = self.transport.get(self.time_url)
+        finished = time.time()
+        response.raise_for_status()
+        server_ms = self._server_time(response.json())
+        if server_ms is None:
+            raise ValueError("Could not extract serverTime from /time response")
+        rtt_ms = (finished - started) * 1000
+        # Server stamped the reply roughly half a round trip after we sent it
+        offset_ms = server_ms - (started * 1000 + rtt_ms / 2)
+        return offset_ms, rtt_ms
+
+    def sync(self) -> bool:
+        """Measure the server offset now; keeps the previous one on failure."""
+        best = None
+        for _ in range(self.samples):
+            try:
+                sample = self._sample()
+            except Exception as e:
+                logger.warning(f"Clock sync sample failed: {e}")
+                continue
+            if best is None or sample[1] < best[1]:
+                best = sample
+
+        with self._lock:
+            if best is None:
+                self._failures += 1
+                return False
+            self._offset_ms, self._rtt_ms = best
+            self._synced_at = time.time()
+            self._history.append((self._synced_at, self._offset_ms, self._rtt_ms))
+            self._syncs += 1
+
+        logger.debug(f"Clock synced: offset={best[0]:.1f}ms rtt={best[1]:.1f}ms")
+        return True
+
+    def offset_ms(self) -> float:
+        """Current offset (server - local) in ms, syncing lazily on first use."""
+        if self._offset_ms is None:
+            self.sync()
+        return self._offset_ms or 0.0
+
+    def now_ms(self) -> int:
+        """Estimated exchange time in epoch milliseconds."""
+        return int(time.time() * 1000 + self.offset_ms())
+
+    def epoch(self) -> str:
+        """X-AUTH-EPOCH header value."""
+        return str(self.now_ms())
+
+    @staticmethod
+    def is_timestamp_rejection(response) -> bool:
+        """Whether the exchange refused a request because of its epoch."""
+        if response is None or response.status_code not in (400, 401, 403):
+            return False
+        text = (getattr(response, "text", "") or "").lower()
+        return any(hint in text for hint in TIMESTAMP_REJECTION_HINTS)
+
+    def call(self, send: Callable[[str], object]):
+        """
+        Send a signed request, resyncing and retrying once on epoch rejection
+
+        Args:
+            send: Callable taking the epoch string and returning a response
+
+        Returns:
+            The response of the last attempt
+        """
+        response = send(self.epoch())
+        if self.is_timestamp_rejection(response):
+            with self._lock:
+                self._rejections += 1
+            logger.warning("Exchange rejected request timestamp, resyncing clock")
+            self.sync()
+            response = send(self.epoch())
+        return response
+
+    def metrics(self) -> Dict[str, float]:
+        """Offset, RTT, sync age and drift (ms of offset change per hour)."""
+        with self._lock:
+            history = list(self._history)
+            metrics = {
+                "offset_ms": self._offset_ms,
+                "rtt_ms": self._rtt_ms,
+                "syncs": self._syncs,
+                "failures": self._failures,
+                "timestamp_rejections": self._rejections,
+                "last_sync_age_s": time.time() - self._synced_at if self._synced_at else None,
+                "drift_ms_per_hour": 0.0,
+                "offset_jitter_ms": 0.0,
+            }
+
+        if len(history) >= 2:
+            (t0, o0, _), (t1, o1, _) = history[0], history[-1]
+            if t1 > t0:
+                metrics["drift_ms_per_hour"] = (o1 - o0) / (t1 - t0) * 3600
+            offsets = [offset for _, offset, _ in history]
+            mean = sum(offsets) / len(offsets)
+            metrics["offset_jitter_ms"] = (sum((o - mean) ** 2 for o in offsets) / len(offsets)) ** 0.5
+        return metrics
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            self.sync()
+
+    def start(self) -> None:
+        """Sync now and keep refreshing in a daemon thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self.sync()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._refresh_loop, name="clock-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+_clock: Optional[ServerClock] = None
+_clock_lock = threading.Lock()
+
+
+def get_server_clock() -> ServerClock:
+    """Process-wide clock, refreshed every CLOCK_SYNC_INTERVAL seconds."""
+    global _clock
+    if _clock is None:
+        with _clock_lock:
+            if _clock is None:
+                _clock = ServerClock(
+                    refresh_interval=float(
+                        os.getenv("CLOCK_SYNC_INTERVAL", str(DEFAULT_REFRESH_INTERVAL))
+                    )
+                )
+                _clock.start()
+    return _clock
@@ -1,13 +1,11 @@
-import json
 import os
 import time
-import urllib
-from urllib.parse import urlencode, urlparse
 
-import requests
-from cryptography.hazmat.primitives.asymmetric import ed25519
 from dotenv import load_dotenv
 
+from core.http_transport import get_transport
+from core.request_signer import get_signer
+
 # Load .env from parent directory if in /core
 dotenv_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env')
 load_dotenv(dotenv_path=dotenv_path)
@@ -22,24 +20,9 @@ if not COINSWITCH_API_KEY or not COINSWITCH_SECRET_KEY:
 
 def get_signature(method, endpoint, params, payload=None):
     epoch_time = str(int(time.time() * 1000))
-    unquote_endpoint = endpoint
-    if method.upper() == "GET" and params:
-        endpoint += ('&', '?')[urlparse(endpoint).query == ''] + urlencode(params)
-        unquote_endpoint = urllib.parse.unquote_plus(endpoint)
-
-    if payload is not None:
-        payload_str = json.dumps(payload, separators=(',', ':'), sort_keys=True)
-    else:
-        payload_str = json.dumps({}, separators=(',', ':'), sort_keys=True)
-
-    signature_msg = method.upper() + unquote_endpoint + payload_str
-    request_string = bytes(signature_msg, 'utf-8')
 
     try:
-        secret_key_bytes = bytes.fromhex(COINSWITCH_SECRET_KEY)
-        secret_key = ed25519.Ed25519PrivateKey.from_private_bytes(secret_key_bytes)
-        signature_bytes = secret_key.sign(request_string)
-        signature = signature_bytes.hex()
+        signature = get_signer(COINSWITCH_SECRET_KEY).sign(method, endpoint, params, payload)
     except Exception as e:
         print(f"[ERROR] Signature generation failed: {e}")
         return None, None
@@ -64,13 +47,15 @@ def send_request(method, endpoint, params={}, payload={}):
         'X-AUTH-APIKEY': COINSWITCH_API_KEY
     }
 
+    transport = get_transport()
+
     try:
         if method.upper() == "GET":
-            response = requests.get(url, headers=headers, params=params)
+            response = transport.get(url, headers=headers, params=params)
         elif method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=payload)
+            response = transport.post(url, headers=headers, json=payload)
         elif method.upper() == "DELETE":
-            response = requests.delete(url, headers=headers, json=payload)
+            response = transport.delete(url, headers=headers, json=payload)
         else:
             print(f"[ERROR] Unsupported method: {method}")
             return None
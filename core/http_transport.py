@@ -0,0 +1,154 @@
+"""
+Shared HTTP transport for Coinswitch REST calls.
+
+One requests.Session with a persistent keep-alive connection pool, so
+repeated calls to the same host skip the TCP+TLS handshake. Timeouts can be
+set per endpoint prefix, and the transport keeps connection-reuse and
+latency statistics.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_ENDPOINT_TIMEOUTS = {
+    "/trade/api/v2/time": 3.0,
+    "/trade/api/v2/order": 5.0,
+}
+
+
+class HttpTransport:
+    """Pooled keep-alive HTTP client with per-endpoint timeouts and stats."""
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+        default_timeout: float = DEFAULT_TIMEOUT,
+        endpoint_timeouts: Optional[Dict[str, float]] = None,
+        latency_samples: int = 1024,
+    ):
+        self.default_timeout = default_timeout
+        self.endpoint_timeouts = dict(DEFAULT_ENDPOINT_TIMEOUTS)
+        if endpoint_timeouts:
+            self.endpoint_timeouts.update(endpoint_timeouts)
+
+        self.session = requests.Session()
+        self.session.headers["Connection"] = "keep-alive"
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=latency_samples)
+        self._requests = 0
+        self._errors = 0
+
+    def set_timeout(self, path_prefix: str, timeout: float) -> None:
+        """Set the timeout for every URL whose path starts with path_prefix."""
+        self.endpoint_timeouts[path_prefix] = timeout
+
+    def timeout_for(self, url: str) -> float:
+        """Timeout for a URL: longest matching endpoint prefix, else default."""
+        path = urlparse(url).path
+        best, best_len = self.default_timeout, -1
+        for prefix, timeout in self.endpoint_timeouts.items():
+            if path.startswith(prefix) and len(prefix) > best_len:
+                best, best_len = timeout, len(prefix)
+        return best
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the pooled session."""
+        kwargs.setdefault("timeout", self.timeout_for(url))
+        started = time.perf_counter()
+        try:
+            return self.session.request(method.upper(), url, **kwargs)
+        except requests.RequestException:
+            with self._lock:
+                self._errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._requests += 1
+                self._latencies.append(elapsed)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def connection_stats(self) -> Dict[str, int]:
+        """New versus reused connections across the pool manager's host pools."""
+        pools = self.adapter.poolmanager.pools
+        new_connections = 0
+        pooled_requests = 0
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            new_connections += getattr(pool, "num_connections", 0)
+            pooled_requests += getattr(pool, "num_requests", 0)
+        return {
+            "new_connections": new_connections,
+            "reused_connections": max(0, pooled_requests - new_connections),
+        }
+
+    def stats(self) -> Dict[str, float]:
+        """Request counts, connection reuse and latency percentiles (ms)."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            total, errors = self._requests, self._errors
+
+        stats = {"requests": total, "errors": errors}
+        stats.update(self.connection_stats())
+        reused = stats["reused_connections"]
+        stats["reuse_ratio"] = reused / total if total else 0.0
+
+        if latencies:
+            def pct(p):
+                return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+            stats.update(
+                latency_avg_ms=sum(latencies) / len(latencies) * 1000,
+                latency_p50_ms=pct(0.50),
+                latency_p95_ms=pct(0.95),
+                latency_max_ms=latencies[-1] * 1000,
+            )
+        return stats
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_transport: Optional[HttpTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """Process-wide transport, sized from HTTP_POOL_SIZE / HTTP_TIMEOUT."""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = HttpTransport(
+                    pool_maxsize=int(os.getenv("HTTP_POOL_SIZE", "20")),
+                    default_timeout=float(os.getenv("HTTP_TIMEOUT", str(DEFAULT_TIMEOUT))),
+                )
+    return _transport
@@ -6,10 +6,10 @@ Provides multiple execution modes and comprehensive bot management
 import sys
 import argparse
 import asyncio
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Set
 
 from utils.config_manager import get_config
-from utils.logging_setup import setup_logger
+from utils.logging_setup import setup_logger, enable_async_logging, flush_logging
 from utils.telegram_alert import send_bot_status
 from utils.error_handler import handle_exceptions
 from utils.core_integration import get_core_integrator
@@ -17,6 +17,7 @@ from utils.core_integration import get_core_integrator
 from services.trade_executor import TradeExecutor, MockTradeExecutor
 from services.data_feed import LiveDataFeed, MockDataFeed
 from services.portfolio_manager import PortfolioManager
+from services.event_scheduler import SymbolEventScheduler
 from strategies.base_strategy import StrategyManager
 from strategies.simple_momentum import SimpleMomentumStrategy
 from strategies.mean_reversion import MeanReversionStrategy
@@ -30,10 +31,23 @@ class CryptoFuturesBot:
         self.config = get_config()
         self.logger = setup_logger("CryptoFuturesBot", level=self.config.system_config.log_level)
         
+        system_config = self.config.system_config
+        if system_config.async_logging:
+            enable_async_logging(
+                "CryptoFuturesBot",
+                queue_size=system_config.log_queue_size,
+                overflow=system_config.log_queue_overflow
+            )
+        
         # Bot state
         self.running = False
         self.services = {}
         self.strategy_manager = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.event_scheduler: Optional[SymbolEventScheduler] = None
+        # Symbols with a cycle running; periodic, bar-close and event cycles
+        # skip a symbol that is already being evaluated
+        self._in_flight: Set[str] = set()
         
         # Initialize components
         self._initialize_services()
@@ -124,6 +138,12 @@ class CryptoFuturesBot:
             if hasattr(data_feed, 'start_websocket') and not self.config.trading_config.dry_run:
                 data_feed.start_websocket()
             
+            # Evaluate strategies when bars built from the trade stream close
+            if self.config.trading_config.bar_interval and hasattr(data_feed, 'candles'):
+                self.loop = asyncio.get_running_loop()
+                data_feed.candles.on_bar_close(self._on_bar_close)
+                self.logger.info(f"Bar-close evaluation enabled on {self.config.trading_config.bar_interval} bars")
+            
             self.logger.info("✅ Bot started successfully")
             return True
             
@@ -139,6 +159,9 @@ class CryptoFuturesBot:
             
             self.running = False
             
+            if self.strategy_manager:
+                self.strategy_manager.close()
+            
             # Stop data feed
             data_feed = self.services['data_feed']
             if hasattr(data_feed, 'stop_websocket'):
@@ -151,74 +174,237 @@ class CryptoFuturesBot:
             
         except Exception as e:
             self.logger.error(f"Error stopping bot: {e}")
+        finally:
+            # Drain queued log records before the process exits
+            flush_logging()
     
     @handle_exceptions()
     async def run_single_cycle(self) -> bool:
-        """Run a single trading cycle"""
+        """Run a single trading cycle across all configured symbols
+        
+        Market data is fetched concurrently, every symbol is evaluated in one
+        StrategyManager.generate_signals_batch call, and the resulting orders
+        are submitted concurrently. The data feed and trade executor are
+        blocking services on the pooled HTTP transport, so their calls run via
+        asyncio.to_thread. Symbols already being evaluated by a bar-close or
+        event cycle are skipped.
+        """
+        symbols = self._claim_symbols(self.config.trading_config.active_symbols())
         try:
-            symbol = self.config.trading_config.default_symbol
+            prepared = await asyncio.gather(
+                *(self._prepare_symbol(symbol) for symbol in symbols),
+                return_exceptions=True
+            )
             
-            # Get market data
-            data_feed = self.services['data_feed']
-            market_data = data_feed.get_market_data(symbol)
+            ready = {}
+            for symbol, result in zip(symbols, prepared):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error in trading cycle for {symbol}: {result}")
+                elif result is not None:
+                    ready[symbol] = result
             
-            if not market_data:
-                self.logger.warning(f"Could not get market data for {symbol}")
+            if not ready:
                 return False
             
-            # Update portfolio positions
-            portfolio_manager = self.services['portfolio_manager']
-            portfolio_manager.update_position(symbol, market_data.price)
-            
-            # Generate trading signals (if strategies are enabled)
-            from strategies.base_strategy import MarketContext
-            
-            market_context = MarketContext(
-                symbol=symbol,
-                current_price=market_data.price,
-                volume=market_data.volume,
-                price_history=[market_data.price],  # In real implementation, maintain history
-                indicators={},
-                timestamp=str(market_data.timestamp)
+            batch = await asyncio.to_thread(
+                self.strategy_manager.generate_signals_batch,
+                [context for _, context in ready.values()]
             )
+            self.logger.debug(f"Strategy timings: {batch.strategy_timings}")
             
-            signals = self.strategy_manager.generate_signals(market_context)
-            
-            if signals:
-                self.logger.info(f"Generated {len(signals)} trading signals")
-                
-                # Execute signals
-                trade_executor = self.services['trade_executor']
-                for signal in signals:
-                    # Execute the signal
-                    from services.trade_executor import OrderRequest, OrderType
-                    
-                    order_request = OrderRequest(
-                        symbol=signal.symbol,
-                        side=signal.signal_type.value,
-                        quantity=self.config.trading_config.default_quantity,
-                        order_type=OrderType.MARKET,
-                        price=signal.price
-                    )
-                    
-                    response = trade_executor.place_order(order_request)
-                    if response:
-                        self.logger.info(f"Executed signal: {signal.signal_type.value} {signal.symbol}")
-                        
-                        # Add to portfolio
-                        portfolio_manager.add_trade(
-                            symbol=signal.symbol,
-                            side=signal.signal_type.value,
-                            quantity=self.config.trading_config.default_quantity,
-                            price=signal.price or market_data.price,
-                            order_id=response.order_id
-                        )
+            results = await asyncio.gather(
+                *(self._execute_signals(symbol, batch.signals[symbol], ready[symbol][0])
+                  for symbol in ready),
+                return_exceptions=True
+            )
+            for symbol, result in zip(ready, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error executing signals for {symbol}: {result}")
             
             return True
             
         except Exception as e:
             self.logger.error(f"Error in trading cycle: {e}")
             return False
+        finally:
+            self._in_flight.difference_update(symbols)
+    
+    def _claim_symbols(self, symbols: Iterable[str]) -> List[str]:
+        """Mark symbols as in flight, returning those that were not already"""
+        claimed = []
+        for symbol in symbols:
+            if symbol in self._in_flight:
+                self.logger.debug(f"Skipping {symbol}: a cycle is already running for it")
+                continue
+            self._in_flight.add(symbol)
+            claimed.append(symbol)
+        return claimed
+    
+    async def _run_symbol_cycle(self, symbol: str, market_data=None) -> bool:
+        """
+        Fetch data, generate signals and submit orders for one symbol
+        
+        Blocking service calls (REST fetches, order placement) run in worker
+        threads so symbols proceed concurrently; portfolio updates stay on the
+        event loop thread.
+        
+        Args:
+            symbol: Trading symbol
+            market_data: Latest MarketData if already known (skips the REST fetch)
+            
+        Returns:
+            False if no market data was available or the symbol is already
+            being evaluated by another cycle
+        """
+        if not self._claim_symbols([symbol]):
+            return False
+        try:
+            prepared = await self._prepare_symbol(symbol, market_data)
+            if prepared is None:
+                return False
+            
+            market_data, market_context = prepared
+            signals = self.strategy_manager.generate_signals(market_context)
+            await self._execute_signals(symbol, signals, market_data)
+            return True
+        finally:
+            self._in_flight.discard(symbol)
+    
+    async def _prepare_symbol(self, symbol: str, market_data=None):
+        """
+        Fetch market data, update the position mark and build the strategy context
+        
+        Returns:
+            (market_data, MarketContext) or None if no market data is available
+        """
+        from strategies.base_strategy import MarketContext
+        
+        # Get market data
+        data_feed = self.services['data_feed']
+        if market_data is None:
+            market_data = await asyncio.to_thread(data_feed.get_market_data, symbol)
+        
+        if not market_data:
+            self.logger.warning(f"Could not get market data for {symbol}")
+            return None
+        
+        # Update portfolio positions
+        portfolio_manager = self.services['portfolio_manager']
+        portfolio_manager.update_position(symbol, market_data.price)
+        
+        price_history, history_seq = data_feed.get_price_snapshot(symbol)
+        market_context = MarketContext(
+            symbol=symbol,
+            current_price=market_data.price,
+            volume=market_data.volume,
+            price_history=price_history,
+            indicators=data_feed.get_book_indicators(symbol),
+            timestamp=str(market_data.timestamp),
+            history_seq=history_seq
+        )
+        return market_data, market_context
+    
+    async def _execute_signals(self, symbol: str, signals, market_data):
+        """Submit orders for a symbol's signals concurrently and record fills"""
+        from services.trade_executor import OrderRequest, OrderType
+        
+        if not signals:
+            return
+        
+        self.logger.info(f"Generated {len(signals)} trading signals for {symbol}")
+        
+        # Submit orders concurrently
+        trade_executor = self.services['trade_executor']
+        portfolio_manager = self.services['portfolio_manager']
+        quantity = self.config.trading_config.default_quantity
+        order_requests = [
+            OrderRequest(
+                symbol=signal.symbol,
+                side=signal.signal_type.value,
+                quantity=quantity,
+                order_type=OrderType.MARKET,
+                price=signal.price
+            )
+            for signal in signals
+        ]
+        responses = await asyncio.gather(
+            *(asyncio.to_thread(trade_executor.place_order, request) for request in order_requests)
+        )
+        
+        for signal, response in zip(signals, responses):
+            if response:
+                self.logger.info(f"Executed signal: {signal.signal_type.value} {signal.symbol}")
+                
+                # Add to portfolio
+                portfolio_manager.add_trade(
+                    symbol=signal.symbol,
+                    side=signal.signal_type.value,
+                    quantity=quantity,
+                    price=signal.price or market_data.price,
+                    order_id=response.order_id
+                )
+    
+    def _on_bar_close(self, bar):
+        """
+        Schedule a symbol cycle on the bot's loop when a configured bar closes
+        
+        Runs on the feed thread. The cycle is skipped if the symbol is already
+        being evaluated by run_single_cycle or the event scheduler.
+        """
+        if not self.running or self.loop is None:
+            return
+        if bar.interval != self.config.trading_config.bar_interval:
+            return
+        if bar.symbol not in self.config.trading_config.active_symbols():
+            return
+        if self.event_scheduler and self.event_scheduler.started:
+            self.event_scheduler.notify(bar.symbol)
+            return
+        asyncio.run_coroutine_threadsafe(self._run_symbol_cycle(bar.symbol), self.loop)
+    
+    async def _run_event_cycle(self, symbol: str) -> bool:
+        """Evaluate one symbol from the feed's cached ticker, falling back to REST"""
+        latest_prices = getattr(self.services['data_feed'], 'latest_prices', {})
+        return await self._run_symbol_cycle(symbol, latest_prices.get(symbol))
+    
+    @handle_exceptions()
+    async def run_event_driven(self, debounce: float = 0.25, max_idle: float = 30.0):
+        """
+        Evaluate a symbol whenever the feed reports a ticker, trade or bar close for it
+        
+        Args:
+            debounce: Seconds to coalesce bursts of events per symbol
+            max_idle: Evaluate symbols without events at least this often
+        """
+        try:
+            symbols = self.config.trading_config.active_symbols()
+            self.event_scheduler = SymbolEventScheduler(
+                self._run_event_cycle, symbols, debounce=debounce, max_idle=max_idle
+            )
+            self.event_scheduler.start()
+            
+            data_feed = self.services['data_feed']
+            for symbol in symbols:
+                if hasattr(data_feed, 'subscribe_ticker'):
+                    data_feed.subscribe_ticker(symbol, lambda _data, s=symbol: self.event_scheduler.notify(s))
+                if hasattr(data_feed, 'subscribe_trades'):
+                    data_feed.subscribe_trades(symbol, lambda _data, s=symbol: self.event_scheduler.notify(s))
+            
+            self.logger.info(f"Running event-driven for {len(symbols)} symbols "
+                             f"(debounce {debounce}s, max idle {max_idle}s)")
+            
+            while self.running:
+                await asyncio.sleep(1)
+                
+        except KeyboardInterrupt:
+            self.logger.info("Bot stopped by user")
+        except Exception as e:
+            self.logger.error(f"Error in event-driven run: {e}")
+        finally:
+            if self.event_scheduler:
+                await self.event_scheduler.stop()
+                self.logger.info(f"Event scheduler stats: {self.event_scheduler.stats()}")
+            await self.stop()
     
     @handle_exceptions()
     async def run_continuous(self, cycle_interval: int = 30):
@@ -271,11 +457,13 @@ def main():
     """Main entry point with command-line interface"""
     parser = argparse.ArgumentParser(description='CryptoFuturesBot - Advanced Cryptocurrency Trading Bot')
     
-    parser.add_argument('mode', choices=['single', 'continuous', 'validate', 'dashboard', 'status'],
+    parser.add_argument('mode', choices=['single', 'continuous', 'events', 'validate', 'dashboard', 'status'],
                        help='Bot execution mode')
     parser.add_argument('--config', '-c', type=str, help='Configuration file path')
     parser.add_argument('--interval', '-i', type=int, default=30, 
-                       help='Interval in seconds for continuous mode (default: 30)')
+                       help='Interval in seconds for continuous mode, max idle time in events mode (default: 30)')
+    parser.add_argument('--debounce', type=float, default=0.25,
+                       help='Seconds to coalesce feed events per symbol in events mode (default: 0.25)')
     parser.add_argument('--symbol', '-s', type=str, default='BTCUSDT',
                        help='Trading symbol (default: BTCUSDT)')
     parser.add_argument('--dry-run', action='store_true',
@@ -344,6 +532,13 @@ def main():
                     await bot.run_continuous(args.interval)
                 
                 asyncio.run(run_continuous())
+                
+            elif args.mode == 'events':
+                async def run_events():
+                    await bot.start()
+                    await bot.run_event_driven(args.debounce, args.interval)
+                
+                asyncio.run(run_events())
     
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
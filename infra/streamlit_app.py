@@ -26,6 +26,9 @@ except ImportError:
             self.symbol = symbol
             self.candles = []
 
+        def get_candles(self, limit=None):
+            return []
+
         def start_candle_stream(self):
             print("[Mock] Starting candle stream")
 
@@ -85,9 +88,9 @@ if STREAMLIT_AVAILABLE:
     st.query_params.clear()
     st.query_params["refresh"] = str(time.time())
 
-    candles = getattr(api, "candles", [])[-60:]
-    if candles:
-        df = pd.DataFrame(candles, columns=["timestamp", "open", "high", "low", "close", "volume"])
+    candles = api.get_candles(60)
+    if len(candles):
+        df = pd.DataFrame(candles).rename(columns={"open_time": "timestamp"})
         df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
         fig = go.Figure(data=[go.Candlestick(
             x=df["timestamp"],
@@ -1,7 +1,7 @@
 # part1_core/api_connector.py
 
 import os
-import requests
+from coinswitch_http import http
 from dotenv import load_dotenv
 
 
@@ -21,7 +21,7 @@ def run():
             url = "https://api-trading.coinswitch.co/v1/time"
             headers = {"X-API-KEY": api_key, "Content-Type": "application/json"}
 
-            response = requests.get(url, headers=headers)
+            response = http.get(url, headers=headers)
             if response.status_code == 200:
                 server_time = response.json()
                 print(f"[INFO] Server time response: {server_time}")
@@ -1,51 +1,11 @@
 # part1_core/coinswitch_api_utils.py
-import requests
-import json
-import time
-import os
-from cryptography.hazmat.primitives.asymmetric import ed25519
-from urllib.parse import urlparse, urlencode
-import urllib
+from coinswitch_http import http
+from coinswitch_signature_utils import get_signer
 from coinswitch_env_loader import API_KEY, secret_key
 
 
-def get_server_time():
-    url = "https://coinswitch.co/trade/api/v2/time"
-    response = requests.get(url)
-    return str(response.json().get("serverTime", int(time.time() * 1000)))
-
-
 def get_signature(method, endpoint, params=None, payload=None):
-    if params is None:
-        params = {}
-    if payload is None:
-        payload = {}
-
-    unquote_endpoint = endpoint
-    if method == "GET" and len(params) != 0:
-        endpoint += ("&", "?")[urlparse(endpoint).query == ""] + urlencode(params)
-        unquote_endpoint = urllib.parse.unquote_plus(endpoint)
-
-    if method == "GET":
-        signature_msg = (
-            method
-            + unquote_endpoint
-            + json.dumps(payload, separators=(",", ":"), sort_keys=True)
-        )
-    else:
-        signature_msg = (
-            method
-            + unquote_endpoint
-            + json.dumps(payload, separators=(",", ":"), sort_keys=True)
-        )
-
-    request_string = bytes(signature_msg, "utf-8")
-    secret_key_bytes = bytes.fromhex(secret_key)
-    sk_obj = ed25519.Ed25519PrivateKey.from_private_bytes(secret_key_bytes)
-    signature_bytes = sk_obj.sign(request_string)
-    signature = signature_bytes.hex()
-
-    return signature
+    return get_signer(secret_key).sign(method, endpoint, params, payload)
 
 
 def send_request(method, endpoint, params=None, payload=None):
@@ -64,11 +24,11 @@ def send_request(method, endpoint, params=None, payload=None):
     }
 
     if method == "GET":
-        response = requests.get(url, headers=headers, params=params)
+        response = http.get(url, headers=headers, params=params)
     elif method == "POST":
-        response = requests.post(url, headers=headers, json=payload)
+        response = http.post(url, headers=headers, json=payload)
     elif method == "DELETE":
-        response = requests.delete(url, headers=headers, json=payload)
+        response = http.delete(url, headers=headers, json=payload)
     else:
         raise Exception(f"Unsupported method: {method}")
 
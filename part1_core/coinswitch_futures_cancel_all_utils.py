@@ -1,4 +1,4 @@
-import requests
+from coinswitch_http import http
 import time
 import json
 import logging
@@ -41,7 +41,7 @@ def cancel_all_orders():
 
         # Send request
         logging.info(f"Sending Cancel ALL Orders request...")
-        response = requests.request(method, url, headers=headers, json=payload)
+        response = http.request(method, url, headers=headers, json=payload)
 
         # Log response
         logging.info(f"Status Code: {response.status_code}")
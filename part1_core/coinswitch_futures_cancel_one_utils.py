@@ -1,4 +1,4 @@
-import requests
+from coinswitch_http import http
 import time
 import logging
 import json
@@ -39,7 +39,7 @@ def cancel_one_order(order_id):
     logging.info("Sending Cancel ONE Order request...")
 
     try:
-        response = requests.request(method, url, headers=headers, json={})
+        response = http.request(method, url, headers=headers, json={})
 
         logging.info(f"Status Code: {response.status_code}")
         if response.status_code == 200:
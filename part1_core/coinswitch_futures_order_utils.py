@@ -1,6 +1,6 @@
 # part1_core/coinswitch_futures_order_utils.py
 
-import requests
+from coinswitch_http import http
 import json
 import hmac
 import hashlib
@@ -58,7 +58,7 @@ def place_futures_order(
 
     try:
         logging.info(f"Placing {side} {order_type} order for {symbol} qty={qty}...")
-        response = requests.post(url, headers=headers, json=payload)
+        response = http.post(url, headers=headers, json=payload)
         response.raise_for_status()
 
         data = response.json().get("data", {})
@@ -1,4 +1,4 @@
-import requests
+from coinswitch_http import http
 import json
 import logging
 import time
@@ -56,7 +56,7 @@ payload = {
 # Send request
 logging.info("Starting Place Order...")
 try:
-    response = requests.post(url, headers=headers, json=payload)
+    response = http.post(url, headers=headers, json=payload)
     logging.info(f"Status Code: {response.status_code}")
     if response.status_code == 200:
         logging.info("Order placed successfully!")
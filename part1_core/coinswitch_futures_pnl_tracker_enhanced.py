@@ -1,9 +1,8 @@
 # part1_core/coinswitch_futures_pnl_tracker_enhanced.py
 
+from coinswitch_http import http, get_server_clock
 import json
-import requests
 import logging
-import time
 from coinswitch_signature_utils import generate_signature
 from coinswitch_env_loader import API_KEY, secret_key
 
@@ -14,19 +13,18 @@ def get_wallet_balance():
     params = {}
     payload = {}
 
-    epoch_time = str(int(time.time() * 1000))
-    signature = generate_signature(method, endpoint, params, epoch_time, secret_key)
-
     url = "https://coinswitch.co" + endpoint
 
-    headers = {
-        "Content-Type": "application/json",
-        "X-AUTH-SIGNATURE": signature,
-        "X-AUTH-APIKEY": API_KEY,
-        "X-AUTH-EPOCH": epoch_time,
-    }
+    def send_wallet_balance(epoch_time):
+        headers = {
+            "Content-Type": "application/json",
+            "X-AUTH-SIGNATURE": generate_signature(method, endpoint, params, epoch_time, secret_key),
+            "X-AUTH-APIKEY": API_KEY,
+            "X-AUTH-EPOCH": epoch_time,
+        }
+        return http.request(method, url, headers=headers, json=payload)
 
-    response = requests.request("GET", url, headers=headers, json=payload)
+    response = get_server_clock().call(send_wallet_balance)
     if response.status_code == 200:
         data = response.json().get("data", {})
         return data
@@ -1,8 +1,6 @@
 # coinswitch_futures_position_utils.py
 
-import requests
-import json
-import time
+from coinswitch_http import http, get_server_clock
 import logging
 from coinswitch_signature_utils import generate_signature
 from coinswitch_env_loader import API_KEY, secret_key
@@ -16,27 +14,23 @@ endpoint = "/trade/api/v2/user/portfolio"
 method = "GET"
 params = {}  # No params for portfolio
 
-# Get server time
-time_response = requests.get("https://coinswitch.co/trade/api/v2/time")
-epoch_time = str(time_response.json().get("server_time", int(time.time() * 1000)))
-
-# Generate signature
-signature = generate_signature(method, endpoint, params, epoch_time, secret_key)
-
 # Prepare URL
 url = "https://coinswitch.co" + endpoint
 
-# Headers
-headers = {
-    "Content-Type": "application/json",
-    "X-AUTH-SIGNATURE": signature,
-    "X-AUTH-APIKEY": API_KEY,
-    "X-AUTH-EPOCH": epoch_time,
-}
+
+def send_positions(epoch_time):
+    headers = {
+        "Content-Type": "application/json",
+        "X-AUTH-SIGNATURE": generate_signature(method, endpoint, params, epoch_time, secret_key),
+        "X-AUTH-APIKEY": API_KEY,
+        "X-AUTH-EPOCH": epoch_time,
+    }
+    return http.request(method, url, headers=headers, json=params)
+
 
 # Call API
 try:
-    response = requests.request(method, url, headers=headers, json=params)
+    response = get_server_clock().call(send_positions)
     logging.info(f"Status Code: {response.status_code}")
 
     if response.status_code == 200:
@@ -0,0 +1,14 @@
+# part1_core/coinswitch_http.py
+"""Shared pooled HTTP transport and server clock for the standalone part1_core scripts."""
+
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.append(BASE_DIR)
+
+from core.clock_sync import get_server_clock  # noqa: E402
+from core.http_transport import get_transport  # noqa: E402
+
+http = get_transport()
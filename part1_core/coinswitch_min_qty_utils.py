@@ -2,9 +2,8 @@ import os
 import re
 import time
 import requests
-import urllib.parse
-from urllib.parse import urlencode
-from cryptography.hazmat.primitives.asymmetric import ed25519
+from coinswitch_http import http, get_server_clock
+from coinswitch_signature_utils import generate_signature
 from dotenv import load_dotenv
 import logging
 
@@ -31,60 +30,36 @@ if not re.match(r"^[0-9a-fA-F]{64}$", API_SECRET):
 
 # Signature generator
 def get_signature(method, endpoint, params, epoch_time, secret_key):
-    unquote_endpoint = endpoint
-    if method == "GET" and len(params) != 0:
-        endpoint += ("&", "?")[urllib.parse.urlparse(endpoint).query == ""] + urlencode(
-            params
-        )
-    unquote_endpoint = urllib.parse.unquote_plus(endpoint)
-    signature_msg = method + unquote_endpoint + epoch_time
-    request_string = bytes(signature_msg, "utf-8")
-    secret_key_bytes = bytes.fromhex(secret_key)
-    private_key = ed25519.Ed25519PrivateKey.from_private_bytes(secret_key_bytes)
-    signature_bytes = private_key.sign(request_string)
-    signature = signature_bytes.hex()
-    return signature
+    return generate_signature(method, endpoint, params, epoch_time, secret_key)
 
 
-# === STEP 1: Sync server time ===
-logging.info("Fetching /time ...")
-time_resp = requests.get("https://coinswitch.co/trade/api/v2/time")
-time_resp.raise_for_status()
-
-time_data = time_resp.json()
-logging.info(f"DEBUG TIME RESPONSE: {time_data}")
-
-# Read serverTime key (correct key!)
-server_time = time_data.get("serverTime")
-if not server_time:
-    raise Exception("Could not extract serverTime from /time response!")
-
-epoch_time = str(server_time)
-logging.info(f"Using serverTime: {epoch_time}")
+# === STEP 1: Server clock (offset cached and refreshed in the background) ===
+server_clock = get_server_clock()
+logging.info(f"Server clock offset: {server_clock.offset_ms():.1f} ms")
 
 # === STEP 2: Call Trade Info API ===
 method = "GET"
 endpoint = "/trade/api/v2/tradeInfo"
 params = {"exchange": "EXCHANGE_2"}
 
-# Generate signature
-signature = get_signature(method, endpoint, params, epoch_time, API_SECRET)
-
 # Build URL
 url = "https://coinswitch.co" + endpoint
 
-# Headers
-headers = {
-    "Content-Type": "application/json",
-    "X-AUTH-SIGNATURE": signature,
-    "X-AUTH-APIKEY": API_KEY,
-    "X-AUTH-EPOCH": epoch_time,
-}
+
+def send_trade_info(epoch_time):
+    headers = {
+        "Content-Type": "application/json",
+        "X-AUTH-SIGNATURE": get_signature(method, endpoint, params, epoch_time, API_SECRET),
+        "X-AUTH-APIKEY": API_KEY,
+        "X-AUTH-EPOCH": epoch_time,
+    }
+    return http.request(method, url, headers=headers, params=params)
+
 
 # Make API call
 logging.info("Fetching Trade Info...")
 try:
-    response = requests.request(method, url, headers=headers, params=params)
+    response = server_clock.call(send_trade_info)
     response.raise_for_status()
     logging.info(f"Trade Info API Response: {response.json()}")
 except requests.RequestException as e:
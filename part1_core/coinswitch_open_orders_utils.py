@@ -1,6 +1,6 @@
 # part1_core/coinswitch_open_orders_utils.py
 
-import requests
+from coinswitch_http import http
 import time
 import logging
 import json
@@ -38,7 +38,7 @@ def get_open_orders(exchange="EXCHANGE_2", count=20):
     }
 
     try:
-        response = requests.get(url, headers=headers)
+        response = http.get(url, headers=headers)
         logging.info(f"Status Code: {response.status_code}")
 
         if response.status_code == 200:
@@ -1,8 +1,7 @@
 # coinswitch_order_executor.py
 
-import requests
+from coinswitch_http import http, get_server_clock
 import logging
-import time
 import json
 from coinswitch_signature_utils import generate_signature
 from coinswitch_env_loader import API_KEY, secret_key
@@ -29,22 +28,22 @@ def place_order(
     if trigger_price:
         payload["trigger_price"] = trigger_price
 
-    epoch_time = str(int(time.time() * 1000))
-    signature = generate_signature(method, endpoint, params, epoch_time, secret_key)
     url = "https://coinswitch.co" + endpoint
 
-    headers = {
-        "Content-Type": "application/json",
-        "X-AUTH-SIGNATURE": signature,
-        "X-AUTH-APIKEY": API_KEY,
-        "X-AUTH-EPOCH": epoch_time,
-    }
+    def send_order(epoch_time):
+        headers = {
+            "Content-Type": "application/json",
+            "X-AUTH-SIGNATURE": generate_signature(method, endpoint, params, epoch_time, secret_key),
+            "X-AUTH-APIKEY": API_KEY,
+            "X-AUTH-EPOCH": epoch_time,
+        }
+        return http.request(method, url, headers=headers, json=payload)
 
     try:
         logging.info(
             f"Placing {side} order for {symbol} qty={quantity} @ price={price}"
         )
-        response = requests.request(method, url, headers=headers, json=payload)
+        response = get_server_clock().call(send_order)
         logging.info(f"Status Code: {response.status_code}")
 
         if response.status_code == 200:
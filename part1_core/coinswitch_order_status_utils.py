@@ -1,6 +1,6 @@
 # coinswitch_cancel_all_utils.py
 
-import requests
+from coinswitch_http import http
 import logging
 import time
 import json
@@ -32,7 +32,7 @@ def cancel_all_orders(symbol=None):
 
     try:
         logging.info(f"Cancelling all orders... Symbol={symbol if symbol else 'ALL'}")
-        response = requests.request(method, url, headers=headers, json=payload)
+        response = http.request(method, url, headers=headers, json=payload)
         logging.info(f"Status Code: {response.status_code}")
 
         if response.status_code == 200:
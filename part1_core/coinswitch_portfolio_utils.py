@@ -1,6 +1,6 @@
 # coinswitch_portfolio_utils.py
 
-import requests
+from coinswitch_http import http
 import time
 import logging
 import json
@@ -27,7 +27,7 @@ headers = {
 }
 
 logging.info("Sending Portfolio request...")
-response = requests.request(method, url, headers=headers, json=payload)
+response = http.request(method, url, headers=headers, json=payload)
 logging.info(f"Status Code: {response.status_code}")
 
 if response.status_code == 200:
@@ -1,9 +1,13 @@
 # coinswitch_signature_utils.py
 
-from cryptography.hazmat.primitives.asymmetric import ed25519
-from urllib.parse import urlparse, urlencode
-import urllib
-import time
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.append(BASE_DIR)
+
+from core.request_signer import get_signer  # noqa: E402
 
 
 def generate_signature(method, endpoint, params, epoch_time, secret_key):
@@ -20,22 +24,4 @@ def generate_signature(method, endpoint, params, epoch_time, secret_key):
     Returns:
         str: Signature hex string
     """
-    unquote_endpoint = endpoint
-
-    if method == "GET" and len(params) != 0:
-        endpoint += ("&", "?")[urlparse(endpoint).query == ""] + urlencode(params)
-        unquote_endpoint = urllib.parse.unquote_plus(endpoint)
-
-    # Build signature message
-    signature_msg = method + unquote_endpoint + epoch_time
-
-    # Prepare private key
-    request_string = bytes(signature_msg, "utf-8")
-    secret_key_bytes = bytes.fromhex(secret_key)
-    secret_key_obj = ed25519.Ed25519PrivateKey.from_private_bytes(secret_key_bytes)
-
-    # Generate signature
-    signature_bytes = secret_key_obj.sign(request_string)
-    signature = signature_bytes.hex()
-
-    return signature
+    return get_signer(secret_key).sign(method, endpoint, params, epoch=epoch_time)
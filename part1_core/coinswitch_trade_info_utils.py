@@ -1,6 +1,6 @@
 # coinswitch_trade_info_utils.py
 
-import requests
+from coinswitch_http import http
 import logging
 import time
 from urllib.parse import urlencode
@@ -39,7 +39,7 @@ headers = {
 logging.info("Fetching Trade Info...")
 
 try:
-    response = requests.request(method, url, headers=headers, json=payload)
+    response = http.request(method, url, headers=headers, json=payload)
     logging.info(f"Status Code: {response.status_code}")
     if response.status_code == 200:
         logging.info("Trade Info fetched successfully!")
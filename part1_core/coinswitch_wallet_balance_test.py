@@ -1,4 +1,4 @@
-import requests
+from coinswitch_http import http
 import json
 import time
 import hmac
@@ -42,7 +42,7 @@ headers = {
 # Make request
 try:
     logging.info("Sending Wallet Balance request...")
-    response = requests.request("GET", url, headers=headers)
+    response = http.request("GET", url, headers=headers)
     logging.info(f"Status Code: {response.status_code}")
 
     if response.status_code == 200:
@@ -1,6 +1,6 @@
 # coinswitch_wallet_balance_utils.py
 
-import requests
+from coinswitch_http import http
 import logging
 import time
 import json
@@ -32,7 +32,7 @@ def get_wallet_balance():
 
     try:
         logging.info("Sending Wallet Balance request...")
-        response = requests.request(method, url, headers=headers, json=payload)
+        response = http.request(method, url, headers=headers, json=payload)
         logging.info(f"Status Code: {response.status_code}")
 
         if response.status_code == 200:
@@ -0,0 +1,51 @@
+# part1_core/coinswitch_ws_hub.py
+"""Run the shared market-data hub for many pairs over a single socket.
+
+Usage:
+    python coinswitch_ws_hub.py BTCUSDT ETHUSDT ... [--streams ticker,trades]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.append(BASE_DIR)
+
+from services.market_data_hub import MarketDataHub, StreamType  # noqa: E402
+
+STREAM_NAMES = {
+    "ticker": StreamType.TICKER,
+    "orderbook": StreamType.ORDER_BOOK,
+    "trades": StreamType.TRADES,
+    "candles": StreamType.CANDLES,
+}
+
+
+def print_update(update):
+    print(f"[{update.stream.name}] {update.pair}: {json.dumps(update.data, separators=(',', ':'))}")
+
+
+def run(pairs, streams=None, callback=print_update, candle_interval=5):
+    hub = MarketDataHub(pairs=pairs, streams=streams, candle_interval=candle_interval)
+    for stream in streams or StreamType:
+        hub.add_callback(stream, callback)
+    print(f"[INFO] Streaming {len(hub.pairs)} pairs over one socket. Press CTRL+C to exit.")
+    hub.run_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coinswitch multiplexed market-data stream")
+    parser.add_argument("pairs", nargs="*", default=["BTCUSDT"])
+    parser.add_argument("--streams", default=",".join(STREAM_NAMES))
+    parser.add_argument("--candle-interval", type=int, default=5)
+    args = parser.parse_args()
+
+    streams = [STREAM_NAMES[name.strip()] for name in args.streams.split(",") if name.strip()]
+    run(args.pairs, streams, candle_interval=args.candle_interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,19 +2,134 @@
 
 import requests
 import json
-import time
 import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 load_dotenv()
 
 BINANCE_FUTURES_API_URL = "https://fapi.binance.com/fapi/v1/ticker/24hr"
-
-
-def fetch_futures_data():
-    symbols_file = os.path.expanduser("~/CryptoFuturesBot/part1_core/symbols.json")
-    output_file = os.path.expanduser("~/CryptoFuturesBot/part1_core/futures_data.json")
-
+SYMBOLS_FILE = os.path.expanduser("~/CryptoFuturesBot/part1_core/symbols.json")
+OUTPUT_FILE = os.path.expanduser("~/CryptoFuturesBot/part1_core/futures_data.json")
+
+# Binance allows 2400 request weight per minute; ticker/24hr for one symbol
+# costs 1 (40 for the all-symbols call), so 20 req/s leaves headroom for
+# the rest of the bot.
+MAX_WORKERS = 16
+REQUESTS_PER_SECOND = 20.0
+BULK_TICKER_WEIGHT = 40
+MAX_RETRIES = 3
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, weight=1):
+        """Block until weight tokens are available.
+
+        A weight above capacity waits for a full bucket and leaves it in
+        debt, so later callers wait until the excess has been repaid.
+        """
+        needed = min(weight, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._tokens >= needed:
+                    self._tokens -= weight
+                    return
+                wait = (needed - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _parse_ticker(symbol, data):
+    return {
+        "symbol": symbol,
+        "priceChangePercent": float(data.get("priceChangePercent", 0)),
+        "lastPrice": float(data.get("lastPrice", 0)),
+        "highPrice": float(data.get("highPrice", 0)),
+        "lowPrice": float(data.get("lowPrice", 0)),
+        "volume": float(data.get("volume", 0)),
+        "quoteVolume": float(data.get("quoteVolume", 0)),
+    }
+
+
+def fetch_symbol(session, api_url, symbol, limiter, retries=MAX_RETRIES, timeout=10):
+    """Fetch one symbol's 24hr ticker, retrying with backoff. Returns None on failure."""
+    for attempt in range(retries):
+        try:
+            limiter.acquire()
+            response = session.get(api_url, params={"symbol": symbol}, timeout=timeout)
+            response.raise_for_status()
+            return _parse_ticker(symbol, response.json())
+        except Exception as e:
+            if attempt == retries - 1:
+                print(f"[ERROR] Failed to fetch data for {symbol}: {e}")
+                return None
+            time.sleep(0.5 * 2**attempt)
+    return None
+
+
+def fetch_all_tickers(session, api_url, limiter, timeout=10):
+    """Fetch every symbol's 24hr ticker in one request. Returns {} on failure."""
+    try:
+        limiter.acquire(BULK_TICKER_WEIGHT)
+        response = session.get(api_url, timeout=timeout)
+        response.raise_for_status()
+        return {
+            item["symbol"]: _parse_ticker(item["symbol"], item)
+            for item in response.json()
+            if isinstance(item, dict) and "symbol" in item
+        }
+    except Exception as e:
+        print(f"[WARN] Bulk ticker request failed, falling back to per-symbol: {e}")
+        return {}
+
+
+def _default_file_mode():
+    """Mode open() would give a new file under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def write_json_atomic(path, data):
+    """Write JSON to a temp file in the same directory, then rename over path."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=4)
+        os.replace(tmp_path, path)
+        # mkstemp creates 0600 files; restore the usual permissions
+        os.chmod(path, _default_file_mode())
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
+def fetch_futures_data(
+    symbols_file=SYMBOLS_FILE,
+    output_file=OUTPUT_FILE,
+    api_url=BINANCE_FUTURES_API_URL,
+    max_workers=MAX_WORKERS,
+    requests_per_second=REQUESTS_PER_SECOND,
+    retries=MAX_RETRIES,
+):
     if not os.path.exists(symbols_file):
         print("[ERROR] symbols.json not found! Run symbol_loader first.")
         return
@@ -23,42 +138,37 @@ def fetch_futures_data():
         symbols = json.load(f)
 
     print(f"[INFO] Fetching futures data for {len(symbols)} symbols...")
-
-    all_data = []
-    for symbol in symbols:
-        try:
-            params = {"symbol": symbol}
-            response = requests.get(BINANCE_FUTURES_API_URL, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            # Extract required fields
-            futures_info = {
-                "symbol": symbol,
-                "priceChangePercent": float(data.get("priceChangePercent", 0)),
-                "lastPrice": float(data.get("lastPrice", 0)),
-                "highPrice": float(data.get("highPrice", 0)),
-                "lowPrice": float(data.get("lowPrice", 0)),
-                "volume": float(data.get("volume", 0)),
-                "quoteVolume": float(data.get("quoteVolume", 0)),
-            }
-
-            all_data.append(futures_info)
-            print(f"[SUCCESS] {symbol} data fetched.")
-
-            # Sleep to avoid rate limits
-            time.sleep(0.1)
-
-        except Exception as e:
-            print(f"[ERROR] Failed to fetch data for {symbol}: {e}")
+    started = time.monotonic()
+
+    limiter = TokenBucket(requests_per_second)
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    with session:
+        tickers = fetch_all_tickers(session, api_url, limiter)
+        missing = [symbol for symbol in symbols if symbol not in tickers]
+        if missing:
+            print(f"[INFO] {len(missing)} symbols missing from bulk response, fetching individually...")
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = pool.map(
+                    lambda symbol: fetch_symbol(session, api_url, symbol, limiter, retries),
+                    missing,
+                )
+                for symbol, item in zip(missing, results):
+                    if item is not None:
+                        tickers[symbol] = item
+        all_data = [tickers[symbol] for symbol in symbols if symbol in tickers]
 
     # Save data
-    with open(output_file, "w") as f:
-        json.dump(all_data, f, indent=4)
+    write_json_atomic(output_file, all_data)
 
     print(
-        f"[SUCCESS] Futures data saved to futures_data.json ({len(all_data)} symbols)."
+        f"[SUCCESS] Futures data saved to futures_data.json ({len(all_data)} symbols) "
+        f"in {time.monotonic() - started:.1f}s."
     )
+    return all_data
 
 
 if __name__ == "__main__":
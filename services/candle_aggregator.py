@@ -0,0 +1,162 @@
+"""
+Streaming OHLCV candle aggregator
+
+Builds bars for several intervals per symbol from the trade stream in a
+single pass, storing them in bounded CandleRingBuffers. The in-progress bar
+is updated in place on each trade, and a bar-close event fires when a trade
+(or close_due) moves past the end of a bar.
+"""
+
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from services.market_buffer import CandleRingBuffer
+from utils.logging_setup import LoggerMixin
+
+INTERVAL_SECONDS = {
+    "1s": 1,
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "1h": 3600,
+}
+
+
+@dataclass(slots=True)
+class BarClose:
+    """A completed OHLCV bar"""
+    symbol: str
+    interval: str
+    open_time: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    trades: int
+
+
+BarCloseCallback = Callable[[BarClose], None]
+
+
+class _OpenBar:
+    __slots__ = ("open_time", "open", "high", "low", "close", "volume", "trades", "closed")
+
+    def __init__(self, open_time: int, price: float, quantity: float):
+        self.open_time = open_time
+        self.open = self.high = self.low = self.close = price
+        self.volume = quantity
+        self.trades = 1
+        self.closed = False
+
+    def add(self, price: float, quantity: float) -> None:
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += quantity
+        self.trades += 1
+
+    def as_tuple(self) -> Tuple:
+        return (self.open_time, self.open, self.high, self.low, self.close, self.volume, self.trades)
+
+
+class CandleAggregator(LoggerMixin):
+    """Multi-interval OHLCV bars per symbol built from trades"""
+
+    def __init__(self, intervals: Iterable[str] = tuple(INTERVAL_SECONDS), capacity: int = 1000):
+        """
+        Initialize candle aggregator
+
+        Args:
+            intervals: Interval names from INTERVAL_SECONDS
+            capacity: Bars retained per symbol and interval
+        """
+        unknown = [name for name in intervals if name not in INTERVAL_SECONDS]
+        if unknown:
+            raise ValueError(f"Unsupported candle intervals: {unknown}")
+
+        self.intervals: List[Tuple[str, int]] = [(name, INTERVAL_SECONDS[name]) for name in intervals]
+        self.capacity = capacity
+        self._buffers: Dict[Tuple[str, str], CandleRingBuffer] = {}
+        self._open: Dict[Tuple[str, str], _OpenBar] = {}
+        self._callbacks: List[BarCloseCallback] = []
+        self._lock = Lock()
+        self.late_trades = 0
+
+    def on_bar_close(self, callback: BarCloseCallback) -> None:
+        """Register a callback fired for every closed bar"""
+        self._callbacks.append(callback)
+
+    def buffer(self, symbol: str, interval: str) -> Optional[CandleRingBuffer]:
+        """Bar buffer for a symbol/interval (in-progress bar included)"""
+        return self._buffers.get((symbol, interval))
+
+    def add(self, symbol: str, price: float, quantity: float, timestamp: int) -> List[BarClose]:
+        """
+        Add one trade to every interval
+
+        Args:
+            symbol: Trading symbol
+            price: Trade price
+            quantity: Trade quantity
+            timestamp: Trade time in epoch seconds
+
+        Returns:
+            Bars closed by this trade
+        """
+        closed = []
+        timestamp = int(timestamp)
+        with self._lock:
+            for interval, seconds in self.intervals:
+                key = (symbol, interval)
+                open_time = timestamp - timestamp % seconds
+                bar = self._open.get(key)
+
+                if bar is not None and open_time == bar.open_time and not bar.closed:
+                    bar.add(price, quantity)
+                elif bar is not None and open_time <= bar.open_time:
+                    # Belongs to a bar that has already closed
+                    self.late_trades += 1
+                    continue
+                else:
+                    if bar is not None and not bar.closed:
+                        closed.append(self._close(symbol, interval, bar))
+                    bar = self._open[key] = _OpenBar(open_time, price, quantity)
+
+                buffer = self._buffers.get(key)
+                if buffer is None:
+                    buffer = self._buffers[key] = CandleRingBuffer(self.capacity)
+                buffer.upsert(*bar.as_tuple())
+
+        self._emit(closed)
+        return closed
+
+    def add_trade(self, trade) -> List[BarClose]:
+        """Add a TradeData record"""
+        return self.add(trade.symbol, trade.price, trade.quantity, trade.timestamp)
+
+    def close_due(self, now: float) -> List[BarClose]:
+        """Close every open bar whose interval ended before now (quiet markets)"""
+        closed = []
+        with self._lock:
+            for (symbol, interval), bar in self._open.items():
+                if not bar.closed and bar.open_time + INTERVAL_SECONDS[interval] <= now:
+                    bar.closed = True
+                    closed.append(self._close(symbol, interval, bar))
+        self._emit(closed)
+        return closed
+
+    @staticmethod
+    def _close(symbol: str, interval: str, bar: _OpenBar) -> BarClose:
+        return BarClose(symbol, interval, *bar.as_tuple())
+
+    def _emit(self, closed: List[BarClose]) -> None:
+        for event in closed:
+            for callback in self._callbacks:
+                try:
+                    callback(event)
+                except Exception as e:
+                    self.logger.error(f"Bar close callback error for {event.symbol} {event.interval}: {e}")
@@ -4,22 +4,34 @@ Handles real-time market data and WebSocket connections
 """
 
 import asyncio
+import bisect
 import json
 import logging
+import random
 import time
 import websocket
-from typing import Dict, Any, Optional, Callable, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Callable, Iterable, List, Tuple
 from dataclasses import dataclass
 from threading import Thread, Event
-import requests
+import numpy as np
 
+from core.http_transport import HttpTransport, get_transport
 from utils.logging_setup import LoggerMixin
 from utils.error_handler import retry, handle_exceptions
+from services.candle_aggregator import INTERVAL_SECONDS, CandleAggregator
+from services.ingest_queue import IngestQueue
+from services.market_buffer import (
+    CANDLE_DTYPE, MarketDataBuffers, PriceRingBuffer, TradeRingBuffer, TRADE_DTYPE, encode_side
+)
+from services.message_decoder import MessageDecoder
+from services.order_book import LocalOrderBook
+from services.order_book_features import OrderBookFeatureStage
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketData:
     """Market data structure"""
     symbol: str
@@ -32,16 +44,19 @@ class MarketData:
     change_pct_24h: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderBookData:
     """Order book data structure"""
     symbol: str
     bids: List[List[float]]  # [price, quantity]
     asks: List[List[float]]  # [price, quantity]
     timestamp: int
+    sequence: Optional[int] = None
+    prev_sequence: Optional[int] = None
+    is_snapshot: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeData:
     """Trade data structure"""
     symbol: str
@@ -55,26 +70,78 @@ class TradeData:
 class LiveDataFeed(LoggerMixin):
     """Live data feed manager"""
     
-    def __init__(self, api_base_url: str = "https://api.coinswitch.co"):
+    BULK_TICKER_PATH = "/trade/api/v2/24hr/all-pairs/ticker"
+    BULK_TICKER_PARAMS = {"exchange": "coinswitchx"}
+    RECENT_TRADES_PATH = "/trade/api/v2/trades"
+    FALLBACK_WORKERS = 8
+    RECONNECT_BASE_DELAY = 0.5
+    RECONNECT_MAX_DELAY = 30.0
+    SUBSCRIBE_BATCH_SIZE = 50
+    DOWNTIME_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+    
+    def __init__(self, api_base_url: str = "https://api.coinswitch.co",
+                 history_capacity: int = 1024,
+                 http: Optional[HttpTransport] = None,
+                 dispatch_workers: int = 4,
+                 ingest_queue_size: int = 10000,
+                 json_backend: str = "auto",
+                 trade_capacity: int = 1024,
+                 book_feature_levels: int = 10,
+                 book_target_notional: float = 10000.0,
+                 candle_intervals: Iterable[str] = tuple(INTERVAL_SECONDS),
+                 candle_capacity: int = 1000,
+                 bar_close_interval: float = 1.0):
         """
         Initialize data feed
         
         Args:
             api_base_url: Base URL for REST API
+            history_capacity: Ticks of price/volume history kept per symbol
+            http: Pooled HTTP transport (shared transport by default)
+            dispatch_workers: Threads running subscriber callbacks
+            ingest_queue_size: Updates buffered for callbacks before dropping
+            json_backend: JSON decoder ("msgspec", "orjson", "json" or "auto")
+            trade_capacity: Trades kept per symbol in the columnar trade ring
+            book_feature_levels: Order-book levels per side used for features
+            book_target_notional: Quote amount for the slippage-adjusted fill price
+            candle_intervals: OHLCV intervals aggregated from the trade stream
+            candle_capacity: Bars kept per symbol and interval
+            bar_close_interval: Seconds between checks that close bars with no new trades
         """
         self.api_base_url = api_base_url
+        self.http = http or get_transport()
+        self.decoder = MessageDecoder(json_backend)
         self.ws_url = "wss://api.coinswitch.co/ws"
         self.ws_connection = None
         self.is_connected = False
         self.subscriptions = set()
         self.callbacks = {}
+        self.ingest_queue = IngestQueue(
+            self._trigger_callbacks, maxsize=ingest_queue_size, workers=dispatch_workers
+        )
         self.stop_event = Event()
         self.ws_thread = None
+        self.gap_fill_thread = None
+        self.bar_clock_thread = None
+        self.bar_close_interval = bar_close_interval
+        
+        # Reconnect supervision
+        self.reconnect_attempt = 0
+        self.reconnect_count = 0
+        self.has_connected = False
+        self.disconnected_at: Optional[float] = None
+        self.gap_filling = False
+        self.total_downtime = 0.0
+        self.downtime_histogram = [0] * (len(self.DOWNTIME_BUCKETS) + 1)
         
         # Data storage
         self.latest_prices = {}
-        self.order_books = {}
-        self.recent_trades = {}
+        self.local_books: Dict[str, LocalOrderBook] = {}
+        self._book_resyncs = set()
+        self.book_features = OrderBookFeatureStage(book_feature_levels, book_target_notional)
+        self.recent_trades = MarketDataBuffers(trade_capacity, buffer_factory=TradeRingBuffer)
+        self.candles = CandleAggregator(candle_intervals, candle_capacity)
+        self.price_buffers = MarketDataBuffers(history_capacity)
     
     @handle_exceptions()
     def get_live_price(self, symbol: str = "BTCUSDT") -> Optional[float]:
@@ -108,10 +175,10 @@ class LiveDataFeed(LoggerMixin):
             url = f"{self.api_base_url}/v2/price"
             params = {"symbol": symbol}
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.get(url, params=params)
             response.raise_for_status()
             
-            data = response.json()
+            data = self.decoder.loads(response.content)
             price = float(data.get('price', 0))
             
             # Update local cache
@@ -143,10 +210,10 @@ class LiveDataFeed(LoggerMixin):
             url = f"{self.api_base_url}/v2/ticker"
             params = {"symbol": symbol}
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.get(url, params=params)
             response.raise_for_status()
             
-            data = response.json()
+            data = self.decoder.loads(response.content)
             
             market_data = MarketData(
                 symbol=symbol,
@@ -161,6 +228,7 @@ class LiveDataFeed(LoggerMixin):
             
             # Update local cache
             self.latest_prices[symbol] = market_data
+            self._record_tick(market_data)
             
             return market_data
             
@@ -168,11 +236,105 @@ class LiveDataFeed(LoggerMixin):
             self.logger.error(f"Failed to get market data for {symbol}: {e}")
             return None
     
+    @handle_exceptions()
+    def get_all_tickers(self, symbols: Optional[Iterable[str]] = None) -> Dict[str, MarketData]:
+        """
+        Get market data for every pair with a single bulk ticker request
+        
+        Args:
+            symbols: Symbols that must be present; any missing from the bulk
+                response are fetched individually in parallel
+            
+        Returns:
+            Dictionary of symbol to MarketData
+        """
+        wanted = list(dict.fromkeys(symbols)) if symbols is not None else None
+        tickers = self._fetch_bulk_tickers(wanted or ())
+        
+        if wanted is not None:
+            missing = [symbol for symbol in wanted if symbol not in tickers]
+            if missing:
+                self.logger.debug(f"Bulk ticker missing {len(missing)} symbols, fetching individually")
+                with ThreadPoolExecutor(max_workers=min(self.FALLBACK_WORKERS, len(missing))) as pool:
+                    for symbol, market_data in zip(missing, pool.map(self.get_market_data, missing)):
+                        if market_data:
+                            tickers[symbol] = market_data
+            tickers = {symbol: tickers[symbol] for symbol in wanted if symbol in tickers}
+        
+        return tickers
+    
+    def _fetch_bulk_tickers(self, tracked: Iterable[str] = ()) -> Dict[str, MarketData]:
+        """
+        Fetch and parse the all-pairs ticker map
+        
+        Only tracked and subscribed symbols update latest_prices and the
+        rolling history; the other pairs are returned without being buffered.
+        
+        Args:
+            tracked: Symbols requested by the caller
+            
+        Returns:
+            Dictionary of symbol to MarketData for every pair in the response
+        """
+        try:
+            url = f"{self.api_base_url}{self.BULK_TICKER_PATH}"
+            response = self.http.get(url, params=self.BULK_TICKER_PARAMS)
+            response.raise_for_status()
+            
+            data = self.decoder.loads(response.content)
+            if isinstance(data, dict) and isinstance(data.get('data'), dict):
+                data = data['data']
+            
+            now = int(time.time())
+            tickers = {}
+            for symbol, item in data.items():
+                if isinstance(item, dict):
+                    tickers[symbol] = self._parse_bulk_ticker(symbol, item, now)
+            
+            tracked = set(tracked)
+            tracked.update(self._subscribed_symbols())
+            for symbol in tracked:
+                market_data = tickers.get(symbol)
+                if market_data is not None:
+                    self.latest_prices[symbol] = market_data
+                    self._record_tick(market_data)
+            
+            return tickers
+            
+        except Exception as e:
+            self.logger.error(f"Bulk ticker fetch failed: {e}")
+            return {}
+    
+    @staticmethod
+    def _parse_bulk_ticker(symbol: str, item: Dict[str, Any], now: int) -> MarketData:
+        """Convert one entry of the all-pairs ticker map to MarketData"""
+        def _num(key):
+            value = item.get(key)
+            return float(value) if value not in (None, "") else None
+        
+        price = _num('lastPrice') or 0.0
+        open_price = _num('openPrice')
+        at = item.get('at')
+        
+        return MarketData(
+            symbol=symbol,
+            price=price,
+            volume=_num('baseVolume') or 0.0,
+            timestamp=int(at) // 1000 if at else now,
+            bid=_num('bidPrice'),
+            ask=_num('askPrice'),
+            change_24h=price - open_price if open_price else None,
+            change_pct_24h=_num('percentageChange')
+        )
+    
     @handle_exceptions()
     def get_order_book(self, symbol: str, depth: int = 20) -> Optional[OrderBookData]:
         """
         Get order book data for a symbol
         
+        Served from the local book when it is in sync, otherwise fetched via
+        REST and used to (re)seed the local book.
+        
         Args:
             symbol: Trading symbol
             depth: Order book depth
@@ -180,31 +342,93 @@ class LiveDataFeed(LoggerMixin):
         Returns:
             OrderBookData object or None
         """
+        book = self.local_books.get(symbol)
+        if book is not None and not book.needs_resync:
+            return book.to_order_book_data(depth)
+        
+        if not self.resync_order_book(symbol, depth):
+            return None
+        return self.local_books[symbol].to_order_book_data(depth)
+    
+    def _fetch_order_book_rest(self, symbol: str, depth: int = 20) -> Optional[OrderBookData]:
+        """Fetch an order book snapshot via REST"""
         try:
             url = f"{self.api_base_url}/v2/orderbook"
             params = {"symbol": symbol, "depth": depth}
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.get(url, params=params)
             response.raise_for_status()
             
-            data = response.json()
+            data = self.decoder.loads(response.content)
             
-            order_book = OrderBookData(
+            return OrderBookData(
                 symbol=symbol,
                 bids=data.get('bids', []),
                 asks=data.get('asks', []),
-                timestamp=int(time.time())
+                timestamp=int(time.time()),
+                sequence=data.get('sequence', data.get('lastUpdateId'))
             )
             
-            # Update local cache
-            self.order_books[symbol] = order_book
-            
-            return order_book
-            
         except Exception as e:
             self.logger.error(f"Failed to get order book for {symbol}: {e}")
             return None
     
+    def get_local_book(self, symbol: str) -> LocalOrderBook:
+        """Get the local L2 book for a symbol, creating it on first use"""
+        book = self.local_books.get(symbol)
+        if book is None:
+            book = self.local_books.setdefault(symbol, LocalOrderBook(symbol))
+        return book
+    
+    def resync_order_book(self, symbol: str, depth: int = 100, attempts: int = 5,
+                          retry_delay: float = 0.5) -> bool:
+        """
+        Reseed the local book from a REST snapshot
+        
+        A snapshot older than the buffered deltas (REST lagging the stream)
+        cannot be joined to them, so it is refetched after a short delay.
+        
+        Args:
+            symbol: Trading symbol
+            depth: Snapshot depth
+            attempts: Snapshots fetched before giving up
+            retry_delay: Seconds between attempts (grows linearly)
+            
+        Returns:
+            True if the book is in sync afterwards
+        """
+        book = self.get_local_book(symbol)
+        for attempt in range(1, attempts + 1):
+            snapshot = self._fetch_order_book_rest(symbol, depth)
+            if snapshot is not None:
+                if book.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.sequence, snapshot.timestamp):
+                    self.book_features.update(book)
+                    self.logger.info(f"Order book resynced for {symbol} at sequence {book.sequence}")
+                    return True
+                self.logger.warning(
+                    f"Order book snapshot for {symbol} at sequence {snapshot.sequence} does not reach "
+                    f"buffered deltas (oldest {book.oldest_pending_sequence()}); retrying"
+                )
+            if attempt < attempts and self.stop_event.wait(retry_delay * attempt):
+                break
+        
+        self.logger.error(f"Order book resync failed for {symbol} after {attempts} attempts")
+        return False
+    
+    def _schedule_book_resync(self, symbol: str):
+        """Resync a book from REST off the socket thread, once at a time"""
+        if symbol in self._book_resyncs:
+            return
+        self._book_resyncs.add(symbol)
+        
+        def worker():
+            try:
+                self.resync_order_book(symbol)
+            finally:
+                self._book_resyncs.discard(symbol)
+        
+        Thread(target=worker, daemon=True).start()
+    
     def start_websocket(self) -> bool:
         """
         Start WebSocket connection for real-time data
@@ -218,6 +442,8 @@ class LiveDataFeed(LoggerMixin):
                 return True
             
             self.stop_event.clear()
+            self.ingest_queue.start()
+            self.start_bar_clock()
             self.ws_thread = Thread(target=self._websocket_worker, daemon=True)
             self.ws_thread.start()
             
@@ -247,42 +473,97 @@ class LiveDataFeed(LoggerMixin):
             if self.ws_thread and self.ws_thread.is_alive():
                 self.ws_thread.join(timeout=5)
             
+            if self.bar_clock_thread and self.bar_clock_thread.is_alive():
+                self.bar_clock_thread.join(timeout=5)
+            
+            self.ingest_queue.stop()
+            
             self.logger.info("WebSocket disconnected")
             
         except Exception as e:
             self.logger.error(f"Error stopping WebSocket: {e}")
     
+    def start_bar_clock(self):
+        """Close bars on wall-clock time so illiquid symbols don't wait for their next trade"""
+        if self.bar_clock_thread and self.bar_clock_thread.is_alive():
+            return
+        self.bar_clock_thread = Thread(target=self._bar_clock_worker, daemon=True)
+        self.bar_clock_thread.start()
+    
+    def _bar_clock_worker(self):
+        while not self.stop_event.wait(self.bar_close_interval):
+            if self.disconnected_at is not None or self.gap_filling:
+                # Trades for the outage are still to be backfilled
+                continue
+            try:
+                self.candles.close_due(time.time())
+            except Exception as e:
+                self.logger.error(f"Bar clock error: {e}")
+    
     def _websocket_worker(self):
-        """WebSocket worker thread"""
-        try:
-            self.ws_connection = websocket.WebSocketApp(
-                self.ws_url,
-                on_open=self._on_ws_open,
-                on_message=self._on_ws_message,
-                on_error=self._on_ws_error,
-                on_close=self._on_ws_close
-            )
-            
-            self.ws_connection.run_forever()
+        """WebSocket supervisor: reconnects with jittered exponential backoff"""
+        while not self.stop_event.is_set():
+            try:
+                self.ws_connection = websocket.WebSocketApp(
+                    self.ws_url,
+                    on_open=self._on_ws_open,
+                    on_message=self._on_ws_message,
+                    on_error=self._on_ws_error,
+                    on_close=self._on_ws_close
+                )
+                
+                self.ws_connection.run_forever()
+                
+            except Exception as e:
+                self.logger.error(f"WebSocket worker error: {e}")
             
-        except Exception as e:
-            self.logger.error(f"WebSocket worker error: {e}")
             self.is_connected = False
+            if self.gap_fill_thread and self.gap_fill_thread.is_alive():
+                self.gap_fill_thread.join()
+            if self.stop_event.is_set():
+                break
+            
+            if self.has_connected and self.disconnected_at is None:
+                self.disconnected_at = time.time()
+            delay = self._reconnect_delay(self.reconnect_attempt)
+            self.reconnect_attempt += 1
+            self.logger.info(
+                f"Attempting WebSocket reconnection in {delay:.2f}s (attempt {self.reconnect_attempt})"
+            )
+            self.stop_event.wait(delay)
+    
+    def _reconnect_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff, capped at RECONNECT_MAX_DELAY"""
+        ceiling = min(self.RECONNECT_MAX_DELAY, self.RECONNECT_BASE_DELAY * (2 ** attempt))
+        return random.uniform(ceiling / 2, ceiling)
     
     def _on_ws_open(self, ws):
         """WebSocket open handler"""
         self.logger.info("WebSocket connection opened")
         self.is_connected = True
+        self.has_connected = True
+        self.reconnect_attempt = 0
         
-        # Re-subscribe to all channels
-        for subscription in self.subscriptions:
-            self._send_subscription(subscription)
+        if self.disconnected_at is not None:
+            now = time.time()
+            since = self.disconnected_at
+            self._record_downtime(now - since)
+            self.reconnect_count += 1
+            # Backfill first; the gap-fill thread resubscribes when done so
+            # backfilled trades stay ahead of the new stream in the rings
+            self.gap_filling = True
+            self.disconnected_at = None
+            self._start_gap_fill(since, now)
+            return
+        
+        self._send_subscriptions(sorted(self.subscriptions))
     
     def _on_ws_message(self, ws, message):
         """WebSocket message handler"""
         try:
-            data = json.loads(message)
-            self._process_ws_message(data)
+            decoded = self.decoder.decode_ws_message(message)
+            if decoded:
+                self._apply_update(*decoded)
             
         except Exception as e:
             self.logger.error(f"WebSocket message processing error: {e}")
@@ -293,76 +574,195 @@ class LiveDataFeed(LoggerMixin):
         self.is_connected = False
     
     def _on_ws_close(self, ws, close_status_code, close_msg):
-        """WebSocket close handler"""
+        """WebSocket close handler; reconnection is driven by _websocket_worker"""
         self.logger.info(f"WebSocket closed: {close_status_code} - {close_msg}")
         self.is_connected = False
-        
-        # Attempt reconnection if not intentionally stopped
-        if not self.stop_event.is_set():
-            self.logger.info("Attempting WebSocket reconnection...")
-            time.sleep(5)
-            self._websocket_worker()
+        if not self.stop_event.is_set() and self.has_connected and self.disconnected_at is None:
+            self.disconnected_at = time.time()
     
-    def _process_ws_message(self, data: Dict[str, Any]):
-        """Process incoming WebSocket message"""
+    def _record_downtime(self, seconds: float):
+        """Add one outage to the downtime histogram"""
+        self.total_downtime += seconds
+        self.downtime_histogram[bisect.bisect_left(self.DOWNTIME_BUCKETS, seconds)] += 1
+    
+    def _subscribed_symbols(self) -> List[str]:
+        return sorted({subscription.split(":", 1)[1] for subscription in self.subscriptions})
+    
+    def _start_gap_fill(self, since: float, until: float):
+        """Backfill subscribed symbols via REST off the socket thread, then resubscribe"""
+        self.gap_fill_thread = Thread(
+            target=self._fill_gap, args=(self._subscribed_symbols(), since, until), daemon=True
+        )
+        self.gap_fill_thread.start()
+    
+    def _fill_gap(self, symbols: List[str], since: float, until: float):
+        """
+        Backfill the outage window for each symbol, then resubscribe
+        
+        Trades executed between since and until are fetched via REST and
+        appended to the trade ring, the candle aggregator and the price
+        history, followed by a fresh ticker per symbol.
+        
+        Args:
+            symbols: Subscribed symbols
+            since: Time the connection dropped (epoch seconds)
+            until: Time the connection was re-established (epoch seconds)
+        """
         try:
-            msg_type = data.get('type', '')
-            symbol = data.get('symbol', '')
-            
-            if msg_type == 'ticker':
-                # Process ticker data
-                market_data = MarketData(
-                    symbol=symbol,
-                    price=float(data.get('price', 0)),
-                    volume=float(data.get('volume', 0)),
-                    timestamp=int(time.time()),
-                    change_24h=float(data.get('change', 0)) if data.get('change') else None,
-                    change_pct_24h=float(data.get('changePercent', 0)) if data.get('changePercent') else None
-                )
-                
-                self.latest_prices[symbol] = market_data
-                
-                # Call registered callbacks
-                self._trigger_callbacks('ticker', symbol, market_data)
-                
-            elif msg_type == 'orderbook':
-                # Process order book data
-                order_book = OrderBookData(
-                    symbol=symbol,
-                    bids=data.get('bids', []),
-                    asks=data.get('asks', []),
-                    timestamp=int(time.time())
-                )
-                
-                self.order_books[symbol] = order_book
-                self._trigger_callbacks('orderbook', symbol, order_book)
+            if symbols:
+                with ThreadPoolExecutor(max_workers=min(self.FALLBACK_WORKERS, len(symbols))) as pool:
+                    trades = list(pool.map(lambda symbol: self._fetch_recent_trades(symbol, since, until), symbols))
+                backfilled = 0
+                failed = []
+                for symbol, symbol_trades in zip(symbols, trades):
+                    if symbol_trades is None:
+                        failed.append(symbol)
+                    else:
+                        backfilled += self._backfill_trades(symbol, symbol_trades)
                 
-            elif msg_type == 'trade':
-                # Process trade data
-                trade_data = TradeData(
-                    symbol=symbol,
-                    price=float(data.get('price', 0)),
-                    quantity=float(data.get('quantity', 0)),
-                    side=data.get('side', ''),
-                    timestamp=int(time.time()),
-                    trade_id=data.get('id')
+                tickers = self.get_all_tickers(symbols) or {}
+                failed.extend(symbol for symbol in symbols if symbol not in tickers and symbol not in failed)
+                if failed:
+                    self.logger.warning(f"Gap fill failed for {len(failed)} symbols: {failed[:5]}")
+                self.logger.info(
+                    f"Gap filled {len(symbols) - len(failed)}/{len(symbols)} symbols with "
+                    f"{backfilled} trades over {until - since:.1f}s"
                 )
-                
-                # Store recent trades
-                if symbol not in self.recent_trades:
-                    self.recent_trades[symbol] = []
-                
-                self.recent_trades[symbol].append(trade_data)
-                
-                # Keep only last 100 trades
-                if len(self.recent_trades[symbol]) > 100:
-                    self.recent_trades[symbol] = self.recent_trades[symbol][-100:]
-                
-                self._trigger_callbacks('trade', symbol, trade_data)
+        except Exception as e:
+            self.logger.error(f"Gap fill error: {e}")
+        finally:
+            self.gap_filling = False
+            self._send_subscriptions(sorted(self.subscriptions))
+    
+    def _fetch_recent_trades(self, symbol: str, since: float, until: float) -> Optional[List[TradeData]]:
+        """
+        Fetch recent trades for a symbol via REST
+        
+        Returns:
+            Trades with since <= timestamp < until in time order, or None on failure
+        """
+        try:
+            url = f"{self.api_base_url}{self.RECENT_TRADES_PATH}"
+            params = dict(self.BULK_TICKER_PARAMS, symbol=symbol)
+            response = self.http.get(url, params=params)
+            response.raise_for_status()
+            
+            data = self.decoder.loads(response.content)
+            if isinstance(data, dict):
+                data = data.get('data', [])
+            
+            trades = []
+            for item in data:
+                trade = self._parse_rest_trade(symbol, item)
+                if since * 1000 <= trade[0] < until * 1000:
+                    trades.append(trade)
+            trades.sort(key=lambda trade: trade[0])
+            return [trade[1] for trade in trades]
+            
+        except Exception as e:
+            self.logger.error(f"Recent trades fetch failed for {symbol}: {e}")
+            return None
+    
+    @staticmethod
+    def _parse_rest_trade(symbol: str, item: Dict[str, Any]) -> Tuple[int, TradeData]:
+        """Convert one REST trade (long or short field names) to (epoch ms, TradeData)"""
+        def _get(*keys):
+            for key in keys:
+                if item.get(key) is not None:
+                    return item[key]
+            return None
+        
+        at_ms = int(_get('timestamp', 'E', 'T') or 0)
+        side = _get('side')
+        if side is None:
+            # Buyer is maker: the aggressor sold
+            side = 'SELL' if item.get('m') else 'BUY'
+        return at_ms, TradeData(
+            symbol=symbol,
+            price=float(_get('price', 'p')),
+            quantity=float(_get('quantity', 'q') or 0),
+            side=str(side).upper(),
+            timestamp=at_ms // 1000,
+            trade_id=_get('id', 't')
+        )
+    
+    def _backfill_trades(self, symbol: str, trades: List[TradeData]) -> int:
+        """Append backfilled trades to the trade ring, candles and price history"""
+        if not trades:
+            return 0
+        volumes = self.get_volume_history(symbol, 1)
+        volume = float(volumes[-1]) if len(volumes) else 0.0
+        ring = self.recent_trades.get_or_create(symbol)
+        for trade in trades:
+            ring.append(trade.price, trade.quantity, encode_side(trade.side),
+                        trade.timestamp, trade.trade_id)
+            self.candles.add_trade(trade)
+            # The price ring's volume column holds the ticker volume; carry the last one
+            self.price_buffers.append(symbol, trade.price, volume, trade.timestamp)
+        return len(trades)
+    
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """
+        Reconnect counters and downtime histogram
+        
+        Returns:
+            Dictionary with connection state, reconnect count and downtime buckets
+        """
+        labels = [f"<={bound:g}s" for bound in self.DOWNTIME_BUCKETS]
+        labels.append(f">{self.DOWNTIME_BUCKETS[-1]:g}s")
+        return {
+            'connected': self.is_connected,
+            'reconnects': self.reconnect_count,
+            'current_attempt': self.reconnect_attempt,
+            'total_downtime_s': self.total_downtime,
+            'downtime_histogram': dict(zip(labels, self.downtime_histogram)),
+        }
+    
+    def _process_ws_message(self, data: Dict[str, Any]):
+        """Process an already-parsed WebSocket message"""
+        try:
+            decoded = self.decoder.record_from_dict(data)
+            if decoded:
+                self._apply_update(*decoded)
                 
         except Exception as e:
             self.logger.error(f"WebSocket message processing error: {e}")
     
+    def _apply_update(self, msg_type: str, symbol: str, record: Any):
+        """Store a decoded ticker/orderbook/trade record and notify subscribers"""
+        if msg_type == 'ticker':
+            self.latest_prices[symbol] = record
+            self._record_tick(record)
+            
+            # Call registered callbacks
+            self._dispatch('ticker', symbol, record)
+            
+        elif msg_type == 'orderbook':
+            book = self.get_local_book(symbol)
+            if record.is_snapshot:
+                if not book.apply_snapshot(record.bids, record.asks, record.sequence, record.timestamp):
+                    self._schedule_book_resync(symbol)
+            elif not book.apply_delta(record.bids, record.asks, record.sequence,
+                                      record.prev_sequence, record.timestamp) and book.needs_resync:
+                self._schedule_book_resync(symbol)
+            
+            if not book.needs_resync:
+                self.book_features.update(book)
+            
+            # Queued as the live book (cheap to conflate); callbacks receive
+            # an OrderBookData snapshot taken at dispatch time
+            self._dispatch('orderbook', symbol, book)
+            
+        elif msg_type == 'trade':
+            # Store recent trades in the fixed-size columnar ring
+            self.recent_trades.get_or_create(symbol).append(
+                record.price, record.quantity, encode_side(record.side),
+                record.timestamp, record.trade_id
+            )
+            self.candles.add_trade(record)
+            
+            self._dispatch('trade', symbol, record)
+    
     def subscribe_ticker(self, symbol: str, callback: Optional[Callable] = None):
         """Subscribe to ticker updates for a symbol"""
         subscription = f"ticker:{symbol}"
@@ -398,17 +798,34 @@ class LiveDataFeed(LoggerMixin):
     
     def _send_subscription(self, subscription: str):
         """Send subscription message to WebSocket"""
-        try:
-            if self.ws_connection and self.is_connected:
-                message = {
-                    "method": "SUBSCRIBE",
-                    "params": [subscription]
-                }
-                self.ws_connection.send(json.dumps(message))
-                self.logger.debug(f"Sent subscription: {subscription}")
-                
-        except Exception as e:
-            self.logger.error(f"Failed to send subscription {subscription}: {e}")
+        self._send_subscriptions([subscription])
+    
+    def _send_subscriptions(self, subscriptions: List[str]):
+        """Send subscriptions in batches of SUBSCRIBE_BATCH_SIZE per message"""
+        for start in range(0, len(subscriptions), self.SUBSCRIBE_BATCH_SIZE):
+            batch = subscriptions[start:start + self.SUBSCRIBE_BATCH_SIZE]
+            try:
+                if self.ws_connection and self.is_connected:
+                    message = {
+                        "method": "SUBSCRIBE",
+                        "params": batch
+                    }
+                    self.ws_connection.send(json.dumps(message))
+                    self.logger.debug(f"Sent {len(batch)} subscriptions")
+                    
+            except Exception as e:
+                self.logger.error(f"Failed to send subscriptions {batch[:3]}...: {e}")
+    
+    def _dispatch(self, data_type: str, symbol: str, data: Any):
+        """Hand an update to the ingest queue, or run callbacks inline if it is not running"""
+        if self.ingest_queue.running:
+            self.ingest_queue.put(data_type, symbol, data)
+        else:
+            self._trigger_callbacks(data_type, symbol, data)
+    
+    def get_ingest_stats(self) -> Dict[str, Any]:
+        """Ingest queue depth, drops, conflation and callback latency"""
+        return self.ingest_queue.stats()
     
     def _trigger_callbacks(self, data_type: str, symbol: str, data: Any):
         """Trigger registered callbacks for data updates"""
@@ -416,26 +833,121 @@ class LiveDataFeed(LoggerMixin):
             callback_key = f"{data_type}_{symbol}"
             if callback_key in self.callbacks:
                 callback = self.callbacks[callback_key]
+                if isinstance(data, LocalOrderBook):
+                    # The socket thread keeps mutating the book; copy under its lock
+                    data = data.to_order_book_data()
                 callback(data)
                 
         except Exception as e:
             self.logger.error(f"Callback error for {data_type}_{symbol}: {e}")
     
+    def _record_tick(self, market_data: MarketData):
+        """Append a ticker update to the symbol's rolling history"""
+        self.price_buffers.append(
+            market_data.symbol, market_data.price, market_data.volume, market_data.timestamp
+        )
+    
+    def get_price_buffer(self, symbol: str) -> Optional[PriceRingBuffer]:
+        """Get the rolling history buffer for a symbol"""
+        return self.price_buffers.get(symbol)
+    
+    def get_price_history(self, symbol: str, limit: Optional[int] = None) -> np.ndarray:
+        """
+        Get recent prices for a symbol as a zero-copy view
+        
+        Args:
+            symbol: Trading symbol
+            limit: Maximum number of prices (defaults to full history)
+            
+        Returns:
+            Prices oldest first; empty array if the symbol has no history
+        """
+        buffer = self.price_buffers.get(symbol)
+        if buffer is None:
+            return np.empty(0, dtype=np.float64)
+        return buffer.prices(limit)
+    
+    def get_price_snapshot(self, symbol: str, limit: Optional[int] = None) -> Tuple[np.ndarray, int]:
+        """
+        Get recent prices and the buffer sequence number read atomically
+        
+        Args:
+            symbol: Trading symbol
+            limit: Maximum number of prices (defaults to full history)
+            
+        Returns:
+            Tuple of (prices view, total ticks ever appended)
+        """
+        buffer = self.price_buffers.get(symbol)
+        if buffer is None:
+            return np.empty(0, dtype=np.float64), 0
+        return buffer.snapshot(limit)
+    
+    def get_volume_history(self, symbol: str, limit: Optional[int] = None) -> np.ndarray:
+        """Get recent volumes for a symbol as a zero-copy view"""
+        buffer = self.price_buffers.get(symbol)
+        if buffer is None:
+            return np.empty(0, dtype=np.float64)
+        return buffer.volumes(limit)
+    
+    def get_candles(self, symbol: str, interval: str = "1m", limit: Optional[int] = None) -> np.ndarray:
+        """
+        Get OHLCV bars built from the trade stream as a zero-copy view
+        
+        Args:
+            symbol: Trading symbol
+            interval: Bar interval (1s, 1m, 5m, 15m, 1h)
+            limit: Maximum number of bars, oldest first; the last bar may still be open
+            
+        Returns:
+            Structured array with open_time, open, high, low, close, volume and trades
+        """
+        buffer = self.candles.buffer(symbol, interval)
+        if buffer is None:
+            return np.empty(0, dtype=CANDLE_DTYPE)
+        return buffer.bars(limit)
+    
+    def get_book_indicators(self, symbol: str) -> Dict[str, Any]:
+        """
+        Latest order-book features for a symbol as MarketContext indicators
+        
+        Returns {} while the local book is missing or awaiting a resync, so
+        strategies never act on depth from before a sequence gap.
+        """
+        book = self.local_books.get(symbol)
+        if book is None or book.needs_resync:
+            return {}
+        return self.book_features.indicators(symbol)
+    
     def get_cached_price(self, symbol: str) -> Optional[float]:
         """Get cached price for a symbol"""
         if symbol in self.latest_prices:
             return self.latest_prices[symbol].price
         return None
     
-    def get_cached_order_book(self, symbol: str) -> Optional[OrderBookData]:
-        """Get cached order book for a symbol"""
-        return self.order_books.get(symbol)
+    def get_cached_order_book(self, symbol: str, depth: Optional[int] = None) -> Optional[OrderBookData]:
+        """Get the local order book for a symbol without a REST call"""
+        book = self.local_books.get(symbol)
+        if book is None or book.needs_resync:
+            return None
+        return book.to_order_book_data(depth)
     
-    def get_recent_trades(self, symbol: str, limit: int = 50) -> List[TradeData]:
-        """Get recent trades for a symbol"""
-        if symbol in self.recent_trades:
-            return self.recent_trades[symbol][-limit:]
-        return []
+    def get_recent_trades(self, symbol: str, limit: int = 50) -> np.ndarray:
+        """
+        Get recent trades for a symbol as a zero-copy structured view
+        
+        Args:
+            symbol: Trading symbol
+            limit: Maximum number of trades, oldest first
+            
+        Returns:
+            Array with "price", "quantity", "side" (+1 buy / -1 sell) and
+            "timestamp" fields; empty if no trades were seen
+        """
+        buffer = self.recent_trades.get(symbol)
+        if buffer is None:
+            return np.empty(0, dtype=TRADE_DTYPE)
+        return buffer.trades(limit)
 
 
 class MockDataFeed(LiveDataFeed):
@@ -461,7 +973,7 @@ class MockDataFeed(LiveDataFeed):
         """Mock market data"""
         price = self.get_live_price(symbol)
         if price:
-            return MarketData(
+            market_data = MarketData(
                 symbol=symbol,
                 price=price,
                 volume=1000000.0,
@@ -471,4 +983,16 @@ class MockDataFeed(LiveDataFeed):
                 change_24h=price * 0.02,
                 change_pct_24h=2.0
             )
-        return None
\ No newline at end of file
+            self.latest_prices[symbol] = market_data
+            self._record_tick(market_data)
+            return market_data
+        return None
+    
+    def get_all_tickers(self, symbols: Optional[Iterable[str]] = None) -> Dict[str, MarketData]:
+        """Mock bulk tickers built from per-symbol mock data"""
+        tickers = {}
+        for symbol in (symbols if symbols is not None else self.mock_prices):
+            market_data = self.get_market_data(symbol)
+            if market_data:
+                tickers[symbol] = market_data
+        return tickers
\ No newline at end of file
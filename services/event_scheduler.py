@@ -0,0 +1,153 @@
+"""
+Event-driven per-symbol evaluation scheduler
+
+Feed threads call notify(symbol) on every ticker, trade or bar-close event.
+Events are debounced and coalesced per symbol: the first event arms a short
+timer, later events inside the window (or while an evaluation is running)
+fold into a single follow-up run, and at most one evaluation per symbol is
+in flight at a time. Symbols with no events for max_idle seconds are still
+evaluated so quiet markets and feeds without a stream keep being checked.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Set
+
+from utils.logging_setup import LoggerMixin
+
+Evaluator = Callable[[str], Awaitable[object]]
+
+
+class SymbolEventScheduler(LoggerMixin):
+    """Debounced, coalescing per-symbol trigger for an async evaluator"""
+
+    def __init__(self, evaluate: Evaluator, symbols: Iterable[str],
+                 debounce: float = 0.25, max_idle: Optional[float] = 30.0):
+        """
+        Initialize scheduler
+
+        Args:
+            evaluate: Coroutine function run for one symbol
+            symbols: Symbols accepted by notify()
+            debounce: Seconds to wait after the first event before evaluating
+            max_idle: Evaluate a symbol after this many seconds without events
+                (None disables)
+        """
+        self.evaluate = evaluate
+        self.symbols: Set[str] = set(symbols)
+        self.debounce = debounce
+        self.max_idle = max_idle
+
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._armed: Set[str] = set()
+        self._running: Set[str] = set()
+        self._dirty: Set[str] = set()
+        self._last_run: Dict[str, float] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._timers: Dict[str, asyncio.Task] = {}
+        self._idle_task: Optional[asyncio.Task] = None
+
+        self.events = 0
+        self.coalesced = 0
+        self.evaluations = 0
+        self.errors = 0
+
+    @property
+    def started(self) -> bool:
+        return self.loop is not None
+
+    def start(self) -> None:
+        """Bind to the running event loop and start the idle sweeper"""
+        self.loop = asyncio.get_running_loop()
+        if self.max_idle:
+            self._idle_task = self.loop.create_task(self._idle_sweep())
+
+    async def stop(self) -> None:
+        """Cancel pending debounce timers and wait for in-flight evaluations"""
+        # Detach first so notify() and post-evaluation reruns schedule nothing
+        self.loop = None
+        if self._idle_task:
+            self._idle_task.cancel()
+            self._idle_task = None
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        self._armed.clear()
+        self._dirty.clear()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def notify(self, symbol: str, *_args) -> None:
+        """Record an event for symbol; safe to call from any thread"""
+        loop = self.loop
+        if loop is None or symbol not in self.symbols:
+            return
+        try:
+            in_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            in_loop = False
+        if in_loop:
+            self._on_event(symbol)
+        else:
+            loop.call_soon_threadsafe(self._on_event, symbol)
+
+    def _on_event(self, symbol: str) -> None:
+        if self.loop is None:
+            # Queued from a feed thread before stop()
+            return
+        self.events += 1
+        if symbol in self._running:
+            self._dirty.add(symbol)
+            self.coalesced += 1
+            return
+        if symbol in self._armed:
+            self.coalesced += 1
+            return
+        self._arm(symbol)
+
+    def _arm(self, symbol: str) -> None:
+        self._armed.add(symbol)
+        task = self.loop.create_task(self._run(symbol, self.debounce))
+        self._timers[symbol] = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, symbol: str, delay: float) -> None:
+        if delay:
+            await asyncio.sleep(delay)
+        self._timers.pop(symbol, None)
+        self._armed.discard(symbol)
+        self._running.add(symbol)
+        try:
+            self.evaluations += 1
+            self._last_run[symbol] = time.monotonic()
+            await self.evaluate(symbol)
+        except Exception as e:
+            self.errors += 1
+            self.logger.error(f"Event-driven evaluation failed for {symbol}: {e}")
+        finally:
+            self._running.discard(symbol)
+
+        if symbol in self._dirty and self.loop is not None:
+            # Events arrived mid-evaluation: run once more for all of them
+            self._dirty.discard(symbol)
+            self._arm(symbol)
+
+    async def _idle_sweep(self) -> None:
+        while True:
+            await asyncio.sleep(min(self.max_idle, 1.0))
+            now = time.monotonic()
+            for symbol in self.symbols:
+                if now - self._last_run.get(symbol, 0.0) >= self.max_idle:
+                    self._last_run[symbol] = now
+                    self._on_event(symbol)
+
+    def stats(self) -> Dict[str, int]:
+        """Event, coalescing and evaluation counters"""
+        return {
+            'events': self.events,
+            'coalesced': self.coalesced,
+            'evaluations': self.evaluations,
+            'errors': self.errors,
+            'pending': len(self._armed) + len(self._dirty),
+        }
@@ -0,0 +1,178 @@
+"""
+Bounded ingest queue between the websocket thread and data consumers
+
+The socket thread only enqueues; a pool of dispatcher threads runs the
+callbacks. Each symbol is pinned to one dispatcher shard so per-symbol order
+is preserved. Conflated message types (e.g. ticker) keep only the latest
+update per symbol while one is already waiting, so a slow consumer sees
+fresh data instead of a growing backlog.
+"""
+
+import threading
+import time
+from collections import deque
+from queue import SimpleQueue
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from utils.logging_setup import LoggerMixin
+
+_STOP = object()
+
+
+class IngestQueue(LoggerMixin):
+    """Sharded, bounded dispatch queue with per-symbol conflation"""
+
+    def __init__(
+        self,
+        handler: Callable[[str, str, Any], None],
+        maxsize: int = 10000,
+        workers: int = 4,
+        conflate_types: Iterable[str] = ("ticker", "orderbook"),
+        latency_samples: int = 2048,
+    ):
+        """
+        Initialize ingest queue
+
+        Args:
+            handler: Called as handler(data_type, symbol, data) on a dispatcher thread
+            maxsize: Maximum queued items across all shards before dropping
+            workers: Number of dispatcher threads
+            conflate_types: Message types where only the latest per symbol is kept
+            latency_samples: Enqueue-to-dispatch latencies kept for percentiles
+        """
+        self.handler = handler
+        self.maxsize = maxsize
+        self.workers = max(1, workers)
+        self.conflate_types = frozenset(conflate_types)
+
+        self._shards = [SimpleQueue() for _ in range(self.workers)]
+        self._threads = []
+        self._latest: Dict[Tuple[str, str], Tuple[Any, float]] = {}
+        self._pending = set()
+        self._latencies = deque(maxlen=latency_samples)
+
+        self.enqueued = 0
+        self.dispatched = 0
+        self.conflated = 0
+        self.dropped: Dict[str, int] = {}
+        self.max_depth = 0
+
+    @property
+    def running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def depth(self) -> int:
+        return sum(shard.qsize() for shard in self._shards)
+
+    def _shard(self, symbol: str) -> SimpleQueue:
+        return self._shards[hash(symbol) % self.workers]
+
+    def _drop(self, data_type: str) -> bool:
+        self.dropped[data_type] = self.dropped.get(data_type, 0) + 1
+        return False
+
+    def put(self, data_type: str, symbol: str, data: Any) -> bool:
+        """
+        Enqueue an update without blocking
+
+        Args:
+            data_type: Message type (ticker, orderbook, trade, ...)
+            symbol: Trading symbol
+            data: Parsed update
+
+        Returns:
+            False if the update was dropped because the queue is full
+        """
+        now = time.perf_counter()
+        depth = self.depth()
+        self.max_depth = max(self.max_depth, depth)
+
+        if data_type in self.conflate_types:
+            key = (data_type, symbol)
+            replaced = key in self._latest
+            self._latest[key] = (data, now)
+            if key in self._pending:
+                # A token is already queued; the dispatcher picks up this value
+                if replaced:
+                    self.conflated += 1
+                return True
+            if depth >= self.maxsize:
+                self._latest.pop(key, None)
+                return self._drop(data_type)
+            self._pending.add(key)
+            self._shard(symbol).put(key)
+        else:
+            if depth >= self.maxsize:
+                return self._drop(data_type)
+            self._shard(symbol).put((data_type, symbol, data, now))
+
+        self.enqueued += 1
+        return True
+
+    def _worker(self, shard: SimpleQueue) -> None:
+        while True:
+            token = shard.get()
+            if token is _STOP:
+                break
+
+            if len(token) == 2:
+                # Conflated: clear the pending mark first so newer updates requeue
+                self._pending.discard(token)
+                entry = self._latest.pop(token, None)
+                if entry is None:
+                    continue
+                data_type, symbol = token
+                data, enqueued_at = entry
+            else:
+                data_type, symbol, data, enqueued_at = token
+
+            try:
+                self.handler(data_type, symbol, data)
+            except Exception as e:
+                self.logger.error(f"Ingest handler error for {data_type}_{symbol}: {e}")
+            self._latencies.append(time.perf_counter() - enqueued_at)
+            self.dispatched += 1
+
+    def start(self) -> None:
+        """Start dispatcher threads"""
+        if self.running:
+            return
+        self._threads = [
+            threading.Thread(target=self._worker, args=(shard,), name=f"ingest-{i}", daemon=True)
+            for i, shard in enumerate(self._shards)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Drain queued items and stop dispatcher threads"""
+        # Only live workers consume a sentinel; one left in an idle shard
+        # would stop the next start()'s worker immediately
+        live = [(shard, thread) for shard, thread in zip(self._shards, self._threads) if thread.is_alive()]
+        for shard, _ in live:
+            shard.put(_STOP)
+        for _, thread in live:
+            thread.join(timeout=timeout)
+        self._threads = []
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, drop/conflation counts and end-to-end latency (ms)"""
+        latencies = sorted(self._latencies)
+        stats = {
+            'depth': self.depth(),
+            'max_depth': self.max_depth,
+            'enqueued': self.enqueued,
+            'dispatched': self.dispatched,
+            'conflated': self.conflated,
+            'dropped': dict(self.dropped),
+        }
+        if latencies:
+            def pct(p):
+                return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+            stats.update(
+                latency_p50_ms=pct(0.50),
+                latency_p95_ms=pct(0.95),
+                latency_max_ms=latencies[-1] * 1000,
+            )
+        return stats
@@ -0,0 +1,377 @@
+"""
+Rolling market data buffers for CryptoFuturesBot
+Fixed-capacity NumPy ring buffers holding recent ticks and trades
+"""
+
+from threading import Lock
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+
+class PriceRingBuffer:
+    """
+    Preallocated ring buffer of (price, volume, timestamp) ticks for one symbol
+
+    Every tick is written twice, at slot ``i`` and ``i + capacity``, so the
+    most recent ``n`` ticks always form one contiguous slice of the backing
+    array. Appends are O(1) and reads return NumPy views without copying.
+    Views alias the backing storage and will be overwritten once the buffer
+    wraps; copy them if they need to outlive the current cycle.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize ring buffer
+
+        Args:
+            capacity: Maximum number of ticks retained
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self._prices = np.zeros(2 * capacity, dtype=np.float64)
+        self._volumes = np.zeros(2 * capacity, dtype=np.float64)
+        self._timestamps = np.zeros(2 * capacity, dtype=np.int64)
+        self._head = 0
+        self._count = 0
+        self._total = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> int:
+        """Number of ticks appended since creation (monotonic sequence number)"""
+        return self._total
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the backing arrays"""
+        return self._prices.nbytes + self._volumes.nbytes + self._timestamps.nbytes
+
+    def append(self, price: float, volume: float = 0.0, timestamp: int = 0):
+        """Append a tick, evicting the oldest one when full"""
+        with self._lock:
+            i = self._head
+            j = i + self.capacity
+            self._prices[i] = self._prices[j] = price
+            self._volumes[i] = self._volumes[j] = volume
+            self._timestamps[i] = self._timestamps[j] = timestamp
+
+            self._head = (i + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+            self._total += 1
+
+    def _window(self, limit: Optional[int]) -> slice:
+        count = self._count if limit is None else max(0, min(limit, self._count))
+        end = (self._head - self._count) % self.capacity + self._count
+        return slice(end - count, end)
+
+    def prices(self, limit: Optional[int] = None) -> np.ndarray:
+        """Return a view of the most recent prices, oldest first"""
+        with self._lock:
+            return self._prices[self._window(limit)]
+
+    def volumes(self, limit: Optional[int] = None) -> np.ndarray:
+        """Return a view of the most recent volumes, oldest first"""
+        with self._lock:
+            return self._volumes[self._window(limit)]
+
+    def timestamps(self, limit: Optional[int] = None) -> np.ndarray:
+        """Return a view of the most recent timestamps, oldest first"""
+        with self._lock:
+            return self._timestamps[self._window(limit)]
+
+    def snapshot(self, limit: Optional[int] = None) -> Tuple[np.ndarray, int]:
+        """Return a price view together with the matching sequence number"""
+        with self._lock:
+            return self._prices[self._window(limit)], self._total
+
+    def last_price(self) -> Optional[float]:
+        """Return the most recent price or None if empty"""
+        if self._count == 0:
+            return None
+        return float(self._prices[(self._head - 1) % self.capacity])
+
+    def clear(self):
+        """Drop all buffered ticks"""
+        with self._lock:
+            self._head = 0
+            self._count = 0
+
+
+SIDE_BUY = 1
+SIDE_SELL = -1
+
+TRADE_DTYPE = np.dtype([
+    ("price", np.float64),
+    ("quantity", np.float64),
+    ("side", np.int8),
+    ("timestamp", np.int64),
+])
+
+
+def encode_side(side: str) -> int:
+    """Map a BUY/SELL string to SIDE_BUY/SIDE_SELL (0 if unknown)"""
+    side = (side or "").upper()
+    if side == "BUY":
+        return SIDE_BUY
+    if side == "SELL":
+        return SIDE_SELL
+    return 0
+
+
+class TradeRingBuffer:
+    """
+    Columnar ring buffer of trades for one symbol
+
+    Uses the same mirrored layout as PriceRingBuffer over a structured array,
+    so trades(limit) is a contiguous view whose columns ("price", "quantity",
+    "side", "timestamp") are themselves views. Trade ids are kept in a
+    parallel object array.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize trade ring buffer
+
+        Args:
+            capacity: Maximum number of trades retained
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self._trades = np.zeros(2 * capacity, dtype=TRADE_DTYPE)
+        self._ids = np.empty(2 * capacity, dtype=object)
+        self._head = 0
+        self._count = 0
+        self._total = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> int:
+        """Number of trades appended since creation"""
+        return self._total
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the backing arrays (id objects excluded)"""
+        return self._trades.nbytes + self._ids.nbytes
+
+    def append(self, price: float, quantity: float, side: int, timestamp: int = 0,
+               trade_id: Optional[str] = None):
+        """Append a trade, evicting the oldest one when full"""
+        with self._lock:
+            i = self._head
+            j = i + self.capacity
+            self._trades[i] = self._trades[j] = (price, quantity, side, timestamp)
+            self._ids[i] = self._ids[j] = trade_id
+
+            self._head = (i + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+            self._total += 1
+
+    def _window(self, limit: Optional[int]) -> slice:
+        count = self._count if limit is None else max(0, min(limit, self._count))
+        end = (self._head - self._count) % self.capacity + self._count
+        return slice(end - count, end)
+
+    def trades(self, limit: Optional[int] = None) -> np.ndarray:
+        """Return a structured view of the most recent trades, oldest first"""
+        with self._lock:
+            return self._trades[self._window(limit)]
+
+    def trade_ids(self, limit: Optional[int] = None) -> np.ndarray:
+        """Return a view of the matching trade ids"""
+        with self._lock:
+            return self._ids[self._window(limit)]
+
+    def clear(self):
+        """Drop all buffered trades"""
+        with self._lock:
+            self._head = 0
+            self._count = 0
+
+
+CANDLE_DTYPE = np.dtype([
+    ("open_time", np.int64),
+    ("open", np.float64),
+    ("high", np.float64),
+    ("low", np.float64),
+    ("close", np.float64),
+    ("volume", np.float64),
+    ("trades", np.int64),
+])
+
+
+class CandleRingBuffer:
+    """
+    Columnar OHLCV ring buffer keyed by candle open time
+
+    Same mirrored layout as PriceRingBuffer over a structured array. upsert()
+    appends a new candle, updates the latest one in place when its open time
+    repeats, and overwrites older candles still in the window instead of
+    duplicating them.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        """
+        Initialize candle ring buffer
+
+        Args:
+            capacity: Maximum number of candles retained
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self._candles = np.zeros(2 * capacity, dtype=CANDLE_DTYPE)
+        self._head = 0
+        self._count = 0
+        self._total = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @classmethod
+    def from_memory_budget(cls, budget_bytes: int) -> "CandleRingBuffer":
+        """
+        Build the largest buffer whose backing array fits in budget_bytes
+
+        Args:
+            budget_bytes: Memory budget for one symbol's candles
+
+        Returns:
+            CandleRingBuffer
+        """
+        capacity = budget_bytes // (2 * CANDLE_DTYPE.itemsize)
+        if capacity <= 0:
+            raise ValueError(f"Memory budget too small for one candle: {budget_bytes} bytes")
+        return cls(capacity)
+
+    @property
+    def total(self) -> int:
+        """Number of distinct candles appended since creation"""
+        return self._total
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the backing array"""
+        return self._candles.nbytes
+
+    def _write(self, slot: int, candle: Tuple) -> None:
+        self._candles[slot] = self._candles[slot + self.capacity] = candle
+
+    def _window(self, limit: Optional[int]) -> slice:
+        count = self._count if limit is None else max(0, min(limit, self._count))
+        end = (self._head - self._count) % self.capacity + self._count
+        return slice(end - count, end)
+
+    def last_open_time(self) -> Optional[int]:
+        if self._count == 0:
+            return None
+        return int(self._candles[(self._head - 1) % self.capacity]["open_time"])
+
+    def last(self) -> Optional[np.void]:
+        """Most recent candle record (a copy) or None"""
+        with self._lock:
+            if self._count == 0:
+                return None
+            return self._candles[(self._head - 1) % self.capacity].copy()
+
+    def upsert(self, open_time: int, open_: float, high: float, low: float,
+               close: float, volume: float, trades: int = 0) -> bool:
+        """
+        Insert or replace the candle for open_time
+
+        Returns:
+            True if a new candle was appended, False if one was updated or the
+            candle is older than the retained window
+        """
+        candle = (open_time, open_, high, low, close, volume, trades)
+        with self._lock:
+            last_slot = (self._head - 1) % self.capacity
+            if self._count and open_time <= self._candles[last_slot]["open_time"]:
+                window = self._candles[self._window(None)]
+                index = int(np.searchsorted(window["open_time"], open_time))
+                if index < self._count and window[index]["open_time"] == open_time:
+                    self._write((self._head - self._count + index) % self.capacity, candle)
+                return False
+
+            self._write(self._head, candle)
+            self._head = (self._head + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+            self._total += 1
+            return True
+
+    def bars(self, limit: Optional[int] = None) -> np.ndarray:
+        """Structured view of the most recent candles, oldest first"""
+        with self._lock:
+            return self._candles[self._window(limit)]
+
+    def column(self, name: str, limit: Optional[int] = None) -> np.ndarray:
+        """View of one column (open_time, open, high, low, close, volume, trades)"""
+        return self.bars(limit)[name]
+
+    def clear(self):
+        """Drop all buffered candles"""
+        with self._lock:
+            self._head = 0
+            self._count = 0
+
+
+class MarketDataBuffers:
+    """Per-symbol collection of ring buffers (PriceRingBuffer by default)"""
+
+    def __init__(self, capacity: int = 1024, buffer_factory: Callable[[int], object] = PriceRingBuffer):
+        """
+        Initialize buffer collection
+
+        Args:
+            capacity: Ticks retained per symbol
+            buffer_factory: Buffer class built per symbol from the capacity
+        """
+        self.capacity = capacity
+        self.buffer_factory = buffer_factory
+        self._buffers: Dict[str, PriceRingBuffer] = {}
+        self._lock = Lock()
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._buffers
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def get(self, symbol: str) -> Optional[PriceRingBuffer]:
+        """Get buffer for a symbol if one exists"""
+        return self._buffers.get(symbol)
+
+    def get_or_create(self, symbol: str) -> PriceRingBuffer:
+        """Get buffer for a symbol, allocating it on first use"""
+        buffer = self._buffers.get(symbol)
+        if buffer is None:
+            with self._lock:
+                buffer = self._buffers.get(symbol)
+                if buffer is None:
+                    buffer = self.buffer_factory(self.capacity)
+                    self._buffers[symbol] = buffer
+        return buffer
+
+    def append(self, symbol: str, price: float, volume: float = 0.0, timestamp: int = 0):
+        """Append a tick for a symbol"""
+        self.get_or_create(symbol).append(price, volume, timestamp)
+
+    def memory_usage(self) -> int:
+        """Total bytes held by all symbol buffers"""
+        return sum(buffer.nbytes for buffer in self._buffers.values())
@@ -0,0 +1,255 @@
+"""
+Multiplexed Coinswitch Socket.IO market-data hub
+
+One socket to the futures realtime-rates endpoint carries ticker, order book,
+trade and candlestick streams for any number of pairs. Updates are fanned out
+to in-process subscribers through typed callbacks.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import socketio
+    SOCKETIO_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    socketio = None
+    SOCKETIO_AVAILABLE = False
+
+from utils.logging_setup import LoggerMixin
+
+WS_BASE_URL = "https://ws.coinswitch.co/"
+SOCKETIO_PATH = "/pro/realtime-rates-socket/futures/exchange_2"
+
+
+class StreamType(Enum):
+    """Coinswitch PRO Socket.IO events"""
+    TICKER = "FETCH_TICKER_INFO_CS_PRO"
+    ORDER_BOOK = "FETCH_ORDER_BOOK_CS_PRO"
+    TRADES = "FETCH_TRADES_CS_PRO"
+    CANDLES = "FETCH_CANDLESTICK_CS_PRO"
+
+
+@dataclass
+class MarketUpdate:
+    """One message received from the hub"""
+    stream: StreamType
+    pair: Optional[str]
+    data: Any
+    received_at: float
+
+
+UpdateCallback = Callable[[MarketUpdate], None]
+
+
+class MarketDataHub(LoggerMixin):
+    """Single Socket.IO connection shared by all pairs and streams"""
+
+    def __init__(
+        self,
+        pairs: Optional[Iterable[str]] = None,
+        streams: Optional[Iterable[StreamType]] = None,
+        candle_interval: int = 5,
+        base_url: str = WS_BASE_URL,
+        socketio_path: str = SOCKETIO_PATH,
+        namespace: str = SOCKETIO_PATH,
+        client_factory: Optional[Callable[[], Any]] = None,
+    ):
+        """
+        Initialize market data hub
+
+        Args:
+            pairs: Pairs to subscribe to once connected
+            streams: Streams to subscribe for each pair (default: all)
+            candle_interval: Candle interval in minutes (pair suffix, e.g. BTCUSDT_5)
+            base_url: Socket.IO server URL
+            socketio_path: Socket.IO endpoint path
+            namespace: Socket.IO namespace
+            client_factory: Builds the Socket.IO client (defaults to socketio.Client)
+        """
+        if client_factory is None:
+            if not SOCKETIO_AVAILABLE:
+                raise ImportError("python-socketio is required for MarketDataHub")
+            client_factory = socketio.Client
+
+        self.base_url = base_url
+        self.socketio_path = socketio_path
+        self.namespace = namespace
+        self.candle_interval = candle_interval
+        self.default_streams: Tuple[StreamType, ...] = tuple(streams or StreamType)
+
+        self._client = client_factory()
+        self._lock = threading.RLock()
+        self._subscriptions: Dict[StreamType, Set[str]] = {stream: set() for stream in StreamType}
+        self._callbacks: Dict[StreamType, List[Tuple[UpdateCallback, Optional[frozenset]]]] = {
+            stream: [] for stream in StreamType
+        }
+        self.connected = False
+        self.message_counts: Dict[StreamType, int] = {stream: 0 for stream in StreamType}
+
+        self._register_handlers()
+        if pairs:
+            self.subscribe(pairs)
+
+    # -- Socket.IO wiring -------------------------------------------------
+
+    def _register_handlers(self) -> None:
+        self._client.on("connect", self._on_connect, namespace=self.namespace)
+        self._client.on("disconnect", self._on_disconnect, namespace=self.namespace)
+        for stream in StreamType:
+            self._client.on(stream.value, self._make_handler(stream), namespace=self.namespace)
+
+    def _make_handler(self, stream: StreamType) -> Callable[[Any], None]:
+        def handler(data):
+            self._dispatch(stream, data)
+        return handler
+
+    def _on_connect(self) -> None:
+        self.connected = True
+        self.logger.info("Market data hub connected")
+        with self._lock:
+            pending = [(stream, sorted(pairs)) for stream, pairs in self._subscriptions.items()]
+        for stream, pairs in pending:
+            for pair in pairs:
+                self._emit_subscribe(stream, pair)
+
+    def _on_disconnect(self) -> None:
+        self.connected = False
+        self.logger.warning("Market data hub disconnected")
+
+    def _wire_pair(self, stream: StreamType, pair: str) -> str:
+        if stream is StreamType.CANDLES:
+            return f"{pair}_{self.candle_interval}"
+        return pair
+
+    def _emit_subscribe(self, stream: StreamType, pair: str) -> None:
+        payload = {"event": "subscribe", "pair": self._wire_pair(stream, pair)}
+        try:
+            self._client.emit(stream.value, payload, namespace=self.namespace)
+        except Exception as e:
+            self.logger.error(f"Failed to subscribe {stream.name} {pair}: {e}")
+
+    # -- Subscriptions ----------------------------------------------------
+
+    def subscribe(self, pairs: Iterable[str], streams: Optional[Iterable[StreamType]] = None) -> None:
+        """
+        Subscribe pairs to streams; sent immediately if connected, else on connect
+
+        Args:
+            pairs: Pair symbols, e.g. BTCUSDT
+            streams: Streams to subscribe (default: the hub's default streams)
+        """
+        streams = tuple(streams or self.default_streams)
+        new = []
+        with self._lock:
+            for stream in streams:
+                for pair in pairs:
+                    if pair not in self._subscriptions[stream]:
+                        self._subscriptions[stream].add(pair)
+                        new.append((stream, pair))
+        if self.connected:
+            for stream, pair in new:
+                self._emit_subscribe(stream, pair)
+
+    @property
+    def pairs(self) -> Set[str]:
+        with self._lock:
+            return set().union(*self._subscriptions.values())
+
+    def add_callback(
+        self,
+        stream: StreamType,
+        callback: UpdateCallback,
+        pairs: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Register a callback for a stream
+
+        Args:
+            stream: Stream to listen to
+            callback: Called with a MarketUpdate for each message
+            pairs: Only deliver updates for these pairs (default: all)
+        """
+        pair_filter = frozenset(pairs) if pairs is not None else None
+        with self._lock:
+            self._callbacks[stream].append((callback, pair_filter))
+
+    def on_ticker(self, callback: UpdateCallback, pairs: Optional[Iterable[str]] = None) -> None:
+        self.add_callback(StreamType.TICKER, callback, pairs)
+
+    def on_order_book(self, callback: UpdateCallback, pairs: Optional[Iterable[str]] = None) -> None:
+        self.add_callback(StreamType.ORDER_BOOK, callback, pairs)
+
+    def on_trades(self, callback: UpdateCallback, pairs: Optional[Iterable[str]] = None) -> None:
+        self.add_callback(StreamType.TRADES, callback, pairs)
+
+    def on_candles(self, callback: UpdateCallback, pairs: Optional[Iterable[str]] = None) -> None:
+        self.add_callback(StreamType.CANDLES, callback, pairs)
+
+    # -- Fan-out ------------------------------------------------------------
+
+    def _resolve_pair(self, stream: StreamType, data: Any) -> Optional[str]:
+        pair = None
+        if isinstance(data, dict):
+            pair = data.get("pair") or data.get("symbol") or data.get("s")
+            inner = data.get("data")
+            if pair is None and isinstance(inner, dict):
+                pair = inner.get("pair") or inner.get("symbol") or inner.get("s")
+            elif pair is None and isinstance(inner, list) and inner and isinstance(inner[0], dict):
+                pair = inner[0].get("s") or inner[0].get("symbol")
+
+        if pair is None:
+            subscribed = self._subscriptions[stream]
+            return next(iter(subscribed)) if len(subscribed) == 1 else None
+
+        pair = str(pair)
+        suffix = f"_{self.candle_interval}"
+        if stream is StreamType.CANDLES and pair.endswith(suffix):
+            pair = pair[: -len(suffix)]
+        return pair
+
+    def _dispatch(self, stream: StreamType, data: Any) -> None:
+        update = MarketUpdate(
+            stream=stream,
+            pair=self._resolve_pair(stream, data),
+            data=data,
+            received_at=time.time(),
+        )
+        with self._lock:
+            self.message_counts[stream] += 1
+            callbacks = list(self._callbacks[stream])
+
+        for callback, pair_filter in callbacks:
+            if pair_filter is not None and update.pair not in pair_filter:
+                continue
+            try:
+                callback(update)
+            except Exception as e:
+                self.logger.error(f"Error in {stream.name} callback: {e}")
+
+    # -- Lifecycle ------------------------------------------------------------
+
+    def connect(self) -> None:
+        """Open the shared socket; subscriptions are sent from the connect handler"""
+        self._client.connect(
+            url=self.base_url,
+            namespaces=[self.namespace],
+            transports=["websocket"],
+            socketio_path=self.socketio_path,
+            wait=True,
+            wait_timeout=30,
+        )
+
+    def run_forever(self) -> None:
+        """Connect and block until the socket closes"""
+        self.connect()
+        self._client.wait()
+
+    def disconnect(self) -> None:
+        try:
+            self._client.disconnect()
+        finally:
+            self.connected = False
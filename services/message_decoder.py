@@ -0,0 +1,184 @@
+"""
+Pluggable JSON decoding for market-data payloads
+
+Uses msgspec (typed structs, decoded straight into the numeric fields) or
+orjson when installed, falling back to the stdlib json module. WebSocket
+frames are turned directly into MarketData / OrderBookData / TradeData
+records. Only msgspec and orjson (the "fast-json" extra) are faster than a
+plain json.loads; the stdlib backend decodes at about the same rate.
+"""
+
+import json
+import time
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+    MSGSPEC_AVAILABLE = False
+
+BACKENDS = ("msgspec", "orjson", "json")
+
+
+if MSGSPEC_AVAILABLE:
+    class WsMessage(msgspec.Struct):
+        """Typed websocket frame; unknown fields are ignored"""
+        type: str = ""
+        symbol: str = ""
+        price: float = 0.0
+        volume: float = 0.0
+        quantity: float = 0.0
+        side: str = ""
+        change: Optional[float] = None
+        changePercent: Optional[float] = None
+        bids: list = []
+        asks: list = []
+        delta: bool = False
+        sequence: Optional[int] = None
+        prev_sequence: Optional[int] = None
+        u: Optional[int] = None
+        pu: Optional[int] = None
+        id: Any = None
+
+
+def available_backends() -> Tuple[str, ...]:
+    """Installed backends, fastest first"""
+    installed = {"msgspec": MSGSPEC_AVAILABLE, "orjson": ORJSON_AVAILABLE, "json": True}
+    return tuple(name for name in BACKENDS if installed[name])
+
+
+def _first(value: Any, fallback: Any) -> Any:
+    """value unless it is None; used for the sequence/u and prev_sequence/pu aliases"""
+    return fallback if value is None else value
+
+
+def _float(value: Any, default: Optional[float] = 0.0) -> Optional[float]:
+    if value is None or value == "":
+        return default
+    return float(value)
+
+
+class MessageDecoder:
+    """Decode REST/WebSocket JSON payloads with the fastest available backend"""
+
+    def __init__(self, backend: str = "auto"):
+        """
+        Initialize decoder
+
+        Args:
+            backend: "msgspec", "orjson", "json" or "auto" (fastest installed)
+        """
+        if backend == "auto":
+            backend = available_backends()[0]
+        if backend not in available_backends():
+            raise ValueError(f"JSON backend not available: {backend}")
+        self.backend = backend
+
+        if backend == "msgspec":
+            self.loads = msgspec.json.Decoder().decode
+            self._ws_decoder = msgspec.json.Decoder(WsMessage, strict=False)
+        elif backend == "orjson":
+            self.loads = orjson.loads
+        else:
+            self.loads = json.loads
+
+        # Imported here to avoid a circular import with services.data_feed
+        from services.data_feed import MarketData, OrderBookData, TradeData
+        self._market_data = MarketData
+        self._order_book = OrderBookData
+        self._trade = TradeData
+
+    def decode_ws_message(self, raw) -> Optional[Tuple[str, str, Any]]:
+        """
+        Decode a websocket frame into a market-data record
+
+        Args:
+            raw: Frame as str or bytes
+
+        Returns:
+            (message type, symbol, record) or None for other message types
+        """
+        if self.backend == "msgspec":
+            return self._from_struct(self._ws_decoder.decode(raw))
+        return self.record_from_dict(self.loads(raw))
+
+    def _from_struct(self, msg: "WsMessage") -> Optional[Tuple[str, str, Any]]:
+        now = int(time.time())
+        if msg.type == "ticker":
+            record = self._market_data(
+                symbol=msg.symbol,
+                price=msg.price,
+                volume=msg.volume,
+                timestamp=now,
+                change_24h=msg.change or None,
+                change_pct_24h=msg.changePercent or None,
+            )
+        elif msg.type == "orderbook":
+            record = self._order_book(
+                symbol=msg.symbol,
+                bids=msg.bids,
+                asks=msg.asks,
+                timestamp=now,
+                sequence=_first(msg.sequence, msg.u),
+                prev_sequence=_first(msg.prev_sequence, msg.pu),
+                is_snapshot=not msg.delta,
+            )
+        elif msg.type == "trade":
+            record = self._trade(
+                symbol=msg.symbol,
+                price=msg.price,
+                quantity=msg.quantity,
+                side=msg.side,
+                timestamp=now,
+                trade_id=msg.id,
+            )
+        else:
+            return None
+        return msg.type, msg.symbol, record
+
+    def record_from_dict(self, data: Dict[str, Any]) -> Optional[Tuple[str, str, Any]]:
+        """Build a market-data record from an already-parsed message dict"""
+        msg_type = data.get('type', '')
+        symbol = data.get('symbol', '')
+        now = int(time.time())
+
+        if msg_type == 'ticker':
+            record = self._market_data(
+                symbol=symbol,
+                price=_float(data.get('price')),
+                volume=_float(data.get('volume')),
+                timestamp=now,
+                change_24h=_float(data.get('change'), None) or None,
+                change_pct_24h=_float(data.get('changePercent'), None) or None,
+            )
+        elif msg_type == 'orderbook':
+            record = self._order_book(
+                symbol=symbol,
+                bids=data.get('bids', []),
+                asks=data.get('asks', []),
+                timestamp=now,
+                sequence=_first(data.get('sequence'), data.get('u')),
+                prev_sequence=_first(data.get('prev_sequence'), data.get('pu')),
+                is_snapshot=not data.get('delta', False),
+            )
+        elif msg_type == 'trade':
+            record = self._trade(
+                symbol=symbol,
+                price=_float(data.get('price')),
+                quantity=_float(data.get('quantity')),
+                side=data.get('side', ''),
+                timestamp=now,
+                trade_id=data.get('id'),
+            )
+        else:
+            return None
+        return msg_type, symbol, record
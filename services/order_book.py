@@ -0,0 +1,248 @@
+"""
+Incremental local L2 order book
+
+Each side keeps its price levels in a bisect-maintained sorted list plus a
+price -> quantity dict, so deltas cost one binary search per level, the best
+bid/ask are O(1) reads, and depth-at-N is a slice. Sequence numbers are
+checked on every delta; on a gap the book stops applying updates, buffers
+them, and waits for a REST snapshot to resync. Buffered deltas are replayed
+onto the snapshot with the same continuity check, and a snapshot that does
+not connect to them (or predates deltas dropped from a full buffer) leaves
+the book out of sync.
+"""
+
+import bisect
+from collections import deque
+from threading import RLock
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+Level = Tuple[float, float]
+
+
+class BookSide:
+    """One side of the book; keys are sorted so index 0 is the best level"""
+
+    __slots__ = ("_descending", "_keys", "_qty")
+
+    def __init__(self, descending: bool):
+        self._descending = descending
+        self._keys: List[float] = []
+        self._qty: Dict[float, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _key(self, price: float) -> float:
+        return -price if self._descending else price
+
+    def _price(self, key: float) -> float:
+        return -key if self._descending else key
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._qty.clear()
+
+    def set(self, price: float, quantity: float) -> None:
+        """Set a level's quantity; zero removes the level"""
+        price = float(price)
+        quantity = float(quantity)
+        key = self._key(price)
+        exists = price in self._qty
+        if quantity <= 0:
+            if exists:
+                del self._qty[price]
+                index = bisect.bisect_left(self._keys, key)
+                del self._keys[index]
+            return
+        if not exists:
+            bisect.insort(self._keys, key)
+        self._qty[price] = quantity
+
+    def best(self) -> Optional[Level]:
+        if not self._keys:
+            return None
+        price = self._price(self._keys[0])
+        return price, self._qty[price]
+
+    def levels(self, n: Optional[int] = None) -> List[Level]:
+        """Top n levels, best first"""
+        keys = self._keys if n is None else self._keys[:n]
+        return [(price, self._qty[price]) for price in map(self._price, keys)]
+
+    def quantity_at(self, price: float) -> float:
+        return self._qty.get(float(price), 0.0)
+
+
+class LocalOrderBook:
+    """L2 book for one symbol maintained from snapshots and deltas"""
+
+    def __init__(self, symbol: str, max_pending: int = 1000):
+        """
+        Initialize order book
+
+        Args:
+            symbol: Trading symbol
+            max_pending: Deltas buffered while waiting for a resync snapshot
+        """
+        self.symbol = symbol
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide(descending=False)
+        self.sequence: Optional[int] = None
+        self.timestamp = 0
+        self.needs_resync = True
+        self.gaps = 0
+        self.updates = 0
+        self.pending_overflows = 0
+        self._pending: Deque[Tuple[Sequence, Sequence, Optional[int], Optional[int]]] = deque(maxlen=max_pending)
+        # Highest sequence dropped from a full pending buffer; snapshots must reach it
+        self._dropped_through: Optional[int] = None
+        self.lock = RLock()
+
+    @staticmethod
+    def _apply_levels(side: BookSide, levels: Iterable[Sequence]) -> None:
+        for level in levels:
+            side.set(level[0], level[1])
+
+    def _follows(self, sequence: Optional[int], prev_sequence: Optional[int]) -> bool:
+        """True if an update with these sequence numbers continues the book"""
+        if sequence is None or self.sequence is None:
+            return True
+        expected = prev_sequence if prev_sequence is not None else sequence - 1
+        return expected == self.sequence
+
+    def _buffer(self, bids: Iterable[Sequence], asks: Iterable[Sequence],
+                sequence: Optional[int], prev_sequence: Optional[int]) -> None:
+        """Hold a delta until the next snapshot, recording any overflow"""
+        if len(self._pending) == self._pending.maxlen:
+            dropped = self._pending[0][2]
+            self.pending_overflows += 1
+            if dropped is not None and (self._dropped_through is None or dropped > self._dropped_through):
+                self._dropped_through = dropped
+        self._pending.append((list(bids), list(asks), sequence, prev_sequence))
+
+    def oldest_pending_sequence(self) -> Optional[int]:
+        """Sequence of the oldest buffered delta, if any"""
+        with self.lock:
+            return self._pending[0][2] if self._pending else None
+
+    def apply_snapshot(self, bids: Iterable[Sequence], asks: Iterable[Sequence],
+                       sequence: Optional[int] = None, timestamp: int = 0) -> bool:
+        """
+        Replace the book, then replay buffered deltas newer than the snapshot
+
+        Args:
+            bids: [price, quantity] levels
+            asks: [price, quantity] levels
+            sequence: Sequence number of the snapshot
+            timestamp: Snapshot timestamp
+
+        Returns:
+            True if the book is in sync afterwards; False if the snapshot is
+            older than deltas lost to a full buffer, or the buffered deltas do
+            not continue from it (a newer snapshot is needed)
+        """
+        with self.lock:
+            if sequence is not None and self._dropped_through is not None and sequence < self._dropped_through:
+                self.needs_resync = True
+                return False
+
+            self.bids.clear()
+            self.asks.clear()
+            self._apply_levels(self.bids, bids)
+            self._apply_levels(self.asks, asks)
+            self.sequence = sequence
+            self.timestamp = timestamp
+            self.needs_resync = False
+            self._dropped_through = None
+            self.updates += 1
+
+            pending = list(self._pending)
+            self._pending.clear()
+            for index, (delta_bids, delta_asks, delta_sequence, prev_sequence) in enumerate(pending):
+                if self.sequence is not None and delta_sequence is not None and delta_sequence <= self.sequence:
+                    continue
+                if not self._follows(delta_sequence, prev_sequence):
+                    # Buffered deltas don't connect to the snapshot; keep them for the next one
+                    self.gaps += 1
+                    self.needs_resync = True
+                    self._pending.extend(pending[index:])
+                    return False
+                self._apply_levels(self.bids, delta_bids)
+                self._apply_levels(self.asks, delta_asks)
+                if delta_sequence is not None:
+                    self.sequence = delta_sequence
+            return True
+
+    def apply_delta(self, bids: Iterable[Sequence], asks: Iterable[Sequence],
+                    sequence: Optional[int] = None, prev_sequence: Optional[int] = None,
+                    timestamp: int = 0) -> bool:
+        """
+        Apply an incremental update
+
+        Args:
+            bids: [price, quantity] levels; quantity 0 deletes the level
+            asks: [price, quantity] levels; quantity 0 deletes the level
+            sequence: Sequence number of this update
+            prev_sequence: Sequence the update builds on (defaults to sequence - 1)
+            timestamp: Update timestamp
+
+        Returns:
+            True if applied; False if stale, or buffered because of a gap
+        """
+        with self.lock:
+            if self.needs_resync:
+                self._buffer(bids, asks, sequence, prev_sequence)
+                return False
+
+            if sequence is not None and self.sequence is not None:
+                if sequence <= self.sequence:
+                    return False
+                if not self._follows(sequence, prev_sequence):
+                    self.gaps += 1
+                    self.needs_resync = True
+                    self._buffer(bids, asks, sequence, prev_sequence)
+                    return False
+
+            self._apply_levels(self.bids, bids)
+            self._apply_levels(self.asks, asks)
+            if sequence is not None:
+                self.sequence = sequence
+            self.timestamp = timestamp or self.timestamp
+            self.updates += 1
+            return True
+
+    def best_bid(self) -> Optional[Level]:
+        return self.bids.best()
+
+    def best_ask(self) -> Optional[Level]:
+        return self.asks.best()
+
+    def mid(self) -> Optional[float]:
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2
+
+    def spread(self) -> Optional[float]:
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return ask[0] - bid[0]
+
+    def depth(self, n: int) -> Tuple[List[Level], List[Level]]:
+        """Top n (bids, asks), best first"""
+        with self.lock:
+            return self.bids.levels(n), self.asks.levels(n)
+
+    def to_order_book_data(self, depth: Optional[int] = None):
+        """Materialise an OrderBookData snapshot"""
+        from services.data_feed import OrderBookData
+
+        with self.lock:
+            return OrderBookData(
+                symbol=self.symbol,
+                bids=[list(level) for level in self.bids.levels(depth)],
+                asks=[list(level) for level in self.asks.levels(depth)],
+                timestamp=self.timestamp,
+                sequence=self.sequence,
+            )
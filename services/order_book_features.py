@@ -0,0 +1,152 @@
+"""
+Order-book feature stage
+
+Derives top-N imbalance, microprice, cumulative depth and the
+slippage-adjusted fill price for a target notional from a LocalOrderBook.
+Features only read the top N levels, so the cost per update is O(N)
+regardless of book size, and they are recomputed only when the book has
+changed since the last computation.
+"""
+
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.order_book import Level, LocalOrderBook
+
+
+@dataclass(slots=True)
+class OrderBookFeatures:
+    """Book-derived features for one symbol"""
+    symbol: str
+    sequence: Optional[int]
+    mid: Optional[float]
+    spread: Optional[float]
+    microprice: Optional[float]
+    imbalance: float  # (bid depth - ask depth) / total over top N, in [-1, 1]
+    bid_depth: float  # cumulative quantity over top N bids
+    ask_depth: float
+    bid_notional: float
+    ask_notional: float
+    buy_fill_price: Optional[float]  # VWAP to buy target_notional, None if book too thin
+    sell_fill_price: Optional[float]
+    buy_slippage_bps: Optional[float]
+    sell_slippage_bps: Optional[float]
+
+    def as_indicators(self, prefix: str = "ob_") -> Dict[str, Any]:
+        """Flat dict suitable for MarketContext.indicators"""
+        return {
+            f"{prefix}{name}": getattr(self, name)
+            for name in self.__slots__
+            if name not in ("symbol",)
+        }
+
+
+def fill_price(levels: List[Level], notional: float) -> Optional[float]:
+    """
+    VWAP of walking levels until notional is filled
+
+    Args:
+        levels: (price, quantity) levels, best first
+        notional: Quote amount to fill
+
+    Returns:
+        Average fill price, or None if the levels cannot fill the notional
+    """
+    remaining = notional
+    quantity = 0.0
+    for price, size in levels:
+        level_notional = price * size
+        if level_notional >= remaining:
+            quantity += remaining / price
+            return notional / quantity
+        remaining -= level_notional
+        quantity += size
+    return None
+
+
+def compute_book_features(book: LocalOrderBook, levels: int = 10,
+                          target_notional: float = 10000.0) -> OrderBookFeatures:
+    """
+    Compute features from the top levels of a book
+
+    Args:
+        book: Local order book
+        levels: Number of levels per side considered
+        target_notional: Quote amount used for the fill-price estimate
+
+    Returns:
+        OrderBookFeatures
+    """
+    with book.lock:
+        bids, asks = book.depth(levels)
+        sequence = book.sequence
+
+    bid_depth = sum(size for _, size in bids)
+    ask_depth = sum(size for _, size in asks)
+    total_depth = bid_depth + ask_depth
+
+    mid = spread = microprice = None
+    if bids and asks:
+        (bid, bid_size), (ask, ask_size) = bids[0], asks[0]
+        mid = (bid + ask) / 2
+        spread = ask - bid
+        microprice = (bid * ask_size + ask * bid_size) / (bid_size + ask_size)
+
+    buy_fill = fill_price(asks, target_notional)
+    sell_fill = fill_price(bids, target_notional)
+
+    return OrderBookFeatures(
+        symbol=book.symbol,
+        sequence=sequence,
+        mid=mid,
+        spread=spread,
+        microprice=microprice,
+        imbalance=(bid_depth - ask_depth) / total_depth if total_depth else 0.0,
+        bid_depth=bid_depth,
+        ask_depth=ask_depth,
+        bid_notional=sum(price * size for price, size in bids),
+        ask_notional=sum(price * size for price, size in asks),
+        buy_fill_price=buy_fill,
+        sell_fill_price=sell_fill,
+        buy_slippage_bps=(buy_fill - mid) / mid * 1e4 if buy_fill and mid else None,
+        sell_slippage_bps=(mid - sell_fill) / mid * 1e4 if sell_fill and mid else None,
+    )
+
+
+class OrderBookFeatureStage:
+    """Per-symbol feature cache refreshed on each book update"""
+
+    def __init__(self, levels: int = 10, target_notional: float = 10000.0):
+        """
+        Initialize feature stage
+
+        Args:
+            levels: Number of levels per side considered
+            target_notional: Quote amount used for the fill-price estimate
+        """
+        self.levels = levels
+        self.target_notional = target_notional
+        self._features: Dict[str, Tuple[int, OrderBookFeatures]] = {}
+        self._lock = Lock()
+
+    def update(self, book: LocalOrderBook) -> OrderBookFeatures:
+        """Recompute features if the book changed since the last call"""
+        version = book.updates
+        cached = self._features.get(book.symbol)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        features = compute_book_features(book, self.levels, self.target_notional)
+        with self._lock:
+            self._features[book.symbol] = (version, features)
+        return features
+
+    def get(self, symbol: str) -> Optional[OrderBookFeatures]:
+        cached = self._features.get(symbol)
+        return cached[1] if cached else None
+
+    def indicators(self, symbol: str) -> Dict[str, Any]:
+        """Latest features for a symbol as MarketContext indicators ({} if none)"""
+        features = self.get(symbol)
+        return features.as_indicators() if features else {}
@@ -4,10 +4,17 @@ Provides common interface for all trading strategies
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Any, Optional, List, Sequence, Set, Tuple, Union
+from dataclasses import dataclass, field
 from enum import Enum
 import logging
+import math
+import multiprocessing
+import os
+import time
+
+import numpy as np
 
 from utils.logging_setup import LoggerMixin
 
@@ -22,6 +29,49 @@ class SignalType(Enum):
     CLOSE = "CLOSE"
 
 
+class SignalReason:
+    """
+    Signal explanation kept as (template, values) pairs
+    
+    Text is rendered with str.format on first str() and cached, so
+    evaluations that never emit or log a signal pay no formatting cost.
+    Compares equal to its rendered text.
+    """
+    
+    __slots__ = ("parts", "_text")
+    
+    def __init__(self, template: Optional[str] = None, *values: Any):
+        self.parts: List[Tuple[str, Tuple[Any, ...]]] = []
+        self._text: Optional[str] = None
+        if template is not None:
+            self.add(template, *values)
+    
+    def add(self, template: str, *values: Any) -> "SignalReason":
+        """Append one condition"""
+        self.parts.append((template, values))
+        self._text = None
+        return self
+    
+    def __len__(self) -> int:
+        return len(self.parts)
+    
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = "; ".join(template.format(*values) for template, values in self.parts)
+        return self._text
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (SignalReason, str)):
+            return str(self) == str(other)
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash(str(self))
+    
+    def __repr__(self) -> str:
+        return f"SignalReason({str(self)!r})"
+
+
 @dataclass
 class TradingSignal:
     """Trading signal structure"""
@@ -32,7 +82,7 @@ class TradingSignal:
     quantity: Optional[float] = None
     stop_loss: Optional[float] = None
     take_profit: Optional[float] = None
-    reason: str = ""
+    reason: Union[str, SignalReason] = ""  # str(signal.reason) for the text
     timestamp: Optional[str] = None
 
 
@@ -42,14 +92,92 @@ class MarketContext:
     symbol: str
     current_price: float
     volume: float
-    price_history: List[float]
+    price_history: Sequence[float]  # list or NumPy view from the feed's ring buffer
     indicators: Dict[str, Any]
     timestamp: str
+    history_seq: Optional[int] = None  # ring buffer sequence number for price_history
+
+
+@dataclass
+class UniverseArrays:
+    """Aligned NumPy inputs for a universe of symbols (row i is symbol i)"""
+    symbols: List[str]
+    prices: np.ndarray  # (n,) current prices
+    volumes: np.ndarray  # (n,)
+    history: np.ndarray  # (n, window) most recent prices, oldest first, NaN left-padded
+    lengths: np.ndarray  # (n,) full price_history length per symbol
+    timestamps: List[str]
+    
+    @classmethod
+    def from_contexts(cls, contexts: Sequence[MarketContext], window: int) -> "UniverseArrays":
+        """
+        Stack the last window prices of each context into one matrix
+        
+        Args:
+            contexts: Market contexts, one per symbol
+            window: Number of trailing prices kept per symbol
+            
+        Returns:
+            UniverseArrays
+        """
+        n = len(contexts)
+        history = np.full((n, window), np.nan)
+        lengths = np.zeros(n, dtype=np.int64)
+        for row, context in enumerate(contexts):
+            tail = np.asarray(context.price_history[-window:], dtype=np.float64)
+            if len(tail):
+                history[row, window - len(tail):] = tail
+            lengths[row] = len(context.price_history)
+        
+        return cls(
+            symbols=[context.symbol for context in contexts],
+            prices=np.fromiter((context.current_price for context in contexts), np.float64, n),
+            volumes=np.fromiter((context.volume for context in contexts), np.float64, n),
+            history=history,
+            lengths=lengths,
+            timestamps=[context.timestamp for context in contexts],
+        )
+    
+    def price_back(self, k: np.ndarray) -> np.ndarray:
+        """Per-row price k positions from the end (prices[-k]); k is an int array"""
+        rows = np.arange(len(self.symbols))
+        return self.history[rows, self.history.shape[1] - k]
+
+
+@dataclass
+class VectorSignals:
+    """Vectorized strategy output; arrays are aligned with UniverseArrays rows"""
+    buy: np.ndarray  # bool mask
+    sell: np.ndarray  # bool mask
+    confidence: np.ndarray
+    stop_loss: np.ndarray
+    take_profit: np.ndarray
+    reason: Callable[[int], SignalReason]  # builds the reason for one row, on demand
+    
+    @property
+    def emitted(self) -> np.ndarray:
+        """Row indices that produced a BUY or SELL signal"""
+        return np.flatnonzero(self.buy | self.sell)
+
+
+@dataclass
+class SignalBatch:
+    """Result of evaluating strategies over many symbols"""
+    signals: Dict[str, List[TradingSignal]]  # symbol -> signals, in input/strategy order
+    strategy_timings: Dict[str, float] = field(default_factory=dict)  # strategy -> seconds
+    
+    def all_signals(self) -> List[TradingSignal]:
+        """Flattened signals in deterministic order"""
+        return [signal for signals in self.signals.values() for signal in signals]
 
 
 class BaseStrategy(ABC, LoggerMixin):
     """Base class for all trading strategies"""
     
+    # True when generate_signals_batch evaluates all contexts at once (e.g. on
+    # stacked NumPy inputs) instead of looping over generate_signal
+    vectorized = False
+    
     def __init__(self, name: str, parameters: Optional[Dict[str, Any]] = None):
         """
         Initialize base strategy
@@ -67,6 +195,26 @@ class BaseStrategy(ABC, LoggerMixin):
             'win_rate': 0.0
         }
     
+    @classmethod
+    def from_parameters(cls, parameters: Dict[str, Any]) -> 'BaseStrategy':
+        """
+        Rebuild a strategy from its parameters inside a pool worker
+        
+        StrategyManager evaluates non-vectorized strategies on a process pool
+        by sending only the class and ``parameters``. The default calls
+        ``cls(parameters)``; strategies whose constructor takes other
+        arguments must override this. Instance state other than parameters
+        (performance_metrics, indicator caches) stays with the manager's
+        instance and is not seen or updated by workers.
+        
+        Args:
+            parameters: The parameters of the strategy being evaluated
+            
+        Returns:
+            Strategy instance with the same class and parameters
+        """
+        return cls(parameters)
+    
     @abstractmethod
     def generate_signal(self, market_context: MarketContext) -> Optional[TradingSignal]:
         """
@@ -80,6 +228,103 @@ class BaseStrategy(ABC, LoggerMixin):
         """
         pass
     
+    def history_window(self) -> Optional[int]:
+        """Trailing prices per symbol needed by evaluate_universe (None if unsupported)"""
+        return None
+    
+    def evaluate_universe(self, universe: UniverseArrays) -> Optional[VectorSignals]:
+        """
+        Vectorized counterpart of generate_signal (optional)
+        
+        Strategies that implement it, together with history_window, set
+        ``vectorized = True``. Masks must already include the confidence
+        threshold and data sufficiency checks; reason strings are only built
+        for rows that emit a signal.
+        
+        Args:
+            universe: Aligned inputs for every symbol
+            
+        Returns:
+            VectorSignals, or None to fall back to per-context generate_signal
+        """
+        return None
+    
+    def generate_signals_batch(self, contexts: Sequence[MarketContext]) -> List[Optional[TradingSignal]]:
+        """
+        Generate validated signals for many symbols
+        
+        Args:
+            contexts: Market contexts, one per symbol
+            
+        Returns:
+            One validated signal or None per context, in input order
+        """
+        if self.vectorized:
+            results = self._generate_vectorized(contexts)
+            if results is not None:
+                return results
+        
+        results = []
+        for context in contexts:
+            try:
+                signal = self.generate_signal(context)
+                if signal and not self.validate_signal(signal, context):
+                    signal = None
+            except Exception as e:
+                self.logger.error(f"Error generating signal for {context.symbol}: {e}")
+                signal = None
+            results.append(signal)
+        return results
+    
+    def _generate_vectorized(self, contexts: Sequence[MarketContext]) -> Optional[List[Optional[TradingSignal]]]:
+        """
+        Run evaluate_universe and materialise signals only for emitting rows
+        
+        Returns None when the strategy does not provide the vectorized hooks.
+        """
+        results: List[Optional[TradingSignal]] = [None] * len(contexts)
+        if not contexts or not self.is_active():
+            return results
+        
+        window = self.history_window()
+        if window is None:
+            return None
+        output = self.evaluate_universe(UniverseArrays.from_contexts(contexts, window))
+        if output is None:
+            return None
+        
+        for row in output.emitted:
+            context = contexts[row]
+            signal_type = SignalType.BUY if output.buy[row] else SignalType.SELL
+            reason = output.reason(row)
+            signal = TradingSignal(
+                symbol=context.symbol,
+                signal_type=signal_type,
+                confidence=float(output.confidence[row]),
+                price=context.current_price,
+                stop_loss=float(output.stop_loss[row]),
+                take_profit=float(output.take_profit[row]),
+                reason=reason,
+                timestamp=context.timestamp
+            )
+            try:
+                if not self.validate_signal(signal, context):
+                    continue
+            except Exception as e:
+                self.logger.error(f"Error validating signal for {context.symbol}: {e}")
+                continue
+            self.logger.info("Generated %s signal for %s: %s", signal_type.value, context.symbol, reason)
+            results[row] = signal
+        return results
+    
+    def _vector_levels(self, prices: np.ndarray, buy: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Stop-loss and take-profit arrays (BUY rows long, others short)"""
+        stop_loss_pct = self.get_parameter('stop_loss_pct')
+        take_profit_pct = self.get_parameter('take_profit_pct')
+        direction = np.where(buy, 1.0, -1.0)
+        return (prices * (1 - direction * stop_loss_pct),
+                prices * (1 + direction * take_profit_pct))
+    
     @abstractmethod
     def validate_signal(self, signal: TradingSignal, market_context: MarketContext) -> bool:
         """
@@ -234,12 +479,52 @@ class BaseStrategy(ABC, LoggerMixin):
         return f"Strategy(name='{self.name}', active={self.active}, parameters={self.parameters})"
 
 
+# Strategy instances rebuilt inside pool workers, keyed by class and parameters
+_worker_strategies: Dict[Tuple[type, str], BaseStrategy] = {}
+
+
+class StrategyRebuildError(TypeError):
+    """from_parameters did not reproduce the strategy in a pool worker"""
+
+
+def _evaluate_in_worker(strategy_class: type, parameters: Dict[str, Any],
+                        contexts: List[MarketContext]) -> List[Optional[TradingSignal]]:
+    """Process-pool entry point: evaluate one chunk of contexts"""
+    key = (strategy_class, repr(sorted(parameters.items())))
+    strategy = _worker_strategies.get(key)
+    if strategy is None:
+        try:
+            strategy = strategy_class.from_parameters(parameters)
+        except TypeError as e:
+            raise StrategyRebuildError(
+                f"{strategy_class.__name__}.from_parameters failed ({e}); override it for custom constructors"
+            ) from e
+        if type(strategy) is not strategy_class or strategy.parameters != parameters:
+            raise StrategyRebuildError(
+                f"{strategy_class.__name__}.from_parameters did not reproduce the strategy's parameters"
+            )
+        _worker_strategies[key] = strategy
+    return strategy.generate_signals_batch(contexts)
+
+
 class StrategyManager(LoggerMixin):
     """Manager for multiple trading strategies"""
     
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None, process_threshold: int = 64):
+        """
+        Initialize strategy manager
+        
+        Args:
+            max_workers: Process pool size for batch evaluation of non-vectorized
+                strategies (defaults to the CPU count; 0 or 1 disables the pool)
+            process_threshold: Minimum batch size before the pool is used
+        """
         self.strategies: Dict[str, BaseStrategy] = {}
         self.active_strategies: List[str] = []
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self.process_threshold = process_threshold
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._in_process_classes: Set[type] = set()
     
     def add_strategy(self, strategy: BaseStrategy):
         """Add a strategy to the manager"""
@@ -285,6 +570,81 @@ class StrategyManager(LoggerMixin):
         
         return signals
     
+    def generate_signals_batch(self, contexts: Sequence[MarketContext]) -> SignalBatch:
+        """
+        Evaluate all active strategies across many symbols
+        
+        Vectorized strategies evaluate the whole batch in-process. Others are
+        split into contiguous chunks across a process pool when the batch is
+        at least process_threshold contexts; workers rebuild the strategy with
+        ``from_parameters`` and their own indicator state, so results match a
+        serial run. A strategy that cannot be rebuilt runs in-process from
+        then on.
+        
+        Args:
+            contexts: Market contexts, one per symbol
+            
+        Returns:
+            SignalBatch with signals grouped by symbol in input order (and
+            strategy order within a symbol) plus per-strategy wall time
+        """
+        contexts = list(contexts)
+        grouped: Dict[str, List[TradingSignal]] = {context.symbol: [] for context in contexts}
+        timings: Dict[str, float] = {}
+        
+        for strategy_name in self.active_strategies:
+            strategy = self.strategies[strategy_name]
+            started = time.perf_counter()
+            try:
+                results = self._evaluate_strategy(strategy, contexts)
+                for context, signal in zip(contexts, results):
+                    if signal:
+                        grouped[context.symbol].append(signal)
+            except Exception as e:
+                self.logger.error(f"Error generating batch signals from {strategy_name}: {e}")
+            timings[strategy_name] = time.perf_counter() - started
+        
+        return SignalBatch(signals=grouped, strategy_timings=timings)
+    
+    def _evaluate_strategy(self, strategy: BaseStrategy,
+                           contexts: List[MarketContext]) -> List[Optional[TradingSignal]]:
+        """Evaluate one strategy over the batch, in-process or on the pool"""
+        if (strategy.vectorized or self.max_workers <= 1 or len(contexts) < self.process_threshold
+                or type(strategy) in self._in_process_classes):
+            return strategy.generate_signals_batch(contexts)
+        
+        chunk_size = math.ceil(len(contexts) / self.max_workers)
+        chunks = [contexts[i:i + chunk_size] for i in range(0, len(contexts), chunk_size)]
+        try:
+            pool = self._get_pool()
+            futures = [
+                pool.submit(_evaluate_in_worker, type(strategy), strategy.parameters, chunk)
+                for chunk in chunks
+            ]
+            return [signal for future in futures for signal in future.result()]
+        except StrategyRebuildError as e:
+            self._in_process_classes.add(type(strategy))
+            self.logger.warning(f"Running {strategy.name} in-process: {e}")
+            return strategy.generate_signals_batch(contexts)
+        except Exception as e:
+            self.logger.warning(f"Process pool evaluation failed for {strategy.name}, running in-process: {e}")
+            return strategy.generate_signals_batch(contexts)
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: forking a process that owns feed/websocket threads is unsafe
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+    
+    def close(self):
+        """Shut down the batch evaluation process pool"""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+    
     def get_strategy_performance(self) -> Dict[str, Dict[str, Any]]:
         """Get performance metrics for all strategies"""
         return {
@@ -3,20 +3,33 @@ Mean reversion trading strategy for CryptoFuturesBot
 Generates signals based on price mean reversion patterns
 """
 
-from typing import Optional, List
+from typing import Optional, Sequence
+
 import numpy as np
 
-from .base_strategy import BaseStrategy, TradingSignal, MarketContext, SignalType
+from .base_strategy import (
+    BaseStrategy, TradingSignal, MarketContext, SignalReason, SignalType, UniverseArrays, VectorSignals
+)
+from .streaming_indicators import StreamingIndicatorEngine, get_indicator_engine
 
 class MeanReversionStrategy(BaseStrategy):
     """Mean reversion trading strategy"""
     
-    def __init__(self, parameters: Optional[dict] = None):
+    MOMENTUM_PERIOD = 10
+    vectorized = True
+    
+    # SignalReason templates
+    OVERSOLD = "Oversold condition (Z-score: {:.2f}) with negative momentum"
+    OVERBOUGHT = "Overbought condition (Z-score: {:.2f}) with positive momentum"
+    
+    def __init__(self, parameters: Optional[dict] = None,
+                 indicator_engine: Optional[StreamingIndicatorEngine] = None):
         """
         Initialize mean reversion strategy
         
         Args:
             parameters: Strategy parameters
+            indicator_engine: Streaming indicator state (shared engine by default)
         """
         default_params = {
             'lookback_period': 20,
@@ -32,6 +45,12 @@ class MeanReversionStrategy(BaseStrategy):
             default_params.update(parameters)
         
         super().__init__("MeanReversion", default_params)
+        
+        self.indicator_engine = indicator_engine or get_indicator_engine()
+        self.indicator_engine.register_periods(
+            self.get_parameter('lookback_period'),
+            self.MOMENTUM_PERIOD
+        )
     
     def generate_signal(self, market_context: MarketContext) -> Optional[TradingSignal]:
         """
@@ -51,7 +70,7 @@ class MeanReversionStrategy(BaseStrategy):
             
             # Check if we have enough data
             if len(market_context.price_history) < lookback_period:
-                self.logger.debug(f"Insufficient price history for {market_context.symbol}")
+                self.logger.debug("Insufficient price history for %s", market_context.symbol)
                 return None
             
             # Check minimum volume requirement
@@ -59,7 +78,9 @@ class MeanReversionStrategy(BaseStrategy):
                 return None
             
             # Calculate indicators
-            indicators = self._calculate_indicators(market_context.price_history)
+            indicators = self._calculate_indicators(
+                market_context.price_history, market_context.symbol, market_context.history_seq
+            )
             
             # Generate signal based on mean reversion
             signal_type, confidence, reason = self._evaluate_mean_reversion(
@@ -89,27 +110,76 @@ class MeanReversionStrategy(BaseStrategy):
                 timestamp=market_context.timestamp
             )
             
-            self.logger.info(f"Generated {signal_type.value} signal for {market_context.symbol}: {reason}")
+            self.logger.info("Generated %s signal for %s: %s",
+                             signal_type.value, market_context.symbol, reason)
             return signal
             
         except Exception as e:
             self.logger.error(f"Error generating mean reversion signal: {e}")
             return None
     
-    def _calculate_indicators(self, price_history: List[float]) -> dict:
-        """Calculate mean reversion indicators"""
+    def history_window(self) -> int:
+        """Trailing prices needed by evaluate_universe"""
+        return max(self.get_parameter('lookback_period'), self.MOMENTUM_PERIOD) + 1
+    
+    def evaluate_universe(self, universe: UniverseArrays) -> VectorSignals:
+        """
+        Mean reversion conditions for every symbol at once
+        
+        Args:
+            universe: Aligned inputs for every symbol
+            
+        Returns:
+            VectorSignals
+        """
+        lookback_period = self.get_parameter('lookback_period')
+        threshold = self.get_parameter('std_dev_threshold')
+        history = universe.history
+        
+        eligible = ((universe.lengths >= lookback_period)
+                    & (universe.volumes >= self.get_parameter('min_volume')))
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            window = history[:, -lookback_period:]
+            mean_price = window.mean(axis=1)
+            std_dev = window.std(axis=1)
+            current = history[:, -1]
+            z_score = np.where(std_dev > 0, (current - mean_price) / std_dev, 0.0)
+            lag = np.clip(np.minimum(self.MOMENTUM_PERIOD, universe.lengths - 1), 1, history.shape[1])
+            lagged = universe.price_back(lag)
+            momentum = (current - lagged) / lagged
+            volatility = np.where(mean_price > 0, std_dev / mean_price, 0.0)
+        
+        buy = (z_score < -threshold) & (momentum < 0)
+        sell = (z_score > threshold) & (momentum > 0)
+        
+        confidence = np.minimum(0.9, 0.5 + np.abs(z_score) * 0.1)
+        confidence = np.where(volatility > 0.05, confidence * 0.8,
+                              np.where(volatility < 0.02, confidence * 1.1, confidence))
+        confidence = np.minimum(confidence, 1.0)
+        
+        emit = eligible & (confidence >= self.get_parameter('confidence_threshold'))
+        buy &= emit
+        sell &= emit
+        stop_loss, take_profit = self._vector_levels(universe.prices, buy)
+        
+        def reason(row: int) -> SignalReason:
+            return SignalReason(self.OVERSOLD if buy[row] else self.OVERBOUGHT, z_score[row])
+        
+        return VectorSignals(buy, sell, confidence, stop_loss, take_profit, reason)
+    
+    def _calculate_indicators(self, price_history: Sequence[float], symbol: str = "",
+                              history_seq: Optional[int] = None) -> dict:
+        """Calculate mean reversion indicators from streaming state"""
         try:
-            prices = np.array(price_history)
+            state = self.indicator_engine.sync(symbol, price_history, history_seq)
             lookback_period = self.get_parameter('lookback_period')
             
-            # Use the last lookback_period prices
-            recent_prices = prices[-lookback_period:]
-            
-            # Calculate moving average and standard deviation
-            mean_price = np.mean(recent_prices)
-            std_dev = np.std(recent_prices)
+            # Moving average and standard deviation over the lookback window
+            mean_price = state.mean(lookback_period)
+            std_dev = state.std(lookback_period)
             
-            current_price = prices[-1]
+            current_price = state.last_price
             
             # Calculate Z-score (how many standard deviations from mean)
             z_score = (current_price - mean_price) / std_dev if std_dev > 0 else 0
@@ -119,8 +189,9 @@ class MeanReversionStrategy(BaseStrategy):
             lower_band = mean_price - (2 * std_dev)
             
             # Calculate momentum to confirm mean reversion
-            momentum_period = min(10, len(prices) - 1)
-            momentum = (prices[-1] - prices[-momentum_period]) / prices[-momentum_period]
+            momentum_period = min(self.MOMENTUM_PERIOD, len(price_history) - 1)
+            lagged_price = state.price_back(momentum_period)
+            momentum = (current_price - lagged_price) / lagged_price
             
             # Recent price volatility
             volatility = std_dev / mean_price if mean_price > 0 else 0
@@ -150,7 +221,7 @@ class MeanReversionStrategy(BaseStrategy):
             volatility = indicators.get('volatility', 0)
             
             confidence = 0.0
-            reason = ""
+            reason = SignalReason()
             signal_type = SignalType.HOLD
             
             # Mean reversion conditions
@@ -162,13 +233,13 @@ class MeanReversionStrategy(BaseStrategy):
                 # Price is oversold and still declining - potential reversal
                 signal_type = SignalType.BUY
                 confidence = min(0.9, 0.5 + abs(z_score) * 0.1)
-                reason = f"Oversold condition (Z-score: {z_score:.2f}) with negative momentum"
+                reason = SignalReason(self.OVERSOLD, z_score)
                 
             elif overbought and momentum > 0:
                 # Price is overbought and still rising - potential reversal
                 signal_type = SignalType.SELL
                 confidence = min(0.9, 0.5 + abs(z_score) * 0.1)
-                reason = f"Overbought condition (Z-score: {z_score:.2f}) with positive momentum"
+                reason = SignalReason(self.OVERBOUGHT, z_score)
             
             # Adjust confidence based on volatility
             if volatility > 0.05:  # High volatility reduces confidence
@@ -183,7 +254,7 @@ class MeanReversionStrategy(BaseStrategy):
             
         except Exception as e:
             self.logger.error(f"Error evaluating mean reversion: {e}")
-            return SignalType.HOLD, 0.0, "Error in evaluation"
+            return SignalType.HOLD, 0.0, SignalReason("Error in evaluation")
     
     def _calculate_levels(self, price: float, signal_type: SignalType) -> tuple:
         """Calculate stop loss and take profit levels"""
@@ -3,21 +3,37 @@ Simple momentum trading strategy for CryptoFuturesBot
 Generates signals based on price momentum and moving averages
 """
 
-from typing import Optional, List
+from typing import Optional, Sequence
+
 import numpy as np
 
-from .base_strategy import BaseStrategy, TradingSignal, MarketContext, SignalType
+from .base_strategy import (
+    BaseStrategy, TradingSignal, MarketContext, SignalReason, SignalType, UniverseArrays, VectorSignals
+)
+from .streaming_indicators import StreamingIndicatorEngine, get_indicator_engine
 from utils.logging_setup import LoggerMixin
 
 class SimpleMomentumStrategy(BaseStrategy):
     """Simple momentum-based trading strategy"""
     
-    def __init__(self, parameters: Optional[dict] = None):
+    vectorized = True
+    
+    # SignalReason templates
+    STRONG_UP = "Strong upward momentum: {:.2%}"
+    STRONG_DOWN = "Strong downward momentum: {:.2%}"
+    ABOVE_FAST = "Price above fast MA and fast MA > slow MA"
+    BELOW_FAST = "Price below fast MA and fast MA < slow MA"
+    ABOVE_SLOW = "Price above slow MA"
+    BELOW_SLOW = "Price below slow MA"
+    
+    def __init__(self, parameters: Optional[dict] = None,
+                 indicator_engine: Optional[StreamingIndicatorEngine] = None):
         """
         Initialize momentum strategy
         
         Args:
             parameters: Strategy parameters
+            indicator_engine: Streaming indicator state (shared engine by default)
         """
         default_params = {
             'fast_ma_period': 10,
@@ -33,6 +49,12 @@ class SimpleMomentumStrategy(BaseStrategy):
             default_params.update(parameters)
         
         super().__init__("SimpleMomentum", default_params)
+        
+        self.indicator_engine = indicator_engine or get_indicator_engine()
+        self.indicator_engine.register_periods(
+            self.get_parameter('fast_ma_period'),
+            self.get_parameter('slow_ma_period')
+        )
     
     def generate_signal(self, market_context: MarketContext) -> Optional[TradingSignal]:
         """
@@ -50,7 +72,7 @@ class SimpleMomentumStrategy(BaseStrategy):
             
             # Check if we have enough data
             if len(market_context.price_history) < self.get_parameter('slow_ma_period'):
-                self.logger.debug(f"Insufficient price history for {market_context.symbol}")
+                self.logger.debug("Insufficient price history for %s", market_context.symbol)
                 return None
             
             # Check minimum volume requirement
@@ -58,7 +80,9 @@ class SimpleMomentumStrategy(BaseStrategy):
                 return None
             
             # Calculate indicators
-            indicators = self._calculate_indicators(market_context.price_history)
+            indicators = self._calculate_indicators(
+                market_context.price_history, market_context.symbol, market_context.history_seq
+            )
             
             # Generate signal based on conditions
             signal_type, confidence, reason = self._evaluate_conditions(
@@ -88,31 +112,105 @@ class SimpleMomentumStrategy(BaseStrategy):
                 timestamp=market_context.timestamp
             )
             
-            self.logger.info(f"Generated {signal_type.value} signal for {market_context.symbol}: {reason}")
+            self.logger.info("Generated %s signal for %s: %s",
+                             signal_type.value, market_context.symbol, reason)
             return signal
             
         except Exception as e:
             self.logger.error(f"Error generating momentum signal: {e}")
             return None
     
-    def _calculate_indicators(self, price_history: List[float]) -> dict:
-        """Calculate technical indicators"""
+    def history_window(self) -> int:
+        """Trailing prices needed by evaluate_universe"""
+        return max(self.get_parameter('fast_ma_period'), self.get_parameter('slow_ma_period')) + 1
+    
+    def evaluate_universe(self, universe: UniverseArrays) -> VectorSignals:
+        """
+        Momentum conditions for every symbol at once
+        
+        Args:
+            universe: Aligned inputs for every symbol
+            
+        Returns:
+            VectorSignals
+        """
+        fast_period = self.get_parameter('fast_ma_period')
+        slow_period = self.get_parameter('slow_ma_period')
+        momentum_threshold = self.get_parameter('momentum_threshold')
+        history = universe.history
+        
+        eligible = ((universe.lengths >= slow_period)
+                    & (universe.volumes >= self.get_parameter('min_volume')))
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            fast_ma = history[:, -fast_period:].mean(axis=1)
+            slow_ma = history[:, -slow_period:].mean(axis=1)
+            current = history[:, -1]
+            lag = np.clip(np.minimum(fast_period, universe.lengths - 1), 1, history.shape[1])
+            lagged = universe.price_back(lag)
+            momentum = (current - lagged) / lagged
+            volatility = history[:, -fast_period:].std(axis=1) / fast_ma
+        
+        strong_up = momentum > momentum_threshold
+        strong_down = momentum < -momentum_threshold
+        above_fast = current > fast_ma
+        above_slow = current > slow_ma
+        crossover = fast_ma > slow_ma
+        
+        bullish = strong_up.astype(int) + (crossover & above_fast) + above_slow
+        bearish = strong_down.astype(int) + (~crossover & ~above_fast) + ~above_slow
+        buy = bullish >= 2
+        sell = ~buy & (bearish >= 2)
+        
+        count = np.where(buy, bullish, bearish)
+        confidence = np.minimum(0.9, 0.3 + count * 0.2)
+        confidence = np.where(volatility > 0.05, confidence * 0.8, confidence)
+        
+        emit = eligible & (confidence >= self.get_parameter('confidence_threshold'))
+        buy &= emit
+        sell &= emit
+        stop_loss, take_profit = self._vector_levels(universe.prices, buy)
+        
+        def reason(row: int) -> SignalReason:
+            conditions = SignalReason()
+            if buy[row]:
+                if strong_up[row]:
+                    conditions.add(self.STRONG_UP, momentum[row])
+                if crossover[row] and above_fast[row]:
+                    conditions.add(self.ABOVE_FAST)
+                if above_slow[row]:
+                    conditions.add(self.ABOVE_SLOW)
+            else:
+                if strong_down[row]:
+                    conditions.add(self.STRONG_DOWN, momentum[row])
+                if not crossover[row] and not above_fast[row]:
+                    conditions.add(self.BELOW_FAST)
+                if not above_slow[row]:
+                    conditions.add(self.BELOW_SLOW)
+            return conditions
+        
+        return VectorSignals(buy, sell, confidence, stop_loss, take_profit, reason)
+    
+    def _calculate_indicators(self, price_history: Sequence[float], symbol: str = "",
+                              history_seq: Optional[int] = None) -> dict:
+        """Calculate technical indicators from streaming state"""
         try:
-            prices = np.array(price_history)
+            state = self.indicator_engine.sync(symbol, price_history, history_seq)
             
             fast_period = self.get_parameter('fast_ma_period')
             slow_period = self.get_parameter('slow_ma_period')
             
             # Moving averages
-            fast_ma = np.mean(prices[-fast_period:])
-            slow_ma = np.mean(prices[-slow_period:])
+            fast_ma = state.mean(fast_period)
+            slow_ma = state.mean(slow_period)
             
             # Momentum
-            momentum_period = min(fast_period, len(prices) - 1)
-            momentum = (prices[-1] - prices[-momentum_period]) / prices[-momentum_period]
+            momentum_period = min(fast_period, len(price_history) - 1)
+            lagged_price = state.price_back(momentum_period)
+            current_price = state.last_price
+            momentum = (current_price - lagged_price) / lagged_price
             
             # Price position relative to moving averages
-            current_price = prices[-1]
             price_above_fast_ma = current_price > fast_ma
             price_above_slow_ma = current_price > slow_ma
             
@@ -120,7 +218,7 @@ class SimpleMomentumStrategy(BaseStrategy):
             ma_crossover_bullish = fast_ma > slow_ma
             
             # Volatility (standard deviation)
-            volatility = np.std(prices[-fast_period:]) / np.mean(prices[-fast_period:])
+            volatility = state.std(fast_period) / fast_ma
             
             return {
                 'fast_ma': fast_ma,
@@ -146,43 +244,43 @@ class SimpleMomentumStrategy(BaseStrategy):
             
             # Initialize confidence and reason
             confidence = 0.0
-            reason = ""
+            reason = SignalReason()
             signal_type = SignalType.HOLD
             
-            # Bullish conditions
-            bullish_conditions = []
-            bearish_conditions = []
+            # Conditions keep raw values; text is only rendered if the signal is used
+            bullish_conditions = SignalReason()
+            bearish_conditions = SignalReason()
             
             # Check momentum
             if momentum > momentum_threshold:
-                bullish_conditions.append(f"Strong upward momentum: {momentum:.2%}")
+                bullish_conditions.add(self.STRONG_UP, momentum)
             elif momentum < -momentum_threshold:
-                bearish_conditions.append(f"Strong downward momentum: {momentum:.2%}")
+                bearish_conditions.add(self.STRONG_DOWN, momentum)
             
             # Check moving average conditions
             if indicators.get('ma_crossover_bullish', False):
                 if indicators.get('price_above_fast_ma', False):
-                    bullish_conditions.append("Price above fast MA and fast MA > slow MA")
+                    bullish_conditions.add(self.ABOVE_FAST)
             else:
                 if not indicators.get('price_above_fast_ma', True):
-                    bearish_conditions.append("Price below fast MA and fast MA < slow MA")
+                    bearish_conditions.add(self.BELOW_FAST)
             
             # Check price position
             if indicators.get('price_above_slow_ma', False):
-                bullish_conditions.append("Price above slow MA")
+                bullish_conditions.add(self.ABOVE_SLOW)
             else:
-                bearish_conditions.append("Price below slow MA")
+                bearish_conditions.add(self.BELOW_SLOW)
             
             # Evaluate overall signal
             if len(bullish_conditions) >= 2:
                 signal_type = SignalType.BUY
                 confidence = min(0.9, 0.3 + (len(bullish_conditions) * 0.2))
-                reason = "; ".join(bullish_conditions)
+                reason = bullish_conditions
                 
             elif len(bearish_conditions) >= 2:
                 signal_type = SignalType.SELL
                 confidence = min(0.9, 0.3 + (len(bearish_conditions) * 0.2))
-                reason = "; ".join(bearish_conditions)
+                reason = bearish_conditions
             
             # Adjust confidence based on volatility
             volatility = indicators.get('volatility', 0)
@@ -193,7 +291,7 @@ class SimpleMomentumStrategy(BaseStrategy):
             
         except Exception as e:
             self.logger.error(f"Error evaluating conditions: {e}")
-            return SignalType.HOLD, 0.0, "Error in evaluation"
+            return SignalType.HOLD, 0.0, SignalReason("Error in evaluation")
     
     def _calculate_levels(self, price: float, signal_type: SignalType) -> tuple:
         """Calculate stop loss and take profit levels"""
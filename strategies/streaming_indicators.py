@@ -0,0 +1,206 @@
+"""
+Streaming indicator engine for CryptoFuturesBot
+Maintains rolling SMA/variance/momentum state per symbol with O(1) updates
+"""
+
+import math
+from threading import Lock
+from typing import Dict, Iterable, Optional, Sequence
+
+# Rolling sums drift slowly under floating point; rebuild them exactly
+# from the raw window every this many pushes.
+_RESYNC_INTERVAL = 10_000
+
+
+class RollingStats:
+    """Sliding-window mean and population variance (Welford add/remove)"""
+
+    __slots__ = ('period', 'count', 'mean', 'm2')
+
+    def __init__(self, period: int):
+        self.period = period
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def remove(self, value: float):
+        if self.count <= 1:
+            self.count = 0
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+        self.count -= 1
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self.m2 -= delta * (value - self.mean)
+        if self.m2 < 0.0:
+            self.m2 = 0.0
+
+    def rebuild(self, values: Iterable[float]):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        for value in values:
+            self.add(value)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class SymbolIndicatorState:
+    """Rolling indicator state for one symbol"""
+
+    def __init__(self, periods: Iterable[int]):
+        """
+        Initialize symbol state
+
+        Args:
+            periods: Window lengths to maintain statistics for
+        """
+        self.periods = tuple(sorted(set(periods)))
+        self.capacity = max(self.periods) + 1
+        self.stats: Dict[int, RollingStats] = {p: RollingStats(p) for p in self.periods}
+        self.seq: Optional[int] = None
+        self._ring = [0.0] * self.capacity
+        self._head = 0
+        self._count = 0
+        self._pushes = 0
+        self.lock = Lock()
+
+    def clear(self):
+        """Forget all pushed prices"""
+        for stats in self.stats.values():
+            stats.rebuild(())
+        self.seq = None
+        self._head = 0
+        self._count = 0
+        self._pushes = 0
+
+    def push(self, price: float):
+        """Add one price, updating every window in O(number of windows)"""
+        price = float(price)
+        for period, stats in self.stats.items():
+            if self._count >= period:
+                stats.remove(self._ring[(self._head - period) % self.capacity])
+            stats.add(price)
+
+        self._ring[self._head] = price
+        self._head = (self._head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+        self._pushes += 1
+        if self._pushes % _RESYNC_INTERVAL == 0:
+            for period, stats in self.stats.items():
+                stats.rebuild(self.window(period))
+
+    def window(self, period: int) -> Sequence[float]:
+        """Most recent values for a window, oldest first"""
+        n = min(period, self._count)
+        return [self._ring[(self._head - n + i) % self.capacity] for i in range(n)]
+
+    def price_back(self, k: int) -> float:
+        """Price ``k`` positions from the end, matching ``prices[-k]``"""
+        return self._ring[(self._head - k) % self.capacity]
+
+    @property
+    def last_price(self) -> float:
+        return self.price_back(1)
+
+    def mean(self, period: int) -> float:
+        return self.stats[period].mean
+
+    def std(self, period: int) -> float:
+        return self.stats[period].std
+
+
+class StreamingIndicatorEngine:
+    """
+    Shared per-symbol indicator state for all strategies
+
+    Strategies register the window lengths they need and call ``sync`` with
+    the price history they were given. When the history carries a sequence
+    number (the feed's ring buffer ``total``), only prices appended since the
+    previous sync are pushed, so repeated calls from several strategies on
+    the same tick cost nothing extra. Without a sequence number the state is
+    rebuilt from the history.
+    """
+
+    def __init__(self):
+        self._periods = set()
+        self._period_key = ()
+        self._states: Dict[str, SymbolIndicatorState] = {}
+        self._lock = Lock()
+
+    def register_periods(self, *periods: int):
+        """Ensure windows of the given lengths are tracked for every symbol"""
+        with self._lock:
+            self._periods.update(int(p) for p in periods if p and p > 0)
+            self._period_key = tuple(sorted(self._periods))
+
+    def get_state(self, symbol: str) -> Optional[SymbolIndicatorState]:
+        """Get indicator state for a symbol if it has been synced"""
+        return self._states.get(symbol)
+
+    def sync(self, symbol: str, price_history: Sequence[float],
+             seq: Optional[int] = None) -> SymbolIndicatorState:
+        """
+        Bring a symbol's state up to date with its price history
+
+        Args:
+            symbol: Trading symbol
+            price_history: Prices oldest first
+            seq: Total number of prices ever appended to the history source
+
+        Returns:
+            Updated SymbolIndicatorState
+        """
+        state = self._states.get(symbol)
+        if state is None or state.periods != self._period_key:
+            with self._lock:
+                state = SymbolIndicatorState(self._period_key or (1,))
+                self._states[symbol] = state
+
+        with state.lock:
+            n = len(price_history)
+            new = None
+            if seq is not None and state.seq is not None:
+                new = seq - state.seq
+
+            if new is not None and 0 <= new <= n:
+                for i in range(n - new, n):
+                    state.push(price_history[i])
+            else:
+                state.clear()
+                for i in range(max(0, n - state.capacity), n):
+                    state.push(price_history[i])
+
+            state.seq = seq
+        return state
+
+    def reset(self, symbol: Optional[str] = None):
+        """Drop state for one symbol or all symbols"""
+        with self._lock:
+            if symbol is None:
+                self._states.clear()
+            else:
+                self._states.pop(symbol, None)
+
+
+_default_engine = StreamingIndicatorEngine()
+
+
+def get_indicator_engine() -> StreamingIndicatorEngine:
+    """Get the process-wide indicator engine shared by strategies"""
+    return _default_engine
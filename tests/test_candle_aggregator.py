@@ -0,0 +1,90 @@
+"""Tests for services/candle_aggregator.py and CandleRingBuffer."""
+
+import time
+
+import numpy as np
+import pytest
+
+from services.candle_aggregator import CandleAggregator
+from services.data_feed import LiveDataFeed
+from services.market_buffer import CandleRingBuffer
+
+
+def test_candle_ring_upserts_by_open_time():
+    ring = CandleRingBuffer(capacity=3)
+    assert ring.upsert(60, 1, 1, 1, 1, 1)
+    assert not ring.upsert(60, 1, 2, 1, 2, 3)  # in-progress update
+    for open_time in (120, 180, 240):
+        ring.upsert(open_time, 1, 1, 1, 1, 1)
+    assert not ring.upsert(180, 5, 5, 5, 5, 5)  # dedupe older bar in window
+    assert not ring.upsert(0, 9, 9, 9, 9, 9)  # older than the window
+
+    bars = ring.bars()
+    assert bars["open_time"].tolist() == [120, 180, 240]
+    assert bars["close"].tolist() == [1.0, 5.0, 1.0]
+    assert ring.total == 4
+    assert np.shares_memory(ring.column("close"), ring.bars())
+
+
+def test_one_pass_builds_all_intervals_and_emits_closes():
+    aggregator = CandleAggregator(intervals=("1s", "1m"), capacity=10)
+    closes = []
+    aggregator.on_bar_close(closes.append)
+
+    for ts, price in [(0, 10), (0, 12), (0, 9), (1, 11), (59, 13), (60, 14)]:
+        aggregator.add("BTCUSDT", price, 1.0, ts)
+
+    minute = aggregator.buffer("BTCUSDT", "1m").bars()
+    assert minute[0].tolist() == (0, 10.0, 13.0, 9.0, 13.0, 5.0, 5)
+    assert minute["open_time"].tolist() == [0, 60]
+
+    one_minute = [bar for bar in closes if bar.interval == "1m"]
+    assert len(one_minute) == 1 and one_minute[0].high == 13.0
+    assert [bar.open_time for bar in closes if bar.interval == "1s"] == [0, 1, 59]
+
+
+def test_close_due_and_late_trades():
+    aggregator = CandleAggregator(intervals=("1m",))
+    closes = []
+    aggregator.on_bar_close(closes.append)
+    aggregator.add("ETHUSDT", 100, 1, 10)
+
+    assert [bar.close for bar in aggregator.close_due(now=61)] == [100]
+    aggregator.add("ETHUSDT", 50, 1, 30)  # arrives after the bar closed
+    aggregator.add("ETHUSDT", 101, 1, 65)
+    assert aggregator.late_trades == 1
+    assert len(closes) == 1
+    assert aggregator.buffer("ETHUSDT", "1m").column("close").tolist() == [100.0, 101.0]
+
+
+def test_unknown_interval_rejected():
+    with pytest.raises(ValueError):
+        CandleAggregator(intervals=("2m",))
+
+
+def test_feed_aggregates_trades():
+    feed = LiveDataFeed(candle_intervals=("1m",))
+    for price in (1, 3, 2):
+        feed._process_ws_message({"type": "trade", "symbol": "BTCUSDT", "price": price, "quantity": 2})
+
+    bar = feed.get_candles("BTCUSDT", "1m")[-1]
+    assert (bar["open"], bar["high"], bar["low"], bar["close"], bar["volume"]) == (1, 3, 1, 2, 6)
+    assert len(feed.get_candles("ETHUSDT")) == 0
+
+
+def test_feed_bar_clock_closes_bars_without_further_trades():
+    feed = LiveDataFeed(candle_intervals=("1s",), bar_close_interval=0.05)
+    closed = []
+    feed.candles.on_bar_close(closed.append)
+    feed._process_ws_message({"type": "trade", "symbol": "BTCUSDT", "price": 5, "quantity": 1})
+
+    feed.start_bar_clock()
+    try:
+        deadline = time.time() + 3
+        while not closed and time.time() < deadline:
+            time.sleep(0.05)
+    finally:
+        feed.stop_event.set()
+        feed.bar_clock_thread.join(timeout=1)
+
+    assert [(bar.symbol, bar.close) for bar in closed] == [("BTCUSDT", 5.0)]
@@ -0,0 +1,74 @@
+"""Tests for core/clock_sync.py."""
+
+import time
+
+from core.clock_sync import ServerClock
+
+
+class _Response:
+    def __init__(self, payload=None, status_code=200, text=""):
+        self._payload = payload or {}
+        self.status_code = status_code
+        self.text = text
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+    def json(self):
+        return self._payload
+
+
+class _FakeTransport:
+    def __init__(self, skew_ms):
+        self.skew_ms = skew_ms
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        return _Response({"serverTime": int(time.time() * 1000 + self.skew_ms)})
+
+
+def test_epoch_uses_cached_offset():
+    transport = _FakeTransport(skew_ms=5000)
+    clock = ServerClock(transport=transport, samples=2)
+
+    epochs = [int(clock.epoch()) for _ in range(10)]
+    assert transport.calls == 2
+    assert abs(epochs[-1] - (time.time() * 1000 + 5000)) < 200
+    assert clock.metrics()["syncs"] == 1
+
+
+def test_resync_on_timestamp_rejection():
+    transport = _FakeTransport(skew_ms=0)
+    clock = ServerClock(transport=transport, samples=1)
+    clock.sync()
+    transport.skew_ms = 60000
+    sent = []
+
+    def send(epoch):
+        sent.append(int(epoch))
+        if len(sent) == 1:
+            return _Response(status_code=401, text='{"message":"Invalid epoch"}')
+        return _Response({"ok": True})
+
+    response = clock.call(send)
+
+    assert response.json() == {"ok": True}
+    assert sent[1] - sent[0] > 50000
+    metrics = clock.metrics()
+    assert metrics["timestamp_rejections"] == 1
+    assert metrics["syncs"] == 2
+    assert metrics["drift_ms_per_hour"] != 0.0
+
+
+def test_failed_sync_keeps_previous_offset():
+    transport = _FakeTransport(skew_ms=1000)
+    clock = ServerClock(transport=transport, samples=1)
+    clock.sync()
+    offset = clock.offset_ms()
+
+    transport.get = lambda url, **kwargs: _Response(status_code=503)
+    assert clock.sync() is False
+    assert clock.offset_ms() == offset
+    assert clock.metrics()["failures"] == 1
@@ -0,0 +1,39 @@
+"""Tests for bounded candle storage in bot/coinswitch_api.py."""
+
+import numpy as np
+import pytest
+
+from bot.coinswitch_api import CoinswitchAPI, parse_candle
+from services.market_buffer import CANDLE_DTYPE, CandleRingBuffer
+
+
+def test_parse_candle_formats():
+    assert parse_candle({"t": "60000", "o": "1", "h": "2", "l": "0.5", "c": "1.5", "v": "10"}) == (
+        60000, 1.0, 2.0, 0.5, 1.5, 10.0)
+    assert parse_candle([120000, 1, 2, 0.5, 1.5, 10, "extra"]) == (120000, 1.0, 2.0, 0.5, 1.5, 10.0)
+
+
+def test_memory_budget_bounds_capacity():
+    budget = 10 * 2 * CANDLE_DTYPE.itemsize
+    api = CoinswitchAPI(candle_memory_budget=budget)
+    for minute in range(25):
+        api.add_candle({"open_time": minute * 60000, "open": 1, "high": 1, "low": 1, "close": minute, "volume": 1})
+
+    assert api._candles.nbytes <= budget
+    assert len(api.candles) == 10
+    assert api.get_candles(3)["close"].tolist() == [22.0, 23.0, 24.0]
+
+    with pytest.raises(ValueError):
+        CandleRingBuffer.from_memory_budget(1)
+
+
+def test_in_progress_candle_updates_in_place():
+    api = CoinswitchAPI()
+    assert api.add_candle({"t": 0, "o": 1, "h": 1, "l": 1, "c": 1, "v": 1})
+    assert not api.add_candle({"t": 0, "o": 1, "h": 3, "l": 1, "c": 2, "v": 5})
+    assert not api.add_candle({"bad": "payload"})
+
+    candles = api.get_candles()
+    assert len(candles) == 1
+    assert (candles[0]["high"], candles[0]["close"], candles[0]["volume"]) == (3.0, 2.0, 5.0)
+    assert np.shares_memory(api.get_candles(1), api.candles)
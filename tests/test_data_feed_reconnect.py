@@ -0,0 +1,146 @@
+"""Tests for LiveDataFeed's supervised websocket reconnect loop."""
+
+import json
+
+from services import data_feed as data_feed_module
+from services.data_feed import LiveDataFeed, MarketData
+
+
+class _FlakySocket:
+    """WebSocketApp stand-in: connects, fails once, then connects and drops twice."""
+
+    runs = 0
+    feed = None
+    sent = []
+
+    def __init__(self, url, on_open, on_message, on_error, on_close):
+        self.on_open, self.on_close = on_open, on_close
+
+    def send(self, message):
+        type(self).sent.append(json.loads(message))
+
+    def close(self):
+        pass
+
+    def run_forever(self):
+        cls = type(self)
+        cls.runs += 1
+        if cls.runs in (1, 3, 4):
+            self.on_open(self)
+            # Stay connected until the post-reconnect backfill has resubscribed
+            if cls.feed.gap_fill_thread:
+                cls.feed.gap_fill_thread.join(timeout=5)
+        self.on_close(self, 1006, "dropped")
+        if cls.runs == 4:
+            cls.feed.stop_event.set()
+
+
+def test_reconnect_backoff_resubscribe_and_gap_fill(monkeypatch):
+    feed = LiveDataFeed()
+    feed.SUBSCRIBE_BATCH_SIZE = 2
+    for symbol in ("BTCUSDT", "ETHUSDT", "SOLUSDT"):
+        feed.subscriptions.add(f"ticker:{symbol}")
+
+    _FlakySocket.runs, _FlakySocket.feed, _FlakySocket.sent = 0, feed, []
+    monkeypatch.setattr(data_feed_module.websocket, "WebSocketApp", _FlakySocket)
+    delays = []
+    monkeypatch.setattr(feed.stop_event, "wait", lambda delay: delays.append(delay))
+    filled = []
+    monkeypatch.setattr(feed, "get_all_tickers", lambda symbols: filled.append(symbols) or {})
+    monkeypatch.setattr(feed, "_fetch_recent_trades", lambda symbol, since, until: [])
+
+    feed._websocket_worker()
+    feed.gap_fill_thread.join(timeout=5)
+
+    assert _FlakySocket.runs == 4
+    # Backoff grows while failing and resets after a successful open
+    assert len(delays) == 3 and delays[1] >= delays[0]
+    assert delays[2] <= feed.RECONNECT_BASE_DELAY
+    # Three opens, each resubscribing 3 channels in batches of 2
+    assert [len(m["params"]) for m in _FlakySocket.sent] == [2, 1] * 3
+    assert filled[-1] == ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+
+    stats = feed.get_connection_stats()
+    assert stats["reconnects"] == 2
+    assert sum(stats["downtime_histogram"].values()) == 2
+    assert stats["connected"] is False
+
+
+def test_reconnect_delay_is_capped():
+    feed = LiveDataFeed()
+    for attempt in range(30):
+        assert 0 < feed._reconnect_delay(attempt) <= feed.RECONNECT_MAX_DELAY
+
+
+class _FirstAttemptFails(_FlakySocket):
+    """Refused once, then connects and stays up until stopped."""
+
+    def run_forever(self):
+        cls = type(self)
+        cls.runs += 1
+        if cls.runs == 2:
+            self.on_open(self)
+            cls.feed.stop_event.set()
+        self.on_close(self, 1006, "closed")
+
+
+def test_failed_first_connection_is_not_a_reconnect(monkeypatch):
+    feed = LiveDataFeed()
+    _FirstAttemptFails.runs, _FirstAttemptFails.feed, _FirstAttemptFails.sent = 0, feed, []
+    monkeypatch.setattr(data_feed_module.websocket, "WebSocketApp", _FirstAttemptFails)
+    monkeypatch.setattr(feed.stop_event, "wait", lambda delay: None)
+
+    feed._websocket_worker()
+
+    stats = feed.get_connection_stats()
+    assert stats["reconnects"] == 0
+    assert sum(stats["downtime_histogram"].values()) == 0
+    assert feed.gap_fill_thread is None
+
+
+class _Response:
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode()
+
+    def raise_for_status(self):
+        pass
+
+
+def test_gap_fill_backfills_trades_for_the_outage_window(monkeypatch):
+    feed = LiveDataFeed(candle_intervals=("1m",))
+    feed.subscriptions.add("trades:BTCUSDT")
+    feed.latest_prices["BTCUSDT"] = MarketData("BTCUSDT", 100.0, 50.0, 0)
+    feed._record_tick(feed.latest_prices["BTCUSDT"])
+
+    since = 1700000000.0
+    until = since + 30
+    trades = [
+        {"E": int((since - 5) * 1000), "p": "99", "q": "1", "m": False, "t": "old"},
+        {"E": int((since + 20) * 1000), "p": "102", "q": "2", "m": True, "t": "b"},
+        {"E": int((since + 10) * 1000), "p": "101", "q": "1", "m": False, "t": "a"},
+        {"E": int((until + 1) * 1000), "p": "103", "q": "1", "m": False, "t": "live"},
+    ]
+    requested = []
+
+    def fake_get(url, params=None, **kwargs):
+        requested.append((url, params))
+        return _Response({"data": trades})
+
+    monkeypatch.setattr(feed.http, "get", fake_get)
+    monkeypatch.setattr(feed, "get_all_tickers", lambda symbols: {})
+    sent = []
+    monkeypatch.setattr(feed, "_send_subscriptions", sent.append)
+    feed.gap_filling = True
+
+    feed._fill_gap(["BTCUSDT"], since, until)
+
+    assert requested[0][0].endswith(LiveDataFeed.RECENT_TRADES_PATH)
+    assert requested[0][1]["symbol"] == "BTCUSDT"
+    ring = feed.get_recent_trades("BTCUSDT")
+    assert ring["price"].tolist() == [101.0, 102.0]
+    assert feed.get_price_history("BTCUSDT").tolist() == [100.0, 101.0, 102.0]
+    assert feed.get_volume_history("BTCUSDT").tolist() == [50.0, 50.0, 50.0]
+    assert feed.get_candles("BTCUSDT", "1m")["close"][-1] == 102.0
+    # Resubscribed only after the backfill, and the bar clock is released
+    assert sent == [["trades:BTCUSDT"]]
+    assert feed.gap_filling is False
@@ -0,0 +1,95 @@
+"""Tests for services/event_scheduler.py."""
+
+import asyncio
+import threading
+
+from services.event_scheduler import SymbolEventScheduler
+
+
+def test_bursts_are_debounced_and_coalesced():
+    calls = []
+
+    async def evaluate(symbol):
+        calls.append(symbol)
+
+    async def scenario():
+        scheduler = SymbolEventScheduler(evaluate, ["BTCUSDT", "ETHUSDT"], debounce=0.02, max_idle=None)
+        scheduler.start()
+        for _ in range(50):
+            scheduler.notify("BTCUSDT")
+        scheduler.notify("ETHUSDT")
+        scheduler.notify("XRPUSDT")  # not tracked
+        await asyncio.sleep(0.1)
+        await scheduler.stop()
+        return scheduler.stats()
+
+    stats = asyncio.run(scenario())
+    assert sorted(calls) == ["BTCUSDT", "ETHUSDT"]
+    assert stats["events"] == 51 and stats["coalesced"] == 49 and stats["evaluations"] == 2
+
+
+def test_events_during_evaluation_trigger_one_rerun():
+    calls = []
+    release = None
+
+    async def evaluate(symbol):
+        calls.append(symbol)
+        if len(calls) == 1:
+            await release.wait()
+
+    async def scenario():
+        nonlocal release
+        release = asyncio.Event()
+        scheduler = SymbolEventScheduler(evaluate, ["BTCUSDT"], debounce=0, max_idle=None)
+        scheduler.start()
+        scheduler.notify("BTCUSDT")
+        await asyncio.sleep(0.01)
+        # Feed thread events while the first evaluation is still running
+        threads = [threading.Thread(target=scheduler.notify, args=("BTCUSDT",)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.sleep(0.05)
+        await scheduler.stop()
+
+    asyncio.run(scenario())
+    assert calls == ["BTCUSDT", "BTCUSDT"]
+
+
+def test_idle_symbols_are_evaluated_and_errors_counted():
+    async def evaluate(symbol):
+        raise RuntimeError("boom")
+
+    async def scenario():
+        scheduler = SymbolEventScheduler(evaluate, ["BTCUSDT"], debounce=0, max_idle=0.05)
+        scheduler.start()
+        await asyncio.sleep(0.2)
+        await scheduler.stop()
+        return scheduler.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["evaluations"] >= 2
+    assert stats["errors"] == stats["evaluations"]
+
+
+def test_stop_cancels_debounce_timers_without_evaluating():
+    calls = []
+
+    async def evaluate(symbol):
+        calls.append(symbol)
+
+    async def scenario():
+        scheduler = SymbolEventScheduler(evaluate, ["BTCUSDT"], debounce=5.0, max_idle=None)
+        scheduler.start()
+        scheduler.notify("BTCUSDT")
+        await asyncio.sleep(0.01)
+        await asyncio.wait_for(scheduler.stop(), timeout=1)
+        scheduler.notify("BTCUSDT")
+        return scheduler.stats()
+
+    stats = asyncio.run(scenario())
+    assert calls == []
+    assert stats["evaluations"] == 0 and stats["pending"] == 0
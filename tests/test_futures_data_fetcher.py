@@ -0,0 +1,147 @@
+"""Tests for part1_core/futures_data_fetcher.py against a local stub server."""
+
+import json
+import os
+import stat
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from part1_core import futures_data_fetcher as fetcher
+
+
+class _TickerHandler(BaseHTTPRequestHandler):
+    failures = {}
+    bulk_symbols = []
+    requests = []
+    lock = threading.Lock()
+
+    def _send_json(self, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        with self.lock:
+            self.requests.append(query.get("symbol", ["*"])[0])
+        if "symbol" not in query:
+            self._send_json(
+                [{"symbol": s, "lastPrice": "2.5"} for s in self.bulk_symbols]
+            )
+            return
+        symbol = query["symbol"][0]
+        with self.lock:
+            remaining = self.failures.get(symbol, 0)
+            if remaining:
+                self.failures[symbol] = remaining - 1
+        if remaining or symbol == "DEADUSDT":
+            self.send_response(500)
+            self.end_headers()
+            return
+        self._send_json(
+            {"symbol": symbol, "lastPrice": "1.5", "priceChangePercent": "2"}
+        )
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TickerHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/ticker"
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_universe_concurrently(stub_server, tmp_path, monkeypatch):
+    monkeypatch.setattr(fetcher.time, "sleep", lambda s: None)
+    symbols = [f"SYM{i}USDT" for i in range(40)] + ["DEADUSDT"]
+    _TickerHandler.failures = {"SYM3USDT": 1}
+    _TickerHandler.bulk_symbols = []
+    symbols_file = tmp_path / "symbols.json"
+    symbols_file.write_text(json.dumps(symbols))
+    output_file = tmp_path / "futures_data.json"
+
+    data = fetcher.fetch_futures_data(
+        symbols_file=str(symbols_file),
+        output_file=str(output_file),
+        api_url=stub_server,
+        max_workers=8,
+        requests_per_second=1000,
+    )
+
+    assert [item["symbol"] for item in data] == symbols[:-1]
+    assert json.loads(output_file.read_text()) == data
+    assert data[0]["lastPrice"] == 1.5
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_bulk_response_with_per_symbol_fallback(stub_server, tmp_path):
+    symbols = [f"SYM{i}USDT" for i in range(10)]
+    _TickerHandler.failures = {}
+    _TickerHandler.bulk_symbols = symbols[:7] + ["OTHERUSDT"]
+    _TickerHandler.requests = []
+    symbols_file = tmp_path / "symbols.json"
+    symbols_file.write_text(json.dumps(symbols))
+
+    data = fetcher.fetch_futures_data(
+        symbols_file=str(symbols_file),
+        output_file=str(tmp_path / "out.json"),
+        api_url=stub_server,
+        requests_per_second=1000,
+    )
+
+    assert [item["symbol"] for item in data] == symbols
+    assert [item["lastPrice"] for item in data] == [2.5] * 7 + [1.5] * 3
+    assert sorted(_TickerHandler.requests) == sorted(["*"] + symbols[7:])
+
+
+def test_token_bucket_limits_rate():
+    bucket = fetcher.TokenBucket(rate=50, capacity=1)
+    started = time.monotonic()
+    for _ in range(11):
+        bucket.acquire()
+    assert time.monotonic() - started >= 0.18
+
+
+def test_token_bucket_charges_weight_above_capacity():
+    bucket = fetcher.TokenBucket(rate=100, capacity=10)
+    started = time.monotonic()
+    bucket.acquire(40)  # full bucket available, leaves 30 tokens of debt
+    assert time.monotonic() - started < 0.1
+    bucket.acquire()
+    assert time.monotonic() - started >= 0.3
+
+
+def test_bulk_ticker_acquires_its_weight(stub_server):
+    weights = []
+
+    class _Limiter:
+        def acquire(self, weight=1):
+            weights.append(weight)
+
+    _TickerHandler.bulk_symbols = ["BTCUSDT"]
+    with fetcher.requests.Session() as session:
+        assert list(fetcher.fetch_all_tickers(session, stub_server, _Limiter())) == ["BTCUSDT"]
+    assert weights == [fetcher.BULK_TICKER_WEIGHT]
+
+
+def test_atomic_write_uses_default_permissions(tmp_path):
+    umask = os.umask(0o022)
+    try:
+        path = tmp_path / "out.json"
+        fetcher.write_json_atomic(str(path), [1])
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+    assert json.loads(path.read_text()) == [1]
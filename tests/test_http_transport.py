@@ -0,0 +1,62 @@
+"""Tests for core/http_transport.py."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.http_transport import HttpTransport
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_keep_alive_reuses_connection(base_url):
+    transport = HttpTransport(pool_maxsize=2)
+    for _ in range(5):
+        assert transport.get(f"{base_url}/trade/api/v2/ticker").json() == {"ok": True}
+
+    stats = transport.stats()
+    assert stats["requests"] == 5
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 4
+    assert stats["latency_p95_ms"] >= stats["latency_p50_ms"] > 0
+    transport.close()
+
+
+def test_per_endpoint_timeouts():
+    transport = HttpTransport(default_timeout=7, endpoint_timeouts={"/trade/api/v2/order/cancel": 2})
+    assert transport.timeout_for("https://coinswitch.co/trade/api/v2/order") == 5.0
+    assert transport.timeout_for("https://coinswitch.co/trade/api/v2/order/cancel") == 2
+    assert transport.timeout_for("https://coinswitch.co/trade/api/v2/portfolio") == 7
+    transport.set_timeout("/trade/api/v2/portfolio", 1.5)
+    assert transport.timeout_for("https://coinswitch.co/trade/api/v2/portfolio") == 1.5
+
+
+def test_errors_are_counted():
+    transport = HttpTransport()
+    with pytest.raises(Exception):
+        transport.get("http://127.0.0.1:1/unreachable", timeout=0.5)
+    assert transport.stats()["errors"] == 1
@@ -106,8 +106,8 @@ def test_send_request_success(monkeypatch):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
         mock_resp.json.return_value = {"ok": True}
-        with patch(
-            "core.coinswitch_api_utils.requests.get", return_value=mock_resp
+        with patch.object(
+            api.get_transport(), "get", return_value=mock_resp
         ) as m:
             result = api.send_request("GET", "/test", {"a": "1"})
             assert result == {"ok": True}
@@ -120,6 +120,6 @@ def test_send_request_error(monkeypatch):
         mock_resp = MagicMock()
         mock_resp.status_code = 400
         mock_resp.text = "error"
-        with patch("core.coinswitch_api_utils.requests.get", return_value=mock_resp):
+        with patch.object(api.get_transport(), "get", return_value=mock_resp):
             result = api.send_request("GET", "/test", {"a": "1"})
             assert result is None
@@ -0,0 +1,137 @@
+"""Tests for bot/indicators.py."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bot.indicators import (
+    calculate_macd,
+    calculate_rsi,
+    calculate_supertrend,
+    compute_indicator_panel,
+    detect_breakdown,
+    detect_breakout,
+    init_supertrend_state,
+    update_supertrend,
+)
+
+
+def _candles(n=500, seed=1):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    spread = rng.uniform(0.1, 2.0, n)
+    return pd.DataFrame(
+        {"high": close + spread, "low": close - spread, "close": close},
+        index=pd.date_range("2024-01-01", periods=n, freq="min"),
+    )
+
+
+def _reference_supertrend(df, period=10, multiplier=3):
+    """Row-by-row implementation the vectorized kernel replaced."""
+    high, low, close = df["high"], df["low"], df["close"]
+    tr = pd.concat(
+        [(high - low), (high - close.shift()), (close.shift() - low)], axis=1
+    ).abs().max(axis=1)
+    atr = tr.rolling(window=period).mean()
+    hl2 = (high + low) / 2
+    upper_band = hl2 + multiplier * atr
+    lower_band = hl2 - multiplier * atr
+    supertrend = [upper_band.iloc[0]]
+    direction = [1]
+    for i in range(1, len(df)):
+        if close.iloc[i] > supertrend[i - 1]:
+            direction.append(1)
+        elif close.iloc[i] < supertrend[i - 1]:
+            direction.append(-1)
+        else:
+            direction.append(direction[i - 1])
+        if direction[i] == 1:
+            supertrend.append(max(lower_band.iloc[i], supertrend[i - 1]))
+        else:
+            supertrend.append(min(upper_band.iloc[i], supertrend[i - 1]))
+    return pd.Series(supertrend, index=df.index, dtype="float64")
+
+
+def test_supertrend_matches_reference():
+    df = _candles()
+    result = calculate_supertrend(df)
+    expected = _reference_supertrend(df)
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_supertrend_empty_frame():
+    df = _candles(0)
+    assert calculate_supertrend(df).empty
+
+
+def test_incremental_supertrend_matches_batch():
+    df = _candles(300, seed=5)
+    state = init_supertrend_state(df.iloc[:200])
+    values = [
+        update_supertrend(state, row.high, row.low, row.close)
+        for row in df.iloc[200:].itertuples()
+    ]
+    expected = calculate_supertrend(df).iloc[200:].to_numpy()
+    np.testing.assert_allclose(values, expected, rtol=1e-12)
+
+
+def test_incremental_supertrend_from_scratch():
+    df = _candles(60, seed=9)
+    state = init_supertrend_state(df.iloc[:0])
+    values = [
+        update_supertrend(state, row.high, row.low, row.close)
+        for row in df.itertuples()
+    ]
+    expected = calculate_supertrend(df).to_numpy()
+    np.testing.assert_allclose(values, expected, rtol=1e-12, equal_nan=True)
+
+
+def _universe(n_symbols=6, n=120, seed=11):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, (n_symbols, n)), axis=1)
+    spread = rng.uniform(0.1, 2.0, (n_symbols, n))
+    volume = rng.uniform(10, 100, (n_symbols, n))
+    volume[0, -1] = 10_000
+    close[0, -1] = close[0].max() + 5
+    volume[1, -1] = 10_000
+    close[1, -1] = close[1].min() - 5
+    symbols = [f"SYM{i}/INR" for i in range(n_symbols)]
+    return symbols, close, close + spread, close - spread, volume
+
+
+def test_indicator_panel_matches_single_symbol_functions():
+    symbols, close, high, low, volume = _universe()
+    panel = compute_indicator_panel(close, high, low, volume, symbols=symbols)
+
+    for i, symbol in enumerate(symbols):
+        df = pd.DataFrame(
+            {"close": close[i], "high": high[i], "low": low[i], "volume": volume[i]}
+        )
+        np.testing.assert_allclose(
+            panel.rsi[symbol], calculate_rsi(df["close"]), equal_nan=True
+        )
+        macd = calculate_macd(df["close"])
+        np.testing.assert_allclose(panel.macd[symbol], macd["macd"])
+        np.testing.assert_allclose(panel.macd_hist[symbol], macd["hist"])
+        np.testing.assert_allclose(
+            panel.supertrend[symbol], calculate_supertrend(df), equal_nan=True
+        )
+        assert bool(panel.breakout[symbol]) == detect_breakout(df)
+        assert bool(panel.breakdown[symbol]) == detect_breakdown(df)
+
+    assert panel.breakout_symbols() == ["SYM0/INR"]
+    assert panel.breakdown_symbols() == ["SYM1/INR"]
+
+
+def test_indicator_panel_accepts_wide_dataframe():
+    symbols, close, *_ = _universe(n_symbols=3)
+    wide = pd.DataFrame(close.T, columns=symbols)
+    panel = compute_indicator_panel(wide)
+
+    latest = panel.latest()
+    assert list(latest.index) == symbols
+    assert panel.supertrend is None
+    assert panel.breakout_symbols() == []
+    assert panel.get(symbols[2])["rsi"] == pytest.approx(
+        calculate_rsi(wide[symbols[2]]).iloc[-1]
+    )
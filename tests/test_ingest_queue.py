@@ -0,0 +1,95 @@
+"""Tests for services/ingest_queue.py and LiveDataFeed callback dispatch."""
+
+import threading
+import time
+
+from services.data_feed import LiveDataFeed, OrderBookData
+from services.ingest_queue import IngestQueue
+
+
+def test_slow_consumer_gets_latest_ticker_and_all_trades():
+    gate = threading.Event()
+    seen = []
+
+    def handler(data_type, symbol, data):
+        gate.wait(5)
+        seen.append((data_type, symbol, data))
+
+    queue = IngestQueue(handler, workers=1)
+    queue.start()
+    queue.put("ticker", "BTCUSDT", 0)
+    time.sleep(0.05)  # dispatcher is now blocked on the first tick
+    for price in range(1, 100):
+        queue.put("ticker", "BTCUSDT", price)
+    for trade_id in range(3):
+        queue.put("trade", "BTCUSDT", trade_id)
+    gate.set()
+    queue.stop()
+
+    assert seen[0] == ("ticker", "BTCUSDT", 0)
+    assert [d for t, _, d in seen if t == "ticker"] == [0, 99]
+    assert [d for t, _, d in seen if t == "trade"] == [0, 1, 2]
+    stats = queue.stats()
+    assert stats["conflated"] == 98
+    assert stats["dispatched"] == 5
+    assert stats["depth"] == 0
+    assert stats["latency_max_ms"] > 0
+
+
+def test_bounded_queue_drops_when_full():
+    queue = IngestQueue(lambda *args: None, maxsize=2, workers=1)
+    results = [queue.put("trade", "ETHUSDT", i) for i in range(5)]
+
+    assert results == [True, True, False, False, False]
+    assert queue.stats()["dropped"] == {"trade": 3}
+
+
+def test_feed_callbacks_run_off_the_socket_thread():
+    feed = LiveDataFeed(dispatch_workers=2)
+    threads = []
+    done = threading.Event()
+
+    def on_ticker(market_data):
+        threads.append(threading.current_thread().name)
+        done.set()
+
+    feed.subscribe_ticker("BTCUSDT", on_ticker)
+    feed.ingest_queue.start()
+    feed._process_ws_message({"type": "ticker", "symbol": "BTCUSDT", "price": 100})
+    assert done.wait(5)
+    feed.ingest_queue.stop()
+
+    assert threads[0].startswith("ingest-")
+    assert feed.get_cached_price("BTCUSDT") == 100.0
+    assert feed.get_ingest_stats()["dispatched"] == 1
+
+
+def test_stop_before_start_does_not_poison_restart():
+    handled = []
+    done = threading.Event()
+    queue = IngestQueue(lambda *args: handled.append(args) or done.set(), workers=2)
+
+    queue.stop()
+    queue.start()
+    queue.put("trade", "ETHUSDT", 1)
+    assert done.wait(5)
+    assert queue.running
+    queue.stop()
+
+    assert handled == [("trade", "ETHUSDT", 1)]
+    assert not queue.running
+
+
+def test_orderbook_callbacks_receive_a_snapshot():
+    feed = LiveDataFeed()
+    received = []
+    feed.subscribe_orderbook("BTCUSDT", received.append)
+    feed._process_ws_message({"type": "orderbook", "symbol": "BTCUSDT", "sequence": 1,
+                              "bids": [["100", "1"]], "asks": [["101", "2"]]})
+    feed._process_ws_message({"type": "orderbook", "symbol": "BTCUSDT", "delta": True, "sequence": 2,
+                              "bids": [["100", "0"], ["99", "3"]], "asks": []})
+
+    first, second = received
+    assert type(first) is OrderBookData
+    assert (first.bids, first.sequence) == ([[100.0, 1.0]], 1)
+    assert (second.bids, second.sequence) == ([[99.0, 3.0]], 2)
@@ -0,0 +1,118 @@
+"""Tests for utils/logging_setup.py logger resolution."""
+
+import logging
+import queue
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+
+import pytest
+
+from utils import logging_setup
+from utils.logging_setup import (
+    BoundedQueueHandler, LoggerMixin, enable_async_logging, flush_logging, get_async_logging_stats, get_logger
+)
+
+
+def test_child_loggers_share_parent_handlers():
+    child = get_logger("CryptoFuturesBot.SharedHandlerProbe")
+    assert child.handlers == []
+    assert child.propagate
+
+    parent_files = [h for h in logging.getLogger("CryptoFuturesBot").handlers
+                    if isinstance(h, RotatingFileHandler)]
+    assert len(parent_files) == 1
+
+
+def test_logger_resolved_once_per_class(monkeypatch):
+    calls = []
+    original = logging_setup.get_logger
+    monkeypatch.setattr(logging_setup, "get_logger", lambda name: calls.append(name) or original(name))
+
+    class Service(LoggerMixin):
+        pass
+
+    class ChildService(Service):
+        pass
+
+    for _ in range(3):
+        assert Service().logger.name == "CryptoFuturesBot.Service"
+    assert ChildService().logger.name == "CryptoFuturesBot.ChildService"
+    assert calls == ["CryptoFuturesBot.Service", "CryptoFuturesBot.ChildService"]
+
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append((record.getMessage(), threading.current_thread()))
+
+
+def test_async_logging_writes_on_listener_thread_and_flushes():
+    logger = logging.getLogger("AsyncLoggingProbe")
+    logger.setLevel(logging.INFO)
+    capture = _Capture()
+    logger.addHandler(capture)
+
+    handler = enable_async_logging("AsyncLoggingProbe", queue_size=100)
+    assert logger.handlers == [handler]
+    assert enable_async_logging("AsyncLoggingProbe") is handler
+
+    items = {"n": 1}
+    logging.getLogger("AsyncLoggingProbe.Child").info("tick %s", items)
+    items["n"] = 2  # message is captured at call time
+    assert "AsyncLoggingProbe" in get_async_logging_stats()
+
+    flush_logging("AsyncLoggingProbe")
+
+    assert [message for message, _ in capture.records] == ["tick {'n': 1}"]
+    assert capture.records[0][1] is not threading.current_thread()
+    assert logger.handlers == [capture]
+    flush_logging("AsyncLoggingProbe")  # no-op once flushed
+
+
+def _record(message, level=logging.INFO):
+    return logging.LogRecord("probe", level, __file__, 1, message, None, None)
+
+
+def _fill(overflow):
+    handler = BoundedQueueHandler(queue.Queue(maxsize=2), overflow=overflow, block_timeout=0.01)
+    for i in range(4):
+        handler.handle(_record(f"m{i}"))
+    drained = [handler.queue.get_nowait().msg for _ in range(handler.queue.qsize())]
+    return handler, drained
+
+
+def test_bounded_queue_overflow_policies():
+    handler, drained = _fill("drop_oldest")
+    assert drained == ["m2", "m3"] and handler.dropped == 2
+
+    handler, drained = _fill("drop_newest")
+    assert drained == ["m0", "m1"] and handler.dropped == 2
+
+    handler, drained = _fill("block")
+    assert drained == ["m0", "m1"] and handler.dropped == 2
+
+    with pytest.raises(ValueError):
+        BoundedQueueHandler(queue.Queue(), overflow="spill")
+
+
+def test_block_policy_waits_for_space_instead_of_dropping():
+    handler = BoundedQueueHandler(queue.Queue(maxsize=1), overflow="block", block_timeout=1.0)
+    handler.handle(_record("info"))
+    threading.Timer(0.05, handler.queue.get_nowait).start()
+    handler.handle(_record("error", logging.ERROR))
+    assert handler.queue.get_nowait().msg == "error"
+    assert handler.dropped == 0
+
+
+def test_drop_oldest_evicts_for_errors_without_waiting():
+    handler = BoundedQueueHandler(queue.Queue(maxsize=1), overflow="drop_oldest", block_timeout=5.0)
+    handler.handle(_record("info"))
+    started = time.monotonic()
+    handler.handle(_record("error", logging.ERROR))
+    assert time.monotonic() - started < 1.0
+    assert handler.queue.get_nowait().msg == "error"
+    assert handler.dropped == 1
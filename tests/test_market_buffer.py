@@ -0,0 +1,171 @@
+"""Tests for services/market_buffer.py and LiveDataFeed price history."""
+
+import json
+
+import numpy as np
+import pytest
+
+from services.market_buffer import (
+    PriceRingBuffer, MarketDataBuffers, TradeRingBuffer, SIDE_BUY, SIDE_SELL
+)
+from services.data_feed import LiveDataFeed, MarketData, TradeData
+
+
+def test_ring_buffer_keeps_latest_ticks_in_order():
+    buffer = PriceRingBuffer(capacity=4)
+    for i in range(10):
+        buffer.append(float(i), volume=i * 10.0, timestamp=i)
+
+    assert len(buffer) == 4
+    assert buffer.total == 10
+    assert buffer.prices().tolist() == [6.0, 7.0, 8.0, 9.0]
+    assert buffer.volumes().tolist() == [60.0, 70.0, 80.0, 90.0]
+    assert buffer.timestamps().tolist() == [6, 7, 8, 9]
+    assert buffer.prices(limit=2).tolist() == [8.0, 9.0]
+    assert buffer.last_price() == 9.0
+
+
+def test_ring_buffer_returns_views_not_copies():
+    buffer = PriceRingBuffer(capacity=8)
+    for i in range(5):
+        buffer.append(float(i))
+
+    view = buffer.prices()
+    assert view.base is not None
+    assert np.shares_memory(view, buffer.prices())
+
+
+def test_ring_buffer_memory_is_fixed():
+    buffer = PriceRingBuffer(capacity=16)
+    before = buffer.nbytes
+    for i in range(1000):
+        buffer.append(float(i))
+    assert buffer.nbytes == before
+
+
+def test_ring_buffer_rejects_invalid_capacity():
+    with pytest.raises(ValueError):
+        PriceRingBuffer(capacity=0)
+
+
+def test_market_data_buffers_per_symbol():
+    buffers = MarketDataBuffers(capacity=3)
+    buffers.append("BTCUSDT", 1.0)
+    buffers.append("ETHUSDT", 2.0)
+    buffers.append("BTCUSDT", 3.0)
+
+    assert len(buffers) == 2
+    assert buffers.get("BTCUSDT").prices().tolist() == [1.0, 3.0]
+    assert buffers.get("XRPUSDT") is None
+
+
+def test_ws_ticker_feeds_price_history():
+    feed = LiveDataFeed(history_capacity=50)
+    for i in range(40):
+        feed._process_ws_message(
+            {"type": "ticker", "symbol": "BTCUSDT", "price": 100 + i, "volume": 5}
+        )
+
+    history = feed.get_price_history("BTCUSDT")
+    assert len(history) == 40
+    assert history[-1] == 139.0
+    assert feed.get_volume_history("BTCUSDT")[0] == 5.0
+    assert len(feed.get_price_history("ETHUSDT")) == 0
+
+
+def test_get_all_tickers_bulk_with_fallback(monkeypatch):
+    feed = LiveDataFeed()
+    bulk = {
+        "data": {
+            "BTC/INR": {"lastPrice": "100", "openPrice": "90", "baseVolume": "5",
+                        "bidPrice": "", "askPrice": "101", "percentageChange": "11.1",
+                        "at": 1749462335616},
+            "ETH/INR": {"lastPrice": "10", "baseVolume": "1"},
+        }
+    }
+
+    class _Response:
+        def raise_for_status(self):
+            pass
+
+        content = json.dumps(bulk).encode()
+
+    monkeypatch.setattr(feed.http, "get", lambda *a, **k: _Response())
+    fallback = []
+
+    def fake_market_data(symbol):
+        fallback.append(symbol)
+        return MarketData(symbol=symbol, price=1.0, volume=0, timestamp=0)
+
+    monkeypatch.setattr(feed, "get_market_data", fake_market_data)
+    tickers = feed.get_all_tickers(["BTC/INR", "SOL/INR"])
+
+    assert list(tickers) == ["BTC/INR", "SOL/INR"]
+    assert fallback == ["SOL/INR"]
+    btc = tickers["BTC/INR"]
+    assert (btc.price, btc.volume, btc.bid, btc.ask) == (100.0, 5.0, None, 101.0)
+    assert btc.change_24h == 10.0
+    assert btc.timestamp == 1749462335
+    assert len(feed.get_price_history("BTC/INR")) == 1
+
+
+def test_bulk_tickers_buffer_only_requested_and_subscribed_pairs(monkeypatch):
+    feed = LiveDataFeed()
+    bulk = {"data": {symbol: {"lastPrice": "10", "baseVolume": "1"}
+                     for symbol in ("BTC/INR", "ETH/INR", "SOL/INR")}}
+
+    class _Response:
+        def raise_for_status(self):
+            pass
+
+        content = json.dumps(bulk).encode()
+
+    monkeypatch.setattr(feed.http, "get", lambda *a, **k: _Response())
+    feed.subscriptions.add("ticker:SOL/INR")
+
+    tickers = feed.get_all_tickers()
+
+    assert set(tickers) == {"BTC/INR", "ETH/INR", "SOL/INR"}
+    assert feed.get_cached_price("SOL/INR") == 10.0
+    assert feed.get_cached_price("ETH/INR") is None
+    assert len(feed.get_price_history("ETH/INR")) == 0
+
+    feed.get_all_tickers(["ETH/INR"])
+    assert len(feed.get_price_history("ETH/INR")) == 1
+    assert len(feed.get_price_history("SOL/INR")) == 2
+    assert len(feed.get_price_history("BTC/INR")) == 0
+
+
+def test_trade_ring_is_columnar_and_fixed_size():
+    trades = TradeRingBuffer(capacity=3)
+    before = trades.nbytes
+    for i in range(5):
+        trades.append(100.0 + i, 0.1 * i, SIDE_BUY if i % 2 else SIDE_SELL, i, f"t{i}")
+
+    view = trades.trades()
+    assert trades.nbytes == before
+    assert view["price"].tolist() == [102.0, 103.0, 104.0]
+    assert view["side"].tolist() == [SIDE_SELL, SIDE_BUY, SIDE_SELL]
+    assert trades.trade_ids(limit=1).tolist() == ["t4"]
+    assert np.shares_memory(view["price"], trades.trades(limit=2)["price"])
+
+
+def test_slotted_records():
+    trade = TradeData(symbol="BTCUSDT", price=1.0, quantity=2.0, side="BUY", timestamp=0)
+    assert not hasattr(trade, "__dict__")
+    with pytest.raises(AttributeError):
+        trade.extra = 1
+
+
+def test_feed_recent_trades_view():
+    feed = LiveDataFeed(trade_capacity=100)
+    for i in range(150):
+        feed._process_ws_message(
+            {"type": "trade", "symbol": "BTCUSDT", "price": i, "quantity": 1, "side": "SELL"}
+        )
+
+    recent = feed.get_recent_trades("BTCUSDT", limit=50)
+    assert len(recent) == 50
+    assert recent["price"][-1] == 149.0
+    assert (recent["side"] == SIDE_SELL).all()
+    assert len(feed.get_recent_trades("ETHUSDT")) == 0
@@ -0,0 +1,81 @@
+"""Tests for services/market_data_hub.py with a fake Socket.IO client."""
+
+from services.market_data_hub import MarketDataHub, StreamType
+
+
+class _FakeClient:
+    instances = 0
+
+    def __init__(self):
+        type(self).instances += 1
+        self.handlers = {}
+        self.emitted = []
+
+    def on(self, event, handler, namespace=None):
+        self.handlers[event] = handler
+
+    def emit(self, event, data, namespace=None):
+        self.emitted.append((event, data["pair"]))
+
+    def connect(self, **kwargs):
+        self.handlers["connect"]()
+
+    def wait(self):
+        pass
+
+    def disconnect(self):
+        self.handlers["disconnect"]()
+
+
+def _hub(pairs, **kwargs):
+    return MarketDataHub(pairs=pairs, client_factory=_FakeClient, **kwargs)
+
+
+def test_one_socket_subscribes_all_streams_for_all_pairs():
+    _FakeClient.instances = 0
+    pairs = [f"SYM{i}USDT" for i in range(200)]
+    hub = _hub(pairs)
+    hub.connect()
+
+    assert _FakeClient.instances == 1
+    assert len(hub._client.emitted) == 800
+    assert ("FETCH_CANDLESTICK_CS_PRO", "SYM7USDT_5") in hub._client.emitted
+
+    hub.subscribe(["NEWUSDT"], [StreamType.TICKER])
+    assert hub._client.emitted[-1] == ("FETCH_TICKER_INFO_CS_PRO", "NEWUSDT")
+    hub.subscribe(["NEWUSDT"], [StreamType.TICKER])
+    assert len(hub._client.emitted) == 801
+
+
+def test_updates_fan_out_by_stream_and_pair():
+    hub = _hub(["BTCUSDT", "ETHUSDT"])
+    hub.connect()
+    tickers, btc_trades, candles = [], [], []
+    hub.on_ticker(tickers.append)
+    hub.on_trades(btc_trades.append, pairs=["BTCUSDT"])
+    hub.on_candles(candles.append)
+
+    handlers = hub._client.handlers
+    handlers["FETCH_TICKER_INFO_CS_PRO"]({"s": "ETHUSDT", "c": "3000"})
+    handlers["FETCH_TRADES_CS_PRO"]({"data": [{"s": "BTCUSDT", "p": "1"}]})
+    handlers["FETCH_TRADES_CS_PRO"]({"data": [{"s": "ETHUSDT", "p": "2"}]})
+    handlers["FETCH_CANDLESTICK_CS_PRO"]({"data": {"pair": "BTCUSDT_5", "c": "1"}})
+
+    assert [(u.stream, u.pair) for u in tickers] == [(StreamType.TICKER, "ETHUSDT")]
+    assert [u.data["data"][0]["p"] for u in btc_trades] == ["1"]
+    assert candles[0].pair == "BTCUSDT"
+    assert hub.message_counts[StreamType.TRADES] == 2
+
+
+def test_failing_callback_does_not_block_others():
+    hub = _hub(["BTCUSDT"], streams=[StreamType.TICKER])
+    received = []
+
+    def broken(update):
+        raise RuntimeError("boom")
+
+    hub.on_ticker(broken)
+    hub.on_ticker(received.append)
+    hub._client.handlers["FETCH_TICKER_INFO_CS_PRO"]({"c": "1"})
+
+    assert received[0].pair == "BTCUSDT"
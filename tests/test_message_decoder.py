@@ -0,0 +1,77 @@
+"""Tests for services/message_decoder.py."""
+
+import dataclasses
+import json
+
+import pytest
+
+from services.data_feed import LiveDataFeed, MarketData, TradeData
+from services.message_decoder import MessageDecoder, available_backends
+
+TICKER = json.dumps({"type": "ticker", "symbol": "BTCUSDT", "price": "101.5",
+                     "volume": 7, "changePercent": "1.2", "extra": {"ignored": True}})
+TRADE = json.dumps({"type": "trade", "symbol": "ETHUSDT", "price": 10, "quantity": "0.5",
+                    "side": "BUY", "id": "t1"})
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_backends_decode_into_records(backend):
+    decoder = MessageDecoder(backend)
+
+    msg_type, symbol, ticker = decoder.decode_ws_message(TICKER)
+    assert (msg_type, symbol) == ("ticker", "BTCUSDT")
+    assert isinstance(ticker, MarketData)
+    assert (ticker.price, ticker.volume, ticker.change_pct_24h) == (101.5, 7.0, 1.2)
+    assert ticker.change_24h is None
+
+    _, _, trade = decoder.decode_ws_message(TRADE.encode())
+    assert isinstance(trade, TradeData)
+    assert (trade.price, trade.quantity, trade.side, trade.trade_id) == (10.0, 0.5, "BUY", "t1")
+
+    assert decoder.decode_ws_message('{"type": "heartbeat"}') is None
+    assert decoder.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+BOOK_FRAMES = [
+    json.dumps({"type": "orderbook", "symbol": "BTCUSDT", "bids": [["100", "1"]],
+                "asks": [["101", "2"]], "sequence": 10}),
+    json.dumps({"type": "orderbook", "symbol": "BTCUSDT", "bids": [["100", "0"]], "asks": [],
+                "delta": True, "u": 12, "pu": 11}),
+    json.dumps({"type": "orderbook", "symbol": "BTCUSDT", "bids": [], "asks": [],
+                "delta": True, "sequence": None, "u": 13, "prev_sequence": 12, "pu": 99}),
+]
+
+
+def _decoded(backend, frames):
+    decoder = MessageDecoder(backend)
+    results = []
+    for frame in frames:
+        msg_type, symbol, record = decoder.decode_ws_message(frame)
+        fields = dataclasses.asdict(record)
+        fields.pop("timestamp")
+        results.append((msg_type, symbol, fields))
+    return results
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_backends_agree_on_the_same_frames(backend):
+    frames = [TICKER, TRADE] + BOOK_FRAMES
+    decoded = _decoded(backend, frames)
+
+    assert decoded == _decoded("json", frames)
+    sequences = [(fields["sequence"], fields["prev_sequence"], fields["is_snapshot"])
+                 for _, _, fields in decoded[2:]]
+    assert sequences == [(10, None, True), (12, 11, False), (13, 12, False)]
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        MessageDecoder("simdjson")
+
+
+def test_feed_decodes_raw_frames():
+    feed = LiveDataFeed(json_backend="json")
+    feed._on_ws_message(None, TICKER)
+    feed._on_ws_message(None, TRADE)
+
+    assert feed.get_cached_price("BTCUSDT") == 101.5
+    assert feed.get_recent_trades("ETHUSDT")["quantity"][0] == 0.5
@@ -0,0 +1,116 @@
+"""Tests for services/order_book.py and LiveDataFeed local books."""
+
+from services.data_feed import LiveDataFeed, OrderBookData
+from services.order_book import LocalOrderBook
+
+
+def _seeded_book():
+    book = LocalOrderBook("BTCUSDT")
+    book.apply_snapshot(
+        bids=[[99, 1], [98, 2], [97, 3]],
+        asks=[[101, 1], [102, 2], [103, 3]],
+        sequence=10,
+    )
+    return book
+
+
+def test_snapshot_best_levels_and_depth():
+    book = _seeded_book()
+    assert book.best_bid() == (99.0, 1.0)
+    assert book.best_ask() == (101.0, 1.0)
+    assert book.mid() == 100.0
+    assert book.spread() == 2.0
+    assert book.depth(2) == ([(99.0, 1.0), (98.0, 2.0)], [(101.0, 1.0), (102.0, 2.0)])
+
+
+def test_deltas_insert_update_and_delete_levels():
+    book = _seeded_book()
+    assert book.apply_delta(bids=[[99.5, 4], [98, 0]], asks=[[101, 0]], sequence=11)
+    assert book.best_bid() == (99.5, 4.0)
+    assert book.bids.levels() == [(99.5, 4.0), (99.0, 1.0), (97.0, 3.0)]
+    assert book.best_ask() == (102.0, 2.0)
+    # Stale updates are ignored
+    assert not book.apply_delta(bids=[[50, 1]], asks=[], sequence=11)
+    assert book.bids.quantity_at(50) == 0.0
+
+
+def test_gap_triggers_resync_and_replays_buffered_deltas():
+    book = _seeded_book()
+    assert not book.apply_delta(bids=[[99, 5]], asks=[], sequence=13)
+    assert book.needs_resync and book.gaps == 1
+    assert not book.apply_delta(bids=[[96, 1]], asks=[], sequence=14)
+
+    book.apply_snapshot(bids=[[99, 2]], asks=[[101, 1]], sequence=13)
+
+    assert not book.needs_resync
+    assert book.sequence == 14
+    # Delta 13 is covered by the snapshot; delta 14 is replayed
+    assert book.bids.levels() == [(99.0, 2.0), (96.0, 1.0)]
+
+
+def test_feed_maintains_local_book_and_resyncs(monkeypatch):
+    feed = LiveDataFeed()
+    snapshots = []
+
+    def fake_rest(symbol, depth=20):
+        snapshots.append(symbol)
+        return OrderBookData(symbol=symbol, bids=[[99, 1]], asks=[[101, 1]], timestamp=0, sequence=5)
+
+    monkeypatch.setattr(feed, "_fetch_order_book_rest", fake_rest)
+    monkeypatch.setattr(feed, "_schedule_book_resync", feed.resync_order_book)
+
+    # First delta arrives before any snapshot -> resync from REST
+    feed._process_ws_message({"type": "orderbook", "symbol": "BTCUSDT", "delta": True,
+                              "bids": [[99.5, 2]], "asks": [], "sequence": 6})
+    assert snapshots == ["BTCUSDT"]
+    assert feed.get_local_book("BTCUSDT").best_bid() == (99.5, 2.0)
+
+    feed._process_ws_message({"type": "orderbook", "symbol": "BTCUSDT", "delta": True,
+                              "bids": [], "asks": [[100.5, 3]], "sequence": 7})
+    cached = feed.get_order_book("BTCUSDT", depth=1)
+    assert cached.asks == [[100.5, 3.0]]
+    assert cached.sequence == 7
+    assert snapshots == ["BTCUSDT"]
+
+
+def test_snapshot_that_does_not_reach_buffered_deltas_stays_out_of_sync():
+    book = _seeded_book()
+    book.apply_delta(bids=[[99, 5]], asks=[], sequence=13)
+    book.apply_delta(bids=[[96, 1]], asks=[], sequence=14)
+
+    # Snapshot older than the gap: deltas 13/14 cannot be joined to it
+    assert not book.apply_snapshot(bids=[[90, 1]], asks=[[110, 1]], sequence=5)
+    assert book.needs_resync
+    assert book.oldest_pending_sequence() == 13
+
+    assert book.apply_snapshot(bids=[[99, 2]], asks=[[101, 1]], sequence=12)
+    assert not book.needs_resync and book.sequence == 14
+    assert book.bids.levels() == [(99.0, 5.0), (96.0, 1.0)]
+
+
+def test_pending_overflow_requires_snapshot_past_dropped_deltas():
+    book = LocalOrderBook("BTCUSDT", max_pending=1000)
+    for sequence in range(1, 1200):
+        book.apply_delta(bids=[[100, sequence]], asks=[], sequence=sequence)
+    assert book.pending_overflows == 199
+
+    assert not book.apply_snapshot(bids=[[1, 1]], asks=[[2, 1]], sequence=50)
+    assert book.needs_resync
+
+    assert book.apply_snapshot(bids=[[1, 1]], asks=[[2, 1]], sequence=199)
+    assert book.sequence == 1199 and not book.needs_resync
+
+
+def test_resync_retries_stale_snapshots(monkeypatch):
+    feed = LiveDataFeed()
+    book = feed.get_local_book("BTCUSDT")
+    book.apply_delta(bids=[[99, 1]], asks=[], sequence=20)
+    sequences = iter([5, 10, 19])
+
+    def fake_rest(symbol, depth=20):
+        return OrderBookData(symbol=symbol, bids=[[99, 1]], asks=[[101, 1]], timestamp=0, sequence=next(sequences))
+
+    monkeypatch.setattr(feed, "_fetch_order_book_rest", fake_rest)
+
+    assert feed.resync_order_book("BTCUSDT", retry_delay=0)
+    assert book.sequence == 20 and not book.needs_resync
@@ -0,0 +1,71 @@
+"""Tests for services/order_book_features.py."""
+
+import pytest
+
+from services.data_feed import LiveDataFeed
+from services.order_book import LocalOrderBook
+from services.order_book_features import OrderBookFeatureStage, compute_book_features, fill_price
+
+
+def _book():
+    book = LocalOrderBook("BTCUSDT")
+    book.apply_snapshot(bids=[[99, 3], [98, 1]], asks=[[101, 1], [102, 5]], sequence=1)
+    return book
+
+
+def test_features_from_top_levels():
+    features = compute_book_features(_book(), levels=2, target_notional=303)
+
+    assert features.mid == 100.0
+    assert features.spread == 2.0
+    assert features.microprice == pytest.approx((99 * 1 + 101 * 3) / 4)
+    assert features.imbalance == pytest.approx((4 - 6) / 10)
+    assert (features.bid_depth, features.ask_depth) == (4.0, 6.0)
+    # Buy 303: 1 @ 101, then the remaining 202 at 102
+    expected = 303 / (1 + 202 / 102)
+    assert features.buy_fill_price == pytest.approx(expected)
+    assert features.buy_slippage_bps == pytest.approx((expected - 100) / 100 * 1e4)
+    assert features.sell_fill_price == pytest.approx(303 / (3 + 6 / 98))
+
+
+def test_fill_price_returns_none_when_book_too_thin():
+    assert fill_price([(100.0, 1.0)], 500.0) is None
+
+
+def test_stage_recomputes_only_on_change():
+    stage = OrderBookFeatureStage(levels=5, target_notional=100)
+    book = _book()
+    first = stage.update(book)
+    assert stage.update(book) is first
+
+    book.apply_delta(bids=[[100, 10]], asks=[], sequence=2)
+    assert stage.update(book).imbalance > first.imbalance
+    assert stage.indicators("BTCUSDT")["ob_mid"] == 100.5
+    assert stage.indicators("ETHUSDT") == {}
+
+
+def test_feed_publishes_indicators_on_each_update():
+    feed = LiveDataFeed(book_target_notional=100)
+    feed._process_ws_message({"type": "orderbook", "symbol": "BTCUSDT",
+                              "bids": [[99, 1]], "asks": [[101, 1]], "sequence": 1})
+    feed._process_ws_message({"type": "orderbook", "symbol": "BTCUSDT", "delta": True,
+                              "bids": [[99, 3]], "asks": [], "sequence": 2})
+
+    indicators = feed.get_book_indicators("BTCUSDT")
+    assert indicators["ob_imbalance"] == pytest.approx(0.5)
+    assert indicators["ob_sequence"] == 2
+
+
+def test_feed_withholds_indicators_while_book_needs_resync():
+    feed = LiveDataFeed()
+    feed._schedule_book_resync = lambda symbol: None
+    feed._process_ws_message({"type": "orderbook", "symbol": "BTCUSDT",
+                              "bids": [[99, 1]], "asks": [[101, 1]], "sequence": 1})
+    assert feed.get_book_indicators("BTCUSDT")
+
+    # Sequence gap: 3 does not follow 1
+    feed._process_ws_message({"type": "orderbook", "symbol": "BTCUSDT", "delta": True,
+                              "bids": [[99, 3]], "asks": [], "sequence": 3})
+    assert feed.local_books["BTCUSDT"].needs_resync
+    assert feed.get_book_indicators("BTCUSDT") == {}
+    assert feed.get_book_indicators("ETHUSDT") == {}
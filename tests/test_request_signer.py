@@ -0,0 +1,71 @@
+"""Tests for core/request_signer.py."""
+
+import json
+import urllib.parse
+from urllib.parse import urlencode, urlparse
+
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from core.request_signer import RequestSigner, get_signer
+
+SECRET = "1f" * 32
+
+
+def _legacy_signature(method, endpoint, params, suffix):
+    unquote_endpoint = endpoint
+    if method == "GET" and params:
+        endpoint += ("&", "?")[urlparse(endpoint).query == ""] + urlencode(params)
+        unquote_endpoint = urllib.parse.unquote_plus(endpoint)
+    key = ed25519.Ed25519PrivateKey.from_private_bytes(bytes.fromhex(SECRET))
+    return key.sign((method + unquote_endpoint + suffix).encode()).hex()
+
+
+def test_matches_legacy_body_signature():
+    signer = RequestSigner(SECRET)
+    params = {"symbol": "BTC/INR", "exchange": "coinswitchx"}
+    payload = {"side": "buy", "quantity": 1, "price": 100.5}
+
+    assert signer.sign("GET", "/trade/api/v2/depth", params) == _legacy_signature(
+        "GET", "/trade/api/v2/depth", params, "{}"
+    )
+    assert signer.sign("post", "/trade/api/v2/order", body=payload) == _legacy_signature(
+        "POST", "/trade/api/v2/order", {},
+        json.dumps(payload, separators=(",", ":"), sort_keys=True),
+    )
+
+
+def test_matches_legacy_epoch_signature():
+    signer = RequestSigner(SECRET)
+    params = {"exchange": "EXCHANGE_2"}
+    assert signer.sign("GET", "/trade/api/v2/futures/positions", params, epoch="1700000000000") == (
+        _legacy_signature("GET", "/trade/api/v2/futures/positions", params, "1700000000000")
+    )
+
+
+def test_route_cache_is_bounded():
+    signer = RequestSigner(SECRET, route_cache_size=2)
+    assert signer.route("GET", "/a", {"q": "x y"}) == "GET/a?q=x y"
+    signer.route("GET", "/b")
+    signer.route("GET", "/c")
+    assert list(signer._routes) == [("GET", "/b", ()), ("GET", "/c", ())]
+
+
+def test_route_cache_evicts_least_recently_used():
+    signer = RequestSigner(SECRET, route_cache_size=2)
+    signer.route("GET", "/a")
+    signer.route("GET", "/b")
+    signer.route("GET", "/a")
+    signer.route("GET", "/c")
+    assert list(signer._routes) == [("GET", "/a", ()), ("GET", "/c", ())]
+
+
+def test_route_cache_distinguishes_equal_values_of_different_types():
+    signer = RequestSigner(SECRET)
+    assert signer.route("GET", "/a", {"n": 1}) == "GET/a?n=1"
+    assert signer.route("GET", "/a", {"n": 1.0}) == "GET/a?n=1.0"
+    assert signer.route("GET", "/a", {"n": True}) == "GET/a?n=True"
+    assert signer.route("GET", "/a", {"n": 1}) == "GET/a?n=1"
+
+
+def test_get_signer_is_shared():
+    assert get_signer(SECRET) is get_signer(SECRET)
@@ -0,0 +1,230 @@
+"""Tests for StrategyManager.generate_signals_batch."""
+
+import numpy as np
+import pytest
+
+from strategies.base_strategy import (
+    BaseStrategy, MarketContext, SignalReason, SignalType, StrategyManager, TradingSignal, UniverseArrays
+)
+from strategies.mean_reversion import MeanReversionStrategy
+from strategies.simple_momentum import SimpleMomentumStrategy
+from strategies.streaming_indicators import StreamingIndicatorEngine
+
+
+def _contexts(n):
+    rng = np.random.default_rng(7)
+    contexts = []
+    for i in range(n):
+        drift = (-1) ** i * 0.004 * (i % 5)
+        prices = 100 * np.cumprod(1 + drift + rng.normal(0, 0.002, 60))
+        contexts.append(MarketContext(
+            symbol=f"SYM{i:03d}USDT",
+            current_price=float(prices[-1]),
+            volume=1e6,
+            price_history=prices.tolist(),
+            indicators={},
+            timestamp="0",
+        ))
+    return contexts
+
+
+class ScalarMomentum(SimpleMomentumStrategy):
+    """Momentum strategy forced onto the per-context path"""
+    vectorized = False
+
+
+class ScalarMeanReversion(MeanReversionStrategy):
+    vectorized = False
+
+
+def _manager(scalar=False, **kwargs):
+    momentum, reversion = (ScalarMomentum, ScalarMeanReversion) if scalar else (
+        SimpleMomentumStrategy, MeanReversionStrategy)
+    manager = StrategyManager(**kwargs)
+    manager.add_strategy(momentum(indicator_engine=StreamingIndicatorEngine()))
+    manager.add_strategy(reversion(indicator_engine=StreamingIndicatorEngine()))
+    return manager
+
+
+def _summary(batch):
+    return {symbol: [(s.signal_type, round(s.confidence, 9)) for s in signals]
+            for symbol, signals in batch.signals.items()}
+
+
+def test_batch_matches_per_symbol_evaluation():
+    contexts = _contexts(20)
+    manager = _manager(max_workers=1)
+    batch = manager.generate_signals_batch(contexts)
+
+    assert list(batch.signals) == [c.symbol for c in contexts]
+    assert set(batch.strategy_timings) == {"SimpleMomentum", "MeanReversion"}
+    for context in contexts:
+        expected = manager.generate_signals(context)
+        assert [s.signal_type for s in batch.signals[context.symbol]] == [s.signal_type for s in expected]
+    assert any(batch.signals.values())
+
+
+def test_process_pool_is_deterministic_and_matches_serial():
+    contexts = _contexts(12)
+    serial = _manager(scalar=True, max_workers=1).generate_signals_batch(contexts)
+
+    manager = _manager(scalar=True, max_workers=2, process_threshold=4)
+    try:
+        pooled = manager.generate_signals_batch(contexts)
+        assert manager._pool is not None
+    finally:
+        manager.close()
+
+    assert _summary(pooled) == _summary(serial)
+    assert [s.symbol for s in pooled.all_signals()] == [s.symbol for s in serial.all_signals()]
+
+
+class ThresholdStrategy(BaseStrategy):
+    """Custom constructor: buys when the price is above a threshold"""
+
+    def __init__(self, threshold, label="Threshold"):
+        super().__init__(label, {"threshold": threshold})
+
+    @classmethod
+    def from_parameters(cls, parameters):
+        return cls(parameters["threshold"])
+
+    def generate_signal(self, market_context):
+        if market_context.current_price > self.parameters["threshold"]:
+            return TradingSignal(market_context.symbol, SignalType.BUY, 1.0)
+        return None
+
+    def validate_signal(self, signal, market_context):
+        return True
+
+
+class NoRebuildStrategy(ThresholdStrategy):
+    """Custom constructor without a from_parameters override"""
+
+    from_parameters = BaseStrategy.__dict__["from_parameters"]
+
+
+def _threshold_batch(strategy, contexts):
+    manager = StrategyManager(max_workers=2, process_threshold=4)
+    manager.add_strategy(strategy)
+    try:
+        return manager, manager.generate_signals_batch(contexts), manager.generate_signals_batch(contexts)
+    finally:
+        manager.close()
+
+
+def test_pool_rebuilds_custom_constructor_with_from_parameters():
+    contexts = _contexts(12)
+    threshold = float(np.median([c.current_price for c in contexts]))
+    manager, first, _ = _threshold_batch(ThresholdStrategy(threshold), contexts)
+
+    expected = [c.symbol for c in contexts if c.current_price > threshold]
+    assert [s.symbol for s in first.all_signals()] == expected
+    assert not manager._in_process_classes
+
+
+def test_strategy_that_cannot_be_rebuilt_runs_in_process():
+    contexts = _contexts(12)
+    threshold = float(np.median([c.current_price for c in contexts]))
+    manager, first, second = _threshold_batch(NoRebuildStrategy(threshold), contexts)
+
+    expected = [c.symbol for c in contexts if c.current_price > threshold]
+    assert [s.symbol for s in first.all_signals()] == expected
+    assert [s.symbol for s in second.all_signals()] == expected
+    assert manager._in_process_classes == {NoRebuildStrategy}
+
+
+class _VectorizedStub(BaseStrategy):
+    vectorized = True
+
+    def __init__(self):
+        super().__init__("Stub")
+        self.batches = []
+
+    def generate_signal(self, market_context):
+        raise AssertionError("batch path expected")
+
+    def generate_signals_batch(self, contexts):
+        self.batches.append(len(contexts))
+        return [TradingSignal(c.symbol, SignalType.BUY, 1.0) if i % 2 else None
+                for i, c in enumerate(contexts)]
+
+    def validate_signal(self, signal, market_context):
+        return True
+
+
+def test_vectorized_strategy_runs_in_process_on_whole_batch():
+    stub = _VectorizedStub()
+    manager = StrategyManager(max_workers=4, process_threshold=1)
+    manager.add_strategy(stub)
+
+    batch = manager.generate_signals_batch(_contexts(6))
+
+    assert stub.batches == [6]
+    assert manager._pool is None
+    assert [len(signals) for signals in batch.signals.values()] == [0, 1, 0, 1, 0, 1]
+
+
+def test_vectorized_flag_without_hooks_falls_back_to_generate_signal():
+    class FlaggedThreshold(ThresholdStrategy):
+        vectorized = True
+
+    contexts = _contexts(6)
+    threshold = float(np.median([c.current_price for c in contexts]))
+    results = FlaggedThreshold(threshold).generate_signals_batch(contexts)
+
+    assert [bool(signal) for signal in results] == [c.current_price > threshold for c in contexts]
+
+
+def test_vectorized_strategies_match_scalar_path():
+    contexts = _contexts(40)
+    contexts[3].volume = 10  # below min_volume
+    contexts[5].price_history = contexts[5].price_history[:8]  # insufficient history
+
+    vectorized = _manager(max_workers=1).generate_signals_batch(contexts)
+    scalar = _manager(scalar=True, max_workers=1).generate_signals_batch(contexts)
+
+    assert _summary(vectorized) == _summary(scalar)
+    assert not vectorized.signals[contexts[3].symbol] and not vectorized.signals[contexts[5].symbol]
+    for fast, slow in zip(vectorized.all_signals(), scalar.all_signals()):
+        assert fast.reason == slow.reason
+        assert fast.stop_loss == pytest.approx(slow.stop_loss)
+        assert fast.take_profit == pytest.approx(slow.take_profit)
+
+
+def test_reasons_are_built_only_for_emitting_rows():
+    strategy = SimpleMomentumStrategy(indicator_engine=StreamingIndicatorEngine())
+    contexts = _contexts(10)
+    universe = UniverseArrays.from_contexts(contexts, strategy.history_window())
+    output = strategy.evaluate_universe(universe)
+
+    built = []
+    reason = output.reason
+    output.reason = lambda row: built.append(row) or reason(row)
+    strategy.evaluate_universe = lambda _universe: output
+
+    results = strategy.generate_signals_batch(contexts)
+    assert built == output.emitted.tolist()
+    assert [i for i, signal in enumerate(results) if signal] == built
+
+
+def test_signal_reason_renders_lazily_once():
+    class Value:
+        renders = 0
+
+        def __format__(self, spec):
+            Value.renders += 1
+            return format(0.0123, spec)
+
+    reason = SignalReason(SimpleMomentumStrategy.STRONG_UP, Value()).add(SimpleMomentumStrategy.ABOVE_SLOW)
+    assert len(reason) == 2 and Value.renders == 0
+    assert str(reason) == "Strong upward momentum: 1.23%; Price above slow MA"
+    assert reason == "Strong upward momentum: 1.23%; Price above slow MA"
+    str(reason)
+    assert Value.renders == 1
+
+
+def test_logger_is_cached_per_instance():
+    strategy = SimpleMomentumStrategy(indicator_engine=StreamingIndicatorEngine())
+    assert strategy.logger is strategy.logger
+    assert strategy.logger.name == "CryptoFuturesBot.SimpleMomentumStrategy"
@@ -0,0 +1,115 @@
+"""Tests for strategies/streaming_indicators.py."""
+
+import numpy as np
+import pytest
+
+from services.market_buffer import PriceRingBuffer
+from strategies.streaming_indicators import StreamingIndicatorEngine, RollingStats
+from strategies.simple_momentum import SimpleMomentumStrategy
+from strategies.mean_reversion import MeanReversionStrategy
+
+
+def _prices(n=300, seed=7):
+    rng = np.random.default_rng(seed)
+    return 100 + np.cumsum(rng.normal(0, 1, n))
+
+
+def test_rolling_stats_match_numpy():
+    prices = _prices()
+    engine = StreamingIndicatorEngine()
+    engine.register_periods(10, 30)
+    buffer = PriceRingBuffer(capacity=64)
+
+    for price in prices:
+        buffer.append(price)
+        view, seq = buffer.snapshot()
+        state = engine.sync("BTCUSDT", view, seq)
+
+    assert state.mean(10) == pytest.approx(np.mean(prices[-10:]))
+    assert state.mean(30) == pytest.approx(np.mean(prices[-30:]))
+    assert state.std(30) == pytest.approx(np.std(prices[-30:]))
+    assert state.price_back(10) == prices[-10]
+
+
+def test_rolling_stats_remove_to_empty():
+    stats = RollingStats(3)
+    stats.add(1.0)
+    stats.remove(1.0)
+    assert stats.count == 0
+    assert stats.variance == 0.0
+
+
+def test_sync_without_sequence_rebuilds_from_history():
+    prices = _prices(50)
+    engine = StreamingIndicatorEngine()
+    engine.register_periods(20)
+
+    engine.sync("ETHUSDT", list(prices[:40]))
+    state = engine.sync("ETHUSDT", list(prices))
+    assert state.mean(20) == pytest.approx(np.mean(prices[-20:]))
+
+
+def _reference_momentum(prices, fast=10, slow=30):
+    fast_ma = np.mean(prices[-fast:])
+    slow_ma = np.mean(prices[-slow:])
+    k = min(fast, len(prices) - 1)
+    return {
+        'fast_ma': fast_ma,
+        'slow_ma': slow_ma,
+        'momentum': (prices[-1] - prices[-k]) / prices[-k],
+        'volatility': np.std(prices[-fast:]) / np.mean(prices[-fast:]),
+    }
+
+
+def test_momentum_indicators_match_batch_calculation():
+    prices = _prices()
+    engine = StreamingIndicatorEngine()
+    strategy = SimpleMomentumStrategy(indicator_engine=engine)
+    buffer = PriceRingBuffer(capacity=128)
+
+    for price in prices:
+        buffer.append(price)
+        view, seq = buffer.snapshot()
+        if len(view) >= 30:
+            indicators = strategy._calculate_indicators(view, "BTCUSDT", seq)
+
+    expected = _reference_momentum(prices[-128:])
+    for key, value in expected.items():
+        assert indicators[key] == pytest.approx(value)
+
+
+def test_mean_reversion_indicators_match_batch_calculation():
+    prices = _prices(120, seed=3)
+    engine = StreamingIndicatorEngine()
+    strategy = MeanReversionStrategy(indicator_engine=engine)
+    buffer = PriceRingBuffer(capacity=64)
+
+    for price in prices:
+        buffer.append(price)
+        view, seq = buffer.snapshot()
+        if len(view) >= 20:
+            indicators = strategy._calculate_indicators(view, "BTCUSDT", seq)
+
+    recent = prices[-20:]
+    mean, std = np.mean(recent), np.std(recent)
+    assert indicators['mean_price'] == pytest.approx(mean)
+    assert indicators['std_dev'] == pytest.approx(std)
+    assert indicators['z_score'] == pytest.approx((prices[-1] - mean) / std)
+    assert indicators['momentum'] == pytest.approx((prices[-1] - prices[-10]) / prices[-10])
+
+
+def test_strategies_share_engine_state():
+    engine = StreamingIndicatorEngine()
+    momentum = SimpleMomentumStrategy(indicator_engine=engine)
+    reversion = MeanReversionStrategy(indicator_engine=engine)
+    buffer = PriceRingBuffer(capacity=64)
+    for price in _prices(40):
+        buffer.append(price)
+
+    view, seq = buffer.snapshot()
+    momentum._calculate_indicators(view, "BTCUSDT", seq)
+    state = engine.get_state("BTCUSDT")
+    reversion._calculate_indicators(view, "BTCUSDT", seq)
+
+    assert engine.get_state("BTCUSDT") is state
+    assert set(state.periods) == {10, 20, 30}
@@ -0,0 +1,33 @@
+"""Tests for per-symbol exclusion between periodic and bar-close cycles."""
+
+import asyncio
+
+from enhanced_main import CryptoFuturesBot
+
+
+def test_bar_close_cycle_skips_symbol_evaluated_by_periodic_cycle(monkeypatch):
+    bot = CryptoFuturesBot()
+    symbol = bot.config.trading_config.active_symbols()[0]
+    prepared = []
+
+    async def slow_prepare(sym, market_data=None):
+        prepared.append(sym)
+        await asyncio.sleep(0.05)
+        return None
+
+    monkeypatch.setattr(bot, "_prepare_symbol", slow_prepare)
+
+    async def run():
+        periodic = asyncio.create_task(bot.run_single_cycle())
+        await asyncio.sleep(0)
+        bar_close = await bot._run_symbol_cycle(symbol)
+        await periodic
+        return bar_close
+
+    assert asyncio.run(run()) is False
+    assert prepared.count(symbol) == 1
+    assert not bot._in_flight
+
+    assert asyncio.run(bot._run_symbol_cycle(symbol)) is False
+    assert prepared.count(symbol) == 2
+    assert not bot._in_flight
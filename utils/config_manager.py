@@ -5,11 +5,11 @@ Handles environment configuration and validation
 
 import os
 import json
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
-from utils.logging_setup import get_logger
+from utils.logging_setup import OVERFLOW_POLICIES, get_logger
 
 logger = get_logger("ConfigManager")
 
@@ -24,6 +24,12 @@ class TradingConfig:
     take_profit_pct: float = 0.04
     max_position_size: float = 1000.0
     dry_run: bool = True
+    symbols: List[str] = field(default_factory=list)
+    bar_interval: str = ""  # evaluate strategies on bar close of this interval (e.g. "1m"); empty disables
+
+    def active_symbols(self) -> List[str]:
+        """Symbols traded each cycle; falls back to default_symbol"""
+        return self.symbols or [self.default_symbol]
 
 
 @dataclass
@@ -46,6 +52,9 @@ class SystemConfig:
     enable_telegram_alerts: bool = True
     enable_logging: bool = True
     database_url: str = "sqlite:///cryptobot.db"
+    async_logging: bool = False  # write logs from a background QueueListener thread
+    log_queue_size: int = 10000
+    log_queue_overflow: str = "drop_oldest"  # drop_oldest, drop_newest or block
 
 
 class ConfigManager:
@@ -89,6 +98,10 @@ class ConfigManager:
             self.trading_config.take_profit_pct = float(os.getenv("TAKE_PROFIT_PERCENTAGE", "0.04"))
             self.trading_config.max_position_size = float(os.getenv("MAX_POSITION_SIZE", "1000.0"))
             self.trading_config.dry_run = os.getenv("DRY_RUN", "true").lower() == "true"
+            self.trading_config.bar_interval = os.getenv("BAR_INTERVAL", "")
+            self.trading_config.symbols = [
+                s.strip() for s in os.getenv("TRADING_SYMBOLS", "").split(",") if s.strip()
+            ]
             
             # System Configuration
             self.system_config.log_level = os.getenv("LOG_LEVEL", "INFO")
@@ -97,6 +110,9 @@ class ConfigManager:
             self.system_config.enable_telegram_alerts = os.getenv("ENABLE_TELEGRAM_ALERTS", "true").lower() == "true"
             self.system_config.enable_logging = os.getenv("ENABLE_LOGGING", "true").lower() == "true"
             self.system_config.database_url = os.getenv("DATABASE_URL", "sqlite:///cryptobot.db")
+            self.system_config.async_logging = os.getenv("ASYNC_LOGGING", "false").lower() == "true"
+            self.system_config.log_queue_size = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+            self.system_config.log_queue_overflow = os.getenv("LOG_QUEUE_OVERFLOW", "drop_oldest")
             
             logger.info("Configuration loaded from environment variables")
             
@@ -146,7 +162,9 @@ class ConfigManager:
                     'stop_loss_pct': self.trading_config.stop_loss_pct,
                     'take_profit_pct': self.trading_config.take_profit_pct,
                     'max_position_size': self.trading_config.max_position_size,
-                    'dry_run': self.trading_config.dry_run
+                    'dry_run': self.trading_config.dry_run,
+                    'symbols': self.trading_config.symbols,
+                    'bar_interval': self.trading_config.bar_interval
                 },
                 'system': {
                     'log_level': self.system_config.log_level,
@@ -154,7 +172,10 @@ class ConfigManager:
                     'timezone': self.system_config.timezone,
                     'enable_telegram_alerts': self.system_config.enable_telegram_alerts,
                     'enable_logging': self.system_config.enable_logging,
-                    'database_url': self.system_config.database_url
+                    'database_url': self.system_config.database_url,
+                    'async_logging': self.system_config.async_logging,
+                    'log_queue_size': self.system_config.log_queue_size,
+                    'log_queue_overflow': self.system_config.log_queue_overflow
                 }
                 # Note: API config not saved for security reasons
             }
@@ -211,6 +232,16 @@ class ConfigManager:
         if self.system_config.log_level not in valid_log_levels:
             validation['warnings'].append(f"Invalid log level: {self.system_config.log_level}")
         
+        if self.system_config.async_logging:
+            if self.system_config.log_queue_overflow not in OVERFLOW_POLICIES:
+                validation['errors'].append(
+                    f"Invalid log queue overflow policy: {self.system_config.log_queue_overflow}"
+                )
+                validation['valid'] = False
+            if self.system_config.log_queue_size <= 0:
+                validation['errors'].append("Log queue size must be positive")
+                validation['valid'] = False
+        
         return validation
     
     def get_config_summary(self) -> Dict[str, Any]:
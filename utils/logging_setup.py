@@ -3,11 +3,15 @@ Logging setup for CryptoFuturesBot
 Provides centralized logging configuration
 """
 
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, List, Optional
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
 
 
 def setup_logger(
@@ -74,6 +78,11 @@ def get_logger(name: str = "CryptoFuturesBot") -> logging.Logger:
     """
     Get existing logger or create new one with default configuration
     
+    Child loggers of an already configured logger (e.g.
+    ``CryptoFuturesBot.PortfolioManager``) get no handlers of their own: they
+    inherit the parent's level and propagate to its console and rotating file
+    handlers, so every class shares one log file.
+    
     Args:
         name: Logger name
         
@@ -81,9 +90,162 @@ def get_logger(name: str = "CryptoFuturesBot") -> logging.Logger:
         Logger instance
     """
     logger = logging.getLogger(name)
-    if not logger.handlers:
-        return setup_logger(name)
-    return logger
+    if logger.handlers:
+        return logger
+    
+    parent = logger.parent
+    while parent is not None and parent is not logging.root:
+        if parent.handlers:
+            return logger
+        parent = parent.parent
+    return setup_logger(name)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler over a bounded queue with an explicit overflow policy
+    
+    Only the message is rendered in the calling thread (so mutable arguments
+    are captured); formatting and handler I/O happen on the listener thread.
+    When the queue is full, records are dropped according to the policy and
+    counted. Only the "block" policy waits up to block_timeout for space.
+    """
+    
+    def __init__(self, log_queue: queue.Queue, overflow: str = "drop_oldest",
+                 block_timeout: float = 1.0):
+        """
+        Initialize queue handler
+        
+        Args:
+            log_queue: Bounded queue shared with the QueueListener
+            overflow: "drop_oldest", "drop_newest" or "block"
+            block_timeout: Seconds to wait for space when blocking
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown log queue overflow policy: {overflow}")
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        
+        if self.overflow == "block":
+            try:
+                self.queue.put(record, timeout=self.block_timeout)
+            except queue.Full:
+                self.dropped += 1
+        elif self.overflow == "drop_oldest":
+            while True:
+                try:
+                    self.queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+                try:
+                    self.queue.put_nowait(record)
+                    return
+                except queue.Full:
+                    continue
+        else:
+            self.dropped += 1
+
+
+class _DrainingQueueListener(QueueListener):
+    """QueueListener whose stop() waits for space instead of failing on a full queue"""
+    
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+# logger name -> (listener, queue handler, handlers moved behind the queue)
+_async_loggers: Dict[str, tuple] = {}
+
+
+def enable_async_logging(name: str = "CryptoFuturesBot", queue_size: int = 10000,
+                         overflow: str = "drop_oldest") -> BoundedQueueHandler:
+    """
+    Move a logger's handlers behind a QueueHandler/QueueListener pair
+    
+    Console and rotating file writes then run on the listener's background
+    thread. Child loggers propagate into the queue as well. Calling it again
+    for the same logger returns the existing handler.
+    
+    Args:
+        name: Logger whose handlers are moved
+        queue_size: Maximum records buffered before the overflow policy applies
+        overflow: "drop_oldest", "drop_newest" or "block"
+        
+    Returns:
+        The installed BoundedQueueHandler
+    """
+    if name in _async_loggers:
+        return _async_loggers[name][1]
+    
+    logger = get_logger(name)
+    handlers: List[logging.Handler] = list(logger.handlers)
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    queue_handler = BoundedQueueHandler(log_queue, overflow=overflow)
+    listener = _DrainingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(queue_handler)
+    listener.start()
+    
+    if not _async_loggers:
+        # Safety net for exits that bypass the explicit flush
+        atexit.register(flush_logging)
+    _async_loggers[name] = (listener, queue_handler, handlers)
+    return queue_handler
+
+
+def flush_logging(name: Optional[str] = None) -> None:
+    """
+    Drain queued records and restore synchronous handlers
+    
+    Call on shutdown so buffered records reach the console and log file.
+    Safe to call when async logging is not enabled.
+    
+    Args:
+        name: Logger to flush (all async loggers if None)
+    """
+    names = list(_async_loggers) if name is None else [name]
+    for logger_name in names:
+        entry = _async_loggers.pop(logger_name, None)
+        if entry is None:
+            continue
+        listener, queue_handler, handlers = entry
+        
+        logger = logging.getLogger(logger_name)
+        logger.removeHandler(queue_handler)
+        listener.stop()
+        for handler in handlers:
+            logger.addHandler(handler)
+            handler.flush()
+
+
+def get_async_logging_stats() -> Dict[str, Dict[str, Any]]:
+    """Queue depth and drop counts per async logger"""
+    return {
+        name: {
+            'queued': queue_handler.queue.qsize(),
+            'capacity': queue_handler.queue.maxsize,
+            'dropped': queue_handler.dropped,
+            'overflow': queue_handler.overflow,
+        }
+        for name, (_, queue_handler, _) in _async_loggers.items()
+    }
 
 
 # Default logger for the application
@@ -95,9 +257,14 @@ class LoggerMixin:
     
     @property
     def logger(self) -> logging.Logger:
-        """Get logger for this class"""
-        class_name = self.__class__.__name__
-        return get_logger(f"CryptoFuturesBot.{class_name}")
+        """Get logger for this class (resolved once per class, cached on the class)"""
+        cls = type(self)
+        # Look in the class's own namespace so subclasses don't reuse a base class logger
+        logger = cls.__dict__.get('_class_logger')
+        if logger is None:
+            logger = get_logger(f"CryptoFuturesBot.{cls.__name__}")
+            cls._class_logger = logger
+        return logger
 
 
 def log_function_call(func):